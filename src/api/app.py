@@ -0,0 +1,228 @@
+import os
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import pandas as pd
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_cache import load_cached_object
+from src.model.native_models import predict_batch
+from src.model.model_registry import ModelRegistry, REGISTRY_ROOT
+from src.data_transformation.compiled_preprocessor import CompiledPreprocessor, compile_preprocessor
+from src.api.batching import MicroBatcher
+from src.api.routes import router
+
+
+@dataclass
+class ServingConfig:
+    preprocessor_file_path: str = os.path.join('artifacts', 'preprocessor.pkl')
+    model_file_paths: dict = field(default_factory=lambda: {
+        "best": os.path.join('artifacts', 'best_model.pkl'),
+        "tuned": os.path.join('artifacts', 'tuned_model.pkl'),
+    })
+    host: str = os.environ.get("MLPROJECT_API_HOST", "127.0.0.1")
+    port: int = int(os.environ.get("MLPROJECT_API_PORT", 8000))
+    # Coalesce single-record /predict calls into vectorized batches
+    enable_batching: bool = os.environ.get("MLPROJECT_API_BATCHING", "1") == "1"
+    batch_max_size: int = int(os.environ.get("MLPROJECT_API_BATCH_MAX_SIZE", 64))
+    batch_max_wait_ms: float = float(os.environ.get("MLPROJECT_API_BATCH_MAX_WAIT_MS", 5))
+    # Models registered under these names are served from the registry's current version
+    registry_root: str = REGISTRY_ROOT
+    # How often to check the registry for a new current version (0 disables hot swapping)
+    registry_poll_seconds: float = float(os.environ.get("MLPROJECT_REGISTRY_POLL_SECONDS", 5))
+
+
+@dataclass(frozen=True)
+class ServedModel:
+    """A model and the preprocessor it was trained with, swapped in and out as one unit."""
+    model: object
+    preprocessor: object
+    version: str = None
+    model_path: str = None
+
+
+class ModelService:
+    """
+    Holds the served models in memory for the lifetime of the server.
+
+    Each model comes from the current version in the model registry, or from
+    config.model_file_paths when nothing is registered under its name. refresh() loads a
+    newly promoted version on a worker thread while requests keep using the old one, then
+    replaces it with a single assignment; a request reads its ServedModel once, so it never
+    mixes the model of one version with the preprocessor of another.
+    """
+    def __init__(self, config: ServingConfig):
+        self.config = config
+        self.registry = ModelRegistry(config.registry_root)
+        self.models = {}
+        self.batchers = {}
+        self._watcher = None
+        # The watcher and /models/refresh never load the same version twice
+        self._refresh_lock = asyncio.Lock()
+
+    @staticmethod
+    def _load_preprocessor(file_path):
+        preprocessor = load_cached_object(file_path)
+        try:
+            # Same output as preprocessor.transform without the per-call sklearn overhead
+            return compile_preprocessor(preprocessor)
+        except ValueError as e:
+            logger.warning(f"Preprocessor could not be compiled ({e}); using it as is.")
+            return preprocessor
+
+    def _load_served_model(self, name):
+        """Loads the current registry version of name (or its configured file); None if there is neither."""
+        resolved = self.registry.resolve(name)
+        if resolved is not None:
+            version, model_path, preprocessor_path = resolved
+        else:
+            version, model_path = None, self.config.model_file_paths[name]
+            preprocessor_path = self.config.preprocessor_file_path
+            if not os.path.exists(model_path):
+                logger.warning(f"Model file for '{name}' not found at {model_path}; skipping.")
+                return None
+        served = ServedModel(load_cached_object(model_path), self._load_preprocessor(preprocessor_path),
+                             version, model_path)
+        logger.info(f"Serving model '{name}' ({version or 'unversioned'}) loaded from {model_path}")
+        return served
+
+    def load(self):
+        try:
+            for name in self.config.model_file_paths:
+                served = self._load_served_model(name)
+                if served is not None:
+                    self.models[name] = served
+            if not self.models:
+                raise FileNotFoundError("No model artifacts found to serve.")
+        except Exception as e:
+            raise CustomException(f"Error loading serving artifacts: {e}", sys)
+
+    async def refresh(self):
+        """Preloads and swaps in every model whose registry CURRENT pointer has moved; returns the swapped names."""
+        swapped = []
+        async with self._refresh_lock:
+            for name in self.config.model_file_paths:
+                current = self.registry.current_version(name)
+                served = self.models.get(name)
+                if current is None or (served is not None and served.version == current):
+                    continue
+                try:
+                    new_served = await run_in_threadpool(self._load_served_model, name)
+                except Exception as e:
+                    logger.error(f"Could not load model '{name}' {current}; still serving the previous version: {e}")
+                    continue
+                self.models[name] = new_served
+                swapped.append(name)
+                logger.info(f"Swapped model '{name}' from {served.version if served else None} to {new_served.version}")
+            if swapped:
+                await self.start_batchers()
+        return swapped
+
+    async def _watch_registry(self):
+        while True:
+            await asyncio.sleep(self.config.registry_poll_seconds)
+            await self.refresh()
+
+    def start_watcher(self):
+        if self.config.registry_poll_seconds > 0:
+            self._watcher = asyncio.create_task(self._watch_registry())
+
+    async def stop_watcher(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    async def start_batchers(self):
+        if not self.config.enable_batching:
+            return
+        for name in self.models:
+            if name in self.batchers:
+                continue
+            batcher = MicroBatcher(
+                lambda records, name=name: self.predict(records, name),
+                max_batch_size=self.config.batch_max_size,
+                max_wait_ms=self.config.batch_max_wait_ms,
+                name=name
+            )
+            await batcher.start()
+            self.batchers[name] = batcher
+
+    async def stop_batchers(self):
+        for batcher in self.batchers.values():
+            await batcher.stop()
+        self.batchers = {}
+
+    def available_models(self):
+        return sorted(self.models)
+
+    def model_versions(self):
+        return {name: served.version for name, served in sorted(self.models.items())}
+
+    def predict(self, records, model_name="best"):
+        """Score a list of student records (dicts) with the named model."""
+        served = self.models[model_name]
+        try:
+            if not isinstance(served.preprocessor, CompiledPreprocessor):
+                records = pd.DataFrame.from_records(records)
+            transformed_data = served.preprocessor.transform(records)
+            return predict_batch(served.model, transformed_data)
+        except Exception as e:
+            raise CustomException(f"Error during prediction: {e}", sys)
+
+    async def predict_one(self, record, model_name="best"):
+        """Score a single record, going through the micro-batcher when batching is enabled."""
+        if model_name not in self.models:
+            raise KeyError(model_name)
+        if model_name in self.batchers:
+            return await self.batchers[model_name].submit(record)
+        return (await run_in_threadpool(self.predict, [record], model_name))[0]
+
+    def batching_metrics(self):
+        return {name: batcher.metrics.summary() for name, batcher in self.batchers.items()}
+
+
+def create_app(config: ServingConfig = None):
+    config = config or ServingConfig()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        service = ModelService(config)
+        service.load()
+        await service.start_batchers()
+        service.start_watcher()
+        app.state.model_service = service
+        logger.info("Prediction service started.")
+        yield
+        await service.stop_watcher()
+        await service.stop_batchers()
+        logger.info("Prediction service stopped.")
+
+    app = FastAPI(title="Student Performance Prediction API", lifespan=lifespan)
+    app.include_router(router)
+    return app
+
+
+app = create_app()
+
+
+def run(host=None, port=None):
+    """Serve the prediction API with uvicorn."""
+    import uvicorn
+
+    config = ServingConfig()
+    uvicorn.run(app, host=host or config.host, port=port or config.port)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,131 @@
+import time
+import asyncio
+from collections import Counter, deque
+import numpy as np
+from src.log_config.logger import logger
+
+
+class BatchingMetrics:
+    """Running statistics on batch sizes and per-record queueing delay."""
+    def __init__(self, window=10000):
+        self.batches = 0
+        self.records = 0
+        self.batch_size_histogram = Counter()
+        self.queue_delays = deque(maxlen=window)
+        self.batch_latencies = deque(maxlen=window)
+
+    def record_batch(self, batch_size, queue_delays, batch_latency):
+        self.batches += 1
+        self.records += batch_size
+        self.batch_size_histogram[batch_size] += 1
+        self.queue_delays.extend(queue_delays)
+        self.batch_latencies.append(batch_latency)
+
+    def summary(self):
+        def percentiles(values):
+            if not values:
+                return {"p50_ms": None, "p99_ms": None}
+            values = np.asarray(values) * 1000
+            return {"p50_ms": float(np.percentile(values, 50)), "p99_ms": float(np.percentile(values, 99))}
+
+        return {
+            "batches": self.batches,
+            "records": self.records,
+            "mean_batch_size": self.records / self.batches if self.batches else 0.0,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "queue_delay": percentiles(self.queue_delays),
+            "batch_latency": percentiles(self.batch_latencies),
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces single-record prediction requests into vectorized batches.
+
+    Records are queued until either max_batch_size records are waiting or max_wait_ms has
+    elapsed since the first one arrived; the batch is then scored with one call to
+    predict_fn (run in a worker thread) and each caller receives its own prediction.
+    Requests still queued or in flight when the batcher stops fail with RuntimeError.
+    """
+    def __init__(self, predict_fn, max_batch_size=64, max_wait_ms=5.0, name="default"):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+        self.metrics = BatchingMetrics()
+        self._queue = None
+        self._worker = None
+        self._batch = []
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(f"Micro-batcher '{self.name}' started (max_batch_size={self.max_batch_size}, "
+                    f"max_wait_ms={self.max_wait * 1000})")
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._queue is not None:
+            # Fail the batch the worker had taken and everything still queued, so no caller waits forever
+            pending = self._batch
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Micro-batcher '{self.name}' stopped"))
+            if pending:
+                logger.info(f"Micro-batcher '{self.name}' stopped with {len(pending)} pending requests")
+            self._queue, self._batch = None, []
+
+    async def submit(self, record):
+        """Queue one record and wait for its prediction."""
+        if self._queue is None:
+            raise RuntimeError(f"Micro-batcher '{self.name}' is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        # The batch is kept on the instance so stop() can fail records taken off the queue
+        self._batch = batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            records = [record for record, _, _ in batch]
+            dispatched_at = time.perf_counter()
+            try:
+                predictions = await loop.run_in_executor(None, self.predict_fn, records)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._batch = []
+                continue
+
+            for (_, future, _), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
+            self._batch = []
+            self.metrics.record_batch(
+                len(batch),
+                [dispatched_at - enqueued_at for _, _, enqueued_at in batch],
+                time.perf_counter() - dispatched_at
+            )
@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+
+FEATURE_COLUMNS = ["gender", "race_ethnicity", "parental_level_of_education", "lunch",
+                   "test_preparation_course", "reading_score", "writing_score"]
+
+
+def load_sample_records(data_path, limit=None):
+    """Read student records (without the target) to replay against the API."""
+    data = pd.read_csv(data_path).dropna(subset=FEATURE_COLUMNS)
+    records = data[FEATURE_COLUMNS].to_dict(orient="records")
+    return records[:limit] if limit else records
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode(),
+                                     headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def run_load_test(base_url, records, total_requests=1000, concurrency=8, batch_size=1):
+    """
+    Fire total_requests POSTs at the API from `concurrency` threads and report latency percentiles.
+    batch_size == 1 hits /predict, anything larger hits /predict/batch.
+    """
+    if batch_size == 1:
+        url = f"{base_url}/predict"
+        payloads = [records[i % len(records)] for i in range(total_requests)]
+    else:
+        url = f"{base_url}/predict/batch"
+        payloads = [{"records": [records[(i * batch_size + j) % len(records)] for j in range(batch_size)]}
+                    for i in range(total_requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.array(list(executor.map(lambda payload: _post(url, payload), payloads)))
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "endpoint": url,
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "batch_size": batch_size,
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p99_ms": float(np.percentile(latencies, 99) * 1000),
+        "mean_ms": float(latencies.mean() * 1000),
+        "requests_per_sec": total_requests / elapsed,
+        "records_per_sec": total_requests * batch_size / elapsed,
+    }
+    logger.info(f"Load test results: {report}")
+    return report
+
+
+def start_local_server(host="127.0.0.1", port=8765):
+    """Start the API in a background thread and wait until it is accepting requests."""
+    import uvicorn
+    from src.api.app import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local load test for the prediction API.")
+    parser.add_argument("--url", help="Base URL of a running server; a local one is started if omitted.")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--data", default=os.path.join("data", "cleaned", "cleaned_students.csv"))
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server, thread = start_local_server()
+        base_url = f"http://{server.config.host}:{server.config.port}"
+
+    try:
+        results = run_load_test(base_url, load_sample_records(args.data), args.requests,
+                                args.concurrency, args.batch_size)
+        with urllib.request.urlopen(f"{base_url}/metrics") as response:
+            results["batching"] = json.loads(response.read())
+        print(json.dumps(results, indent=2))
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join()
@@ -0,0 +1,79 @@
+from typing import List, Literal
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+
+class StudentRecord(BaseModel):
+    """Input schema for one student, matching DataTransformation.get_data_transformer_object."""
+    gender: str
+    race_ethnicity: str
+    parental_level_of_education: str
+    lunch: str
+    test_preparation_course: str
+    reading_score: float = Field(ge=0, le=100)
+    writing_score: float = Field(ge=0, le=100)
+
+
+class BatchPredictionRequest(BaseModel):
+    records: List[StudentRecord] = Field(min_length=1)
+
+
+class PredictionResponse(BaseModel):
+    model: str
+    math_score: float
+
+
+class BatchPredictionResponse(BaseModel):
+    model: str
+    math_scores: List[float]
+
+
+ModelName = Literal["best", "tuned"]
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health(request: Request):
+    service = request.app.state.model_service
+    return {"status": "ok", "models": service.available_models(), "versions": service.model_versions()}
+
+
+@router.post("/models/refresh")
+async def refresh_models(request: Request):
+    """Swap in any model whose registry version was promoted since the last check."""
+    swapped = await request.app.state.model_service.refresh()
+    return {"swapped": swapped, "versions": request.app.state.model_service.model_versions()}
+
+
+@router.get("/metrics")
+def metrics(request: Request):
+    """Batch size and queueing delay statistics for the micro-batchers."""
+    return request.app.state.model_service.batching_metrics()
+
+
+@router.post("/predict", response_model=PredictionResponse)
+async def predict(record: StudentRecord, request: Request, model: ModelName = "best"):
+    service = request.app.state.model_service
+    try:
+        prediction = await service.predict_one(record.model_dump(), model)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model '{model}' is not loaded.")
+    except CustomException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return PredictionResponse(model=model, math_score=float(prediction))
+
+
+@router.post("/predict/batch", response_model=BatchPredictionResponse)
+def predict_batch(payload: BatchPredictionRequest, request: Request, model: ModelName = "best"):
+    service = request.app.state.model_service
+    try:
+        predictions = service.predict([record.model_dump() for record in payload.records], model)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model '{model}' is not loaded.")
+    except CustomException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    logger.info(f"Batch prediction served for {len(payload.records)} records with the {model} model")
+    return BatchPredictionResponse(model=model, math_scores=[float(p) for p in predictions])
@@ -0,0 +1,297 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+SIZES = {"1k": 1_000, "100k": 100_000, "10M": 10_000_000}
+# Stages too slow to run at every size (all nine candidate models, KNN included); --no-row-limits lifts this
+STAGE_MAX_ROWS = {"evaluate_regression_models": 100_000}
+SINGLE_ROW_CALLS = 100
+TARGET_COLUMN = "math_score"
+RESULTS_PATH = os.path.join("artifacts", "benchmarks", "results.json")
+BASELINE_PATH = os.path.join("artifacts", "benchmarks", "baseline.json")
+# A case regresses when it is this much slower (or uses this much more memory) than the baseline ...
+REGRESSION_TOLERANCE = 0.2
+# ... and the difference is larger than this noise floor
+MIN_WALL_DIFF_SECONDS = 0.05
+MIN_MEMORY_DIFF_MB = 10
+
+
+def _cleaned(n_rows, seed):
+    from src.benchmarks.synthetic_data import generate_students
+    from src.data_ingestion.data_ingestion import clean_data
+
+    return clean_data(generate_students(n_rows, seed=seed))
+
+
+def _split(data, test_fraction=0.2):
+    n_test = max(1, int(len(data) * test_fraction))
+    return data.iloc[n_test:], data.iloc[:n_test]
+
+
+def _transformed(n_rows, seed):
+    """Fitted preprocessor and float32 train/test matrices for n_rows of synthetic data."""
+    from src.data_transformation.data_transformation import DataTransformation
+
+    train, test = _split(_cleaned(n_rows, seed))
+    preprocessor = DataTransformation().get_data_transformer_object()
+    X_train = preprocessor.fit_transform(train.drop(columns=[TARGET_COLUMN]))
+    X_test = preprocessor.transform(test.drop(columns=[TARGET_COLUMN]))
+    return preprocessor, X_train, train[TARGET_COLUMN].to_numpy(), X_test, test[TARGET_COLUMN].to_numpy(), test
+
+
+# Every case is setup(n_rows, seed) -> state, outside the timed region, and run(state) -> rows processed.
+# Cases run with the working directory set to a scratch directory, so artifacts they write go there.
+
+def _setup_clean_data(n_rows, seed):
+    from src.benchmarks.synthetic_data import generate_students
+
+    return generate_students(n_rows, seed=seed)
+
+
+def _run_clean_data(raw):
+    from src.data_ingestion.data_ingestion import clean_data
+
+    clean_data(raw)
+    return len(raw)
+
+
+def _setup_transformation(n_rows, seed):
+    train, test = _split(_cleaned(n_rows, seed))
+    paths = (os.path.join("data", "train.csv"), os.path.join("data", "test.csv"))
+    os.makedirs("data", exist_ok=True)
+    train.to_csv(paths[0], index=False)
+    test.to_csv(paths[1], index=False)
+    return paths, n_rows
+
+
+def _run_transformation(state):
+    from src.data_transformation.data_transformation import DataTransformation
+
+    (train_path, test_path), n_rows = state
+    DataTransformation().initiate_data_transformation(train_path, test_path, evaluate_models=False)
+    return n_rows
+
+
+def _setup_model_data(n_rows, seed):
+    return _transformed(n_rows, seed)[1:5]
+
+
+def _run_evaluate_models(state):
+    from src.model.model_evaluation import evaluate_regression_models
+
+    X_train, y_train, X_test, y_test = state
+    evaluate_regression_models(X_train, y_train, X_test, y_test)
+    return len(y_train) + len(y_test)
+
+
+def _run_tuning(state):
+    from src.hyperparameter_tuning.hyperparameter_tuning import hyperparameter_tuning
+
+    X_train, y_train, _, _ = state
+    hyperparameter_tuning(X_train, y_train, search="grid")
+    return len(y_train)
+
+
+def _setup_prediction(n_rows, seed):
+    from sklearn.linear_model import Ridge
+    from src.utils.common_utils import save_object
+    from src.model.predict import make_predictions
+
+    preprocessor, X_train, y_train, _, _, test = _transformed(n_rows, seed)
+    model_path, preprocessor_path = os.path.join("artifacts", "model.pkl"), os.path.join("artifacts", "preprocessor.pkl")
+    save_object(model_path, Ridge().fit(X_train, y_train))
+    save_object(preprocessor_path, preprocessor)
+    features = test.drop(columns=[TARGET_COLUMN])
+    # Warm the artifact cache so the timed calls measure prediction, not the first load
+    make_predictions(features.iloc[:1], model_path, preprocessor_path)
+    return features, model_path, preprocessor_path
+
+
+def _run_predict_batch(state):
+    from src.model.predict import make_predictions
+
+    features, model_path, preprocessor_path = state
+    make_predictions(features, model_path, preprocessor_path)
+    return len(features)
+
+
+def _setup_predict_single(n_rows, seed):
+    features, model_path, preprocessor_path = _setup_prediction(n_rows, seed)
+    rows = [features.iloc[[i % len(features)]] for i in range(SINGLE_ROW_CALLS)]
+    return rows, model_path, preprocessor_path
+
+
+def _run_predict_single(state):
+    from src.model.predict import make_predictions
+
+    rows, model_path, preprocessor_path = state
+    for row in rows:
+        make_predictions(row, model_path, preprocessor_path)
+    return len(rows)
+
+
+STAGES = {
+    "clean_data": (_setup_clean_data, _run_clean_data),
+    "initiate_data_transformation": (_setup_transformation, _run_transformation),
+    "evaluate_regression_models": (_setup_model_data, _run_evaluate_models),
+    "hyperparameter_tuning": (_setup_model_data, _run_tuning),
+    "make_predictions_batch": (_setup_prediction, _run_predict_batch),
+    "make_predictions_single_row": (_setup_predict_single, _run_predict_single),
+}
+
+
+def _run_case(stage, n_rows, repeats, seed, workdir):
+    """Runs one case in the current (fresh) process and measures it."""
+    from src.utils.resource_usage import PeakRSSMonitor, current_rss_mb
+
+    os.chdir(workdir)
+    setup, run = STAGES[stage]
+    state = setup(n_rows, seed)
+    rss_before = current_rss_mb()
+    walls, cpus = [], []
+    # Only the timed runs are monitored, so the setup's allocations do not count towards the peak
+    with PeakRSSMonitor() as monitor:
+        for _ in range(repeats):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            rows = run(state)
+            walls.append(time.perf_counter() - wall_start)
+            cpus.append(time.process_time() - cpu_start)
+    wall = statistics.median(walls)
+    return {
+        "stage": stage, "size": n_rows, "status": "ok", "rows": rows, "repeats": repeats,
+        "wall_seconds": wall, "wall_seconds_min": min(walls), "cpu_seconds": statistics.median(cpus),
+        "rows_per_sec": rows / wall if wall else None,
+        "peak_rss_mb": monitor.peak_mb, "rss_before_mb": rss_before,
+        "peak_memory_mb": max(0.0, monitor.peak_mb - rss_before),
+    }
+
+
+def run_benchmarks(sizes=tuple(SIZES), stages=tuple(STAGES), repeats=3, seed=42, row_limits=True):
+    """
+    Runs every stage at every size (SIZES names or row counts). Each case runs in its own
+    spawned process, so peak memory is per case and no state leaks between cases, inside a
+    scratch working directory. Wall and CPU times are medians over repeats (CPU time covers
+    the case's process and its threads, not worker processes); peak memory is the peak RSS
+    above the RSS after setup.
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for size in sizes:
+        n_rows = SIZES.get(size) or int(size)
+        for stage in stages:
+            limit = STAGE_MAX_ROWS.get(stage) if row_limits else None
+            if limit is not None and n_rows > limit:
+                logger.info(f"Skipping {stage} at {n_rows} rows (limit {limit}; see --no-row-limits)")
+                results.append({"stage": stage, "size": n_rows, "status": "skipped",
+                                "reason": f"above the {limit}-row limit"})
+                continue
+            logger.info(f"Benchmarking {stage} at {n_rows} rows")
+            with tempfile.TemporaryDirectory() as workdir, \
+                    ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                try:
+                    result = executor.submit(_run_case, stage, n_rows, repeats, seed, workdir).result()
+                except Exception as e:
+                    logger.error(f"{stage} at {n_rows} rows failed: {e}")
+                    result = {"stage": stage, "size": n_rows, "status": "failed", "error": str(e)}
+            results.append(result)
+            logger.info(f"Benchmark result: {result}")
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Marks every result with its change against the baseline case of the same stage and size
+    and returns the regressions: wall time or peak memory up by more than tolerance (and by
+    more than the noise floor).
+    """
+    baseline_cases = {(case["stage"], case["size"]): case for case in baseline.get("results", [])
+                      if case.get("status") == "ok"}
+    regressions = []
+    for result in results:
+        previous = baseline_cases.get((result["stage"], result["size"]))
+        if result.get("status") != "ok" or previous is None:
+            continue
+        checks = (("wall_seconds", MIN_WALL_DIFF_SECONDS), ("peak_memory_mb", MIN_MEMORY_DIFF_MB))
+        result["baseline"] = {metric: previous[metric] for metric, _ in checks}
+        result["regressions"] = [
+            metric for metric, noise_floor in checks
+            if result[metric] > previous[metric] * (1 + tolerance) and result[metric] - previous[metric] > noise_floor
+        ]
+        if result["regressions"]:
+            regressions.append(result)
+    return regressions
+
+
+def save_results(results, file_path, regressions=None):
+    import numpy
+    import sklearn
+
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "cpu_count": os.cpu_count(), "numpy": numpy.__version__, "sklearn": sklearn.__version__},
+        "results": results,
+        "regressions": [{"stage": r["stage"], "size": r["size"], "metrics": r["regressions"]}
+                        for r in regressions or []],
+    }
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, file_path)
+    logger.info(f"Benchmark results saved to {file_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages and inference paths on synthetic data.")
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES),
+                        help=f"Named sizes ({', '.join(SIZES)}) or row counts.")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-row-limits", action="store_true", help="Also run stages above their row limit.")
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Also store these results as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on any regression.")
+    args = parser.parse_args()
+
+    try:
+        results = run_benchmarks(args.sizes, args.stages, repeats=args.repeats, seed=args.seed,
+                                 row_limits=not args.no_row_limits)
+        regressions = []
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                regressions = compare_to_baseline(results, json.load(f), tolerance=args.tolerance)
+        else:
+            logger.info(f"No baseline at {args.baseline}; run with --save-baseline to store one.")
+        save_results(results, args.output, regressions)
+        if args.save_baseline:
+            save_results(results, args.baseline)
+    except Exception as e:
+        raise CustomException(f"Error running benchmarks: {e}", sys)
+
+    for result in results:
+        if result["status"] == "ok":
+            flag = f"  REGRESSION: {', '.join(result['regressions'])}" if result.get("regressions") else ""
+            print(f"{result['stage']:<30} {result['size']:>10} rows  wall {result['wall_seconds']:9.4f}s  "
+                  f"cpu {result['cpu_seconds']:9.4f}s  peak +{result['peak_memory_mb']:8.1f} MB{flag}")
+        else:
+            print(f"{result['stage']:<30} {result['size']:>10} rows  {result['status']}")
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
@@ -0,0 +1,79 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.data_ingestion.schema import STUDENT_SCHEMA
+
+# Category frequencies of data/uncleaned/students.csv
+CATEGORY_FREQUENCIES = {
+    "gender": {"female": 0.518, "male": 0.482},
+    "race_ethnicity": {"group A": 0.089, "group B": 0.190, "group C": 0.318, "group D": 0.262, "group E": 0.141},
+    "parental_level_of_education": {"some high school": 0.178, "high school": 0.196, "some college": 0.227,
+                                    "associate's degree": 0.222, "bachelor's degree": 0.119,
+                                    "master's degree": 0.058},
+    "lunch": {"standard": 0.644, "free/reduced": 0.356},
+    "test_preparation_course": {"none": 0.643, "completed": 0.357},
+}
+COLUMN_ORDER = ["gender", "race_ethnicity", "parental_level_of_education", "lunch", "test_preparation_course",
+                "math_score", "reading_score", "writing_score"]
+
+
+def generate_students(n_rows, seed=42, missing_rate=0.001, duplicate_rate=0.001):
+    """
+    Synthetic raw student data with the columns, dtypes (STUDENT_SCHEMA) and category mix
+    of data/uncleaned/students.csv. Scores are whole numbers in 0-100; reading and writing
+    are strongly correlated and math depends on them, lunch and test preparation, so models
+    have something to learn. missing_rate of every column is NaN and duplicate_rate of the
+    rows repeat earlier rows, so clean_data has work to do. Deterministic for a given seed.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for col, frequencies in CATEGORY_FREQUENCIES.items():
+        probabilities = np.fromiter(frequencies.values(), dtype=np.float64)
+        codes = rng.choice(len(frequencies), size=n_rows, p=probabilities / probabilities.sum()).astype(np.int8)
+        data[col] = pd.Categorical.from_codes(codes, categories=list(frequencies))
+
+    lunch_gain = np.where(data["lunch"].codes == 0, 4.0, -4.0)
+    prep_gain = np.where(data["test_preparation_course"].codes == 1, 5.0, -2.0)
+    reading = rng.normal(69, 14.6, n_rows) + prep_gain
+    writing = reading + rng.normal(-1, 4.5, n_rows) + prep_gain
+    math = 0.8 * reading + 12 + lunch_gain + rng.normal(0, 8, n_rows)
+    for col, scores in (("math_score", math), ("reading_score", reading), ("writing_score", writing)):
+        data[col] = np.clip(np.round(scores), 0, 100).astype(np.float32)
+
+    frame = pd.DataFrame(data)[COLUMN_ORDER]
+    for col in COLUMN_ORDER:
+        missing = rng.random(n_rows) < missing_rate
+        frame.loc[missing, col] = np.nan
+    n_duplicates = int(n_rows * duplicate_rate)
+    if n_duplicates:
+        targets = rng.choice(np.arange(1, n_rows), size=n_duplicates, replace=False)
+        sources = rng.integers(0, targets)
+        frame.iloc[targets] = frame.iloc[sources].to_numpy()
+    return frame.astype(STUDENT_SCHEMA)
+
+
+def write_students_csv(n_rows, file_path, seed=42, chunk_rows=1_000_000, **kwargs):
+    """Writes generate_students data to CSV in chunks of chunk_rows, so 10M-row files fit in memory."""
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    for index, start in enumerate(range(0, n_rows, chunk_rows)):
+        chunk = generate_students(min(chunk_rows, n_rows - start), seed=seed + index, **kwargs)
+        chunk.to_csv(file_path, mode="w" if index == 0 else "a", header=index == 0, index=False)
+    logger.info(f"Wrote {n_rows} synthetic student rows to {file_path}")
+    return file_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic raw students CSV.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--output", default=os.path.join("data", "synthetic", "students.csv"))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    write_students_csv(args.rows, args.output, seed=args.seed)
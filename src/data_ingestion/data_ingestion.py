@@ -5,13 +5,20 @@ def load_and_print_data():
     # Construct the path to the file relative to the current script
     file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'uncleaned', 'students.csv')
 import os
+import sys
 import pandas as pd
 
-def load_data(file_path):
-    """Load the data from a CSV file."""
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.data_ingestion.schema import STUDENT_SCHEMA, read_students_csv, log_memory_footprint
+
+def load_data(file_path, schema=STUDENT_SCHEMA):
+    """Load the data from a CSV file, parsing columns with the typed schema (schema=None for pandas defaults)."""
     try:
-        data = pd.read_csv(file_path)
+        data = read_students_csv(file_path, schema=schema)
         print("Data loaded successfully.")
+        log_memory_footprint("load", data)
         print("Displaying the first few rows of the dataset:")
         print(data.head())
         return data
@@ -29,14 +36,15 @@ def clean_data(data):
     print("Duplicates removed.")
     
     # Replace missing values in numerical columns with the median
-    for col in data.select_dtypes(include=['float64', 'int64']).columns:
+    for col in data.select_dtypes(include=['float64', 'int64', 'float32']).columns:
         data[col].fillna(data[col].median(), inplace=True)
     
     # Replace missing values in categorical columns with the mode
-    for col in data.select_dtypes(include=['object']).columns:
+    for col in data.select_dtypes(include=['object', 'category']).columns:
         data[col].fillna(data[col].mode()[0], inplace=True)
     
     print("Missing values handled.")
+    log_memory_footprint("clean", data)
     return data
 
 def save_data(data, file_path):
@@ -52,18 +60,33 @@ def save_data(data, file_path):
         print(f"An error occurred while saving the data: {e}")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Clean the raw students data.")
+    parser.add_argument("--stream", action="store_true", help="Read, clean and write in chunks with bounded memory.")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip unchanged input and only clean rows appended since the last run.")
+    args = parser.parse_args()
+
     # File paths
     file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'uncleaned', 'students.csv')
     cleaned_file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'cleaned', 'cleaned_students.csv')
 
-    # Load the data
-    data = load_data(file_path)
-    if data is not None:
-        # Clean the data
-        cleaned_data = clean_data(data)
-        
-        # Save the cleaned data
-        save_data(cleaned_data, cleaned_file_path)
+    if args.stream:
+        from src.data_ingestion.streaming import stream_clean_data
 
+        stream_clean_data(file_path, cleaned_file_path, chunksize=args.chunksize)
+    elif args.incremental:
+        from src.data_ingestion.incremental import incremental_clean
 
+        incremental_clean(file_path, cleaned_file_path)
+    else:
+        # Load the data
+        data = load_data(file_path)
+        if data is not None:
+            # Clean the data
+            cleaned_data = clean_data(data)
 
+            # Save the cleaned data
+            save_data(cleaned_data, cleaned_file_path)
@@ -0,0 +1,168 @@
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.data_ingestion.streaming import row_hashes, normalize_chunk
+
+READ_BLOCK_SIZE = 1 << 20
+
+
+def file_digests(file_path, prefix_size=None):
+    """
+    SHA-256 of the whole file and, in the same pass, of its first prefix_size bytes
+    (used to check that a grown file only had rows appended).
+    """
+    full = hashlib.sha256()
+    prefix_digest = None
+    remaining = prefix_size
+    with open(file_path, "rb") as f:
+        while True:
+            if remaining is not None and remaining > 0:
+                block = f.read(min(READ_BLOCK_SIZE, remaining))
+                remaining -= len(block)
+            else:
+                block = f.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            full.update(block)
+            if remaining == 0 and prefix_digest is None:
+                prefix_digest = full.copy().hexdigest()
+    return full.hexdigest(), prefix_digest
+
+
+def _load_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def _write_manifest(manifest_path, manifest):
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def _dedupe(data, known_hashes=None):
+    """Drops duplicate rows (and rows whose hash is in known_hashes); returns the frame and its row hashes."""
+    hashes = row_hashes(data)
+    keep = ~pd.Series(hashes).duplicated().to_numpy()
+    if known_hashes is not None:
+        keep &= ~np.isin(hashes, known_hashes)
+    return data[keep], hashes[keep]
+
+
+def _full_clean(input_path, output_path):
+    data = pd.read_csv(input_path)
+    numeric_columns = list(data.select_dtypes(include=['float64', 'int64']).columns)
+    categorical_columns = list(data.select_dtypes(include=['object']).columns)
+    data, hashes = _dedupe(normalize_chunk(data, numeric_columns))
+
+    fill_values = {col: data[col].median() for col in numeric_columns}
+    fill_values.update({col: data[col].mode()[0] for col in categorical_columns if data[col].notna().any()})
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    data.fillna(value=fill_values).to_csv(output_path, index=False)
+    return {
+        "columns": list(data.columns),
+        "numeric_columns": numeric_columns,
+        "fill_values": {col: (value.item() if hasattr(value, "item") else value) for col, value in fill_values.items()},
+        "rows": int(len(data)),
+    }, hashes
+
+
+def incremental_clean(input_path, output_path, manifest_path=None):
+    """
+    Clean input_path into output_path, skipping work that a previous run already did.
+
+    A manifest next to the output records the input's size, mtime and SHA-256, and a sidecar
+    .npy keeps the hashes of the cleaned rows. On re-run:
+    - unchanged input (same size/mtime, or same content hash) -> nothing is done;
+    - rows only appended -> just the new rows are parsed, deduplicated against the stored
+      hashes, filled with the stored medians/modes and appended to the output (an appended
+      tail of only blank lines counts as unchanged);
+    - anything else -> a full clean, equivalent to load_data -> clean_data -> save_data.
+    Returns "skipped", "appended" or "full".
+    """
+    try:
+        start = time.perf_counter()
+        manifest_path = manifest_path or os.path.join(os.path.dirname(output_path), "ingestion_manifest.json")
+        hashes_path = os.path.splitext(manifest_path)[0] + "_row_hashes.npy"
+        manifest = _load_manifest(manifest_path)
+        stat = os.stat(input_path)
+
+        usable = (manifest is not None and manifest.get("input_path") == os.path.abspath(input_path)
+                  and os.path.exists(output_path) and os.path.exists(hashes_path))
+
+        # Fast path: nothing touched the file since the last run
+        if usable and manifest["size"] == stat.st_size and manifest["mtime_ns"] == stat.st_mtime_ns:
+            logger.info(f"{input_path} unchanged; skipping ingestion ({(time.perf_counter() - start) * 1000:.1f} ms)")
+            return "skipped"
+
+        prefix_size = manifest["size"] if usable and stat.st_size > manifest["size"] else None
+        digest, prefix_digest = file_digests(input_path, prefix_size)
+
+        if usable and digest == manifest["sha256"]:
+            manifest.update({"mtime_ns": stat.st_mtime_ns})
+            _write_manifest(manifest_path, manifest)
+            logger.info(f"{input_path} touched but content unchanged; skipping ingestion")
+            return "skipped"
+
+        if usable and prefix_digest == manifest["sha256"] and manifest.get("ends_with_newline", False):
+            with open(input_path, "rb") as f:
+                f.seek(manifest["size"])
+                appended = f.read()
+            if not appended.strip():
+                # Only blank lines or whitespace were appended: no rows, but the manifest moves to the new size
+                mode = "skipped"
+                logger.info(f"No new rows appended to {input_path}; skipping ingestion")
+            else:
+                new_rows = pd.read_csv(io.BytesIO(appended), header=None, names=manifest["columns"])
+                known_hashes = np.load(hashes_path)
+                new_rows, new_hashes = _dedupe(normalize_chunk(new_rows, manifest["numeric_columns"]), known_hashes)
+                new_rows.fillna(value=manifest["fill_values"]).to_csv(output_path, mode="a", header=False, index=False)
+                np.save(hashes_path, np.concatenate([known_hashes, new_hashes]))
+                mode = "appended"
+                manifest["rows"] += int(len(new_rows))
+                logger.info(f"{len(new_rows)} appended rows cleaned and merged into {output_path}")
+        else:
+            manifest, hashes = _full_clean(input_path, output_path)
+            np.save(hashes_path, hashes)
+            mode = "full"
+            logger.info(f"Full clean of {input_path} written to {output_path}")
+
+        with open(input_path, "rb") as f:
+            f.seek(max(stat.st_size - 1, 0))
+            ends_with_newline = f.read(1) == b"\n"
+        manifest.update({
+            "input_path": os.path.abspath(input_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "ends_with_newline": ends_with_newline,
+        })
+        _write_manifest(manifest_path, manifest)
+        logger.info(f"Incremental ingestion ({mode}) finished in {time.perf_counter() - start:.3f}s")
+        return mode
+    except Exception as e:
+        raise CustomException(f"Error during incremental ingestion: {e}", sys)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally clean the raw students data.")
+    parser.add_argument("--input", default=os.path.join("data", "uncleaned", "students.csv"))
+    parser.add_argument("--output", default=os.path.join("data", "cleaned", "cleaned_students.csv"))
+    args = parser.parse_args()
+
+    print(incremental_clean(args.input, args.output))
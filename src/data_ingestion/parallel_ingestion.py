@@ -0,0 +1,99 @@
+import os
+import sys
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.data_ingestion.streaming import row_hashes, normalize_chunk, infer_column_kinds
+
+
+def resolve_shards(source):
+    """Returns the sorted list of CSV shards for a directory or a glob pattern."""
+    pattern = os.path.join(source, "*.csv") if os.path.isdir(source) else source
+    shards = sorted(glob.glob(pattern))
+    if not shards:
+        raise FileNotFoundError(f"No CSV shards found for {source}")
+    return shards
+
+
+def parse_shard(file_path, numeric_columns):
+    """
+    Worker task: parse one shard, normalize numeric columns and drop duplicates within it.
+    Returns the shard frame and the 64-bit hash of each remaining row.
+    """
+    shard = normalize_chunk(pd.read_csv(file_path), numeric_columns)
+    hashes = row_hashes(shard)
+    keep = ~pd.Series(hashes).duplicated().to_numpy()
+    return shard[keep], hashes[keep]
+
+
+def ingest_shards(source, output_path=None, n_workers=None):
+    """
+    Parse and clean every CSV shard matching source in parallel and merge them into one dataset.
+
+    Shards are parsed, hashed and locally deduplicated on a process pool. Their rows are then
+    deduplicated globally (first occurrence in shard order wins) and missing values are filled
+    with the medians/modes of the merged data, exactly like clean_data on the concatenation.
+    """
+    try:
+        shards = resolve_shards(source)
+        numeric_columns, categorical_columns = infer_column_kinds(shards[0])
+        n_workers = n_workers or os.cpu_count() or 1
+        logger.info(f"Ingesting {len(shards)} shards with {n_workers} worker processes")
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(parse_shard, shards, [numeric_columns] * len(shards)))
+
+        data = pd.concat([frame for frame, _ in results], ignore_index=True)
+        hashes = np.concatenate([shard_hashes for _, shard_hashes in results])
+        data = data[~pd.Series(hashes).duplicated().to_numpy()].reset_index(drop=True)
+        logger.info(f"{len(data)} unique rows after global deduplication")
+
+        fill_values = {col: data[col].median() for col in numeric_columns}
+        fill_values.update({col: data[col].mode()[0] for col in categorical_columns if data[col].notna().any()})
+        data = data.fillna(value=fill_values)
+
+        if output_path is not None:
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            data.to_csv(output_path, index=False)
+            logger.info(f"Cleaned data from {len(shards)} shards saved to {output_path}")
+        return data
+    except Exception as e:
+        raise CustomException(f"Error during parallel shard ingestion: {e}", sys)
+
+
+def benchmark_scaling(source, worker_counts=None):
+    """Times ingest_shards for increasing worker counts and reports rows/sec and speedup."""
+    worker_counts = worker_counts or sorted({1, 2, 4, os.cpu_count() or 1})
+    report = []
+    for n_workers in worker_counts:
+        start = time.perf_counter()
+        rows = len(ingest_shards(source, n_workers=n_workers))
+        seconds = time.perf_counter() - start
+        report.append({"workers": n_workers, "seconds": seconds, "rows_per_sec": rows / seconds})
+    for entry in report:
+        entry["speedup"] = report[0]["seconds"] / entry["seconds"]
+        logger.info(f"Shard ingestion scaling: {entry}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest a directory or glob of CSV shards in parallel.")
+    parser.add_argument("source", help="Directory of CSV shards or a glob pattern such as 'exports/2024-*.csv'.")
+    parser.add_argument("--output", default=os.path.join("data", "cleaned", "cleaned_students.csv"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--benchmark", action="store_true", help="Report throughput for 1..N workers instead.")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(pd.DataFrame(benchmark_scaling(args.source)))
+    else:
+        ingest_shards(args.source, args.output, args.workers)
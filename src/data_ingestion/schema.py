@@ -0,0 +1,66 @@
+import os
+import sys
+import argparse
+import pandas as pd
+from scipy import sparse
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+
+CATEGORICAL_COLUMNS = ["gender", "race_ethnicity", "parental_level_of_education", "lunch", "test_preparation_course"]
+SCORE_COLUMNS = ["math_score", "reading_score", "writing_score"]
+
+# Scores are 0-100 but may be missing, so float32 rather than a (non-nullable) small int
+STUDENT_SCHEMA = {
+    **{col: "category" for col in CATEGORICAL_COLUMNS},
+    **{col: "float32" for col in SCORE_COLUMNS},
+}
+
+
+def read_students_csv(file_path, schema=STUDENT_SCHEMA, **kwargs):
+    """pd.read_csv with the typed student schema applied while parsing (columns not in the file are ignored)."""
+    return pd.read_csv(file_path, dtype=schema, **kwargs)
+
+
+def memory_footprint_mb(data):
+    """Deep memory usage of a DataFrame, or the in-memory size of a dense array or CSR matrix, in MB."""
+    if isinstance(data, pd.DataFrame):
+        return data.memory_usage(deep=True).sum() / 1e6
+    if sparse.issparse(data):
+        return (data.data.nbytes + data.indices.nbytes + data.indptr.nbytes) / 1e6
+    return data.nbytes / 1e6
+
+
+def log_memory_footprint(stage, data):
+    footprint = memory_footprint_mb(data)
+    logger.info(f"Memory footprint after {stage}: {footprint:.3f} MB")
+    return footprint
+
+
+def memory_report(raw_path):
+    """
+    Memory footprint of the data after each ingestion stage (read, clean, split features)
+    with and without the typed schema.
+    """
+    from src.data_ingestion.data_ingestion import load_data, clean_data
+
+    report = []
+    for label, schema in (("untyped", None), ("typed", STUDENT_SCHEMA)):
+        data = load_data(raw_path, schema=schema)
+        entry = {"schema": label, "read_mb": memory_footprint_mb(data)}
+        data = clean_data(data)
+        entry["clean_mb"] = memory_footprint_mb(data)
+        entry["features_mb"] = memory_footprint_mb(data.drop(columns=["math_score"]))
+        report.append(entry)
+    logger.info(f"Memory footprint report: {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the memory footprint of the typed and untyped schema.")
+    parser.add_argument("--input", default=os.path.join("data", "uncleaned", "students.csv"))
+    args = parser.parse_args()
+
+    print(pd.DataFrame(memory_report(args.input)).set_index("schema"))
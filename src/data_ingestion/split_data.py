@@ -1,21 +1,30 @@
 import os
-import pandas as pd
+import sys
 from sklearn.model_selection import train_test_split
 
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.data_ingestion.schema import read_students_csv, log_memory_footprint
+
 # Define paths
 cleaned_file_path = os.path.join('data', 'cleaned', 'cleaned_students.csv')
 train_file_path = os.path.join('data', 'cleaned', 'train.csv')
 test_file_path = os.path.join('data', 'cleaned', 'test.csv')
 
-# Ensure the directory exists
-os.makedirs(os.path.dirname(train_file_path), exist_ok=True)
 
-try:
-    # Load the cleaned data
-    data = pd.read_csv(cleaned_file_path)
+def split_data(cleaned_file_path=cleaned_file_path, train_file_path=train_file_path,
+               test_file_path=test_file_path, test_size=0.2, random_state=42):
+    """Split the cleaned data into train and test CSV files."""
+    # Ensure the directory exists
+    os.makedirs(os.path.dirname(train_file_path), exist_ok=True)
+
+    # Load the cleaned data with the typed schema
+    data = read_students_csv(cleaned_file_path)
+    log_memory_footprint("split (load)", data)
 
     # Split the data into train and test sets
-    train, test = train_test_split(data, test_size=0.2, random_state=42)
+    train, test = train_test_split(data, test_size=test_size, random_state=random_state)
 
     # Save the train and test sets
     train.to_csv(train_file_path, index=False)
@@ -24,8 +33,13 @@ try:
     print(f"Train and test datasets created successfully:")
     print(f"Train: {train_file_path}")
     print(f"Test: {test_file_path}")
-except FileNotFoundError:
-    print(f"File not found: {cleaned_file_path}")
-except Exception as e:
-    print(f"An error occurred: {e}")
+    return train_file_path, test_file_path
+
 
+if __name__ == "__main__":
+    try:
+        split_data()
+    except FileNotFoundError:
+        print(f"File not found: {cleaned_file_path}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -0,0 +1,146 @@
+import os
+import sys
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+
+class StreamingMedian:
+    """
+    Approximate median over a stream using a fixed-size uniform reservoir sample.
+    The result is exact while the stream holds at most sample_size values.
+    """
+    def __init__(self, sample_size=100_000, random_state=42):
+        self.sample_size = sample_size
+        self.reservoir = np.empty(sample_size, dtype=np.float64)
+        self.count = 0
+        self._rng = np.random.RandomState(random_state)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        # Fill the reservoir first, then replace entries with decreasing probability (Algorithm R)
+        free = max(0, min(self.sample_size - self.count, len(values)))
+        self.reservoir[self.count:self.count + free] = values[:free]
+        overflow = values[free:]
+        if len(overflow):
+            positions = self.count + free + np.arange(1, len(overflow) + 1)
+            slots = self._rng.randint(0, positions)
+            replace = slots < self.sample_size
+            # Fancy assignment applies in order, so later values win exactly as in the sequential algorithm
+            self.reservoir[slots[replace]] = overflow[replace]
+        self.count += len(values)
+
+    def result(self):
+        if self.count == 0:
+            return np.nan
+        return float(np.median(self.reservoir[:min(self.count, self.sample_size)]))
+
+
+class StreamingMode:
+    """Exact mode over a stream of categorical values (memory grows with the number of distinct values)."""
+    def __init__(self):
+        self.counts = Counter()
+
+    def update(self, values):
+        self.counts.update(pd.Series(values).dropna().value_counts().to_dict())
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+
+    def result(self):
+        if not self.counts:
+            return np.nan
+        top = max(self.counts.values())
+        # pandas' Series.mode() returns the smallest of the tied values first
+        return min(value for value, count in self.counts.items() if count == top)
+
+
+def row_hashes(chunk):
+    """64-bit content hash of every row (index ignored), used for duplicate detection across chunks."""
+    return pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+
+
+def normalize_chunk(chunk, numeric_columns):
+    """Parse numeric columns as float64 in every chunk so hashes do not depend on per-chunk dtype inference."""
+    for col in numeric_columns:
+        chunk[col] = pd.to_numeric(chunk[col], errors="coerce").astype("float64")
+    return chunk
+
+
+def drop_seen_rows(chunk, seen_hashes):
+    """Drops rows already present in seen_hashes (or earlier in the chunk) and records the new ones."""
+    hashes = row_hashes(chunk)
+    keep = ~pd.Series(hashes).duplicated().to_numpy()
+    keep &= np.fromiter((h not in seen_hashes for h in hashes), dtype=bool, count=len(hashes))
+    seen_hashes.update(hashes[keep].tolist())
+    return chunk[keep]
+
+
+def infer_column_kinds(file_path, sample_rows=1000):
+    """Splits the columns of a CSV into numeric and categorical based on its first rows."""
+    sample = pd.read_csv(file_path, nrows=sample_rows)
+    numeric_columns = list(sample.select_dtypes(include=['float64', 'int64']).columns)
+    categorical_columns = list(sample.select_dtypes(include=['object']).columns)
+    return numeric_columns, categorical_columns
+
+
+def compute_fill_values(chunks, numeric_columns, categorical_columns, sample_size=100_000):
+    """
+    First pass: deduplicate the stream and accumulate medians (numeric) and modes (categorical).
+    Returns the fill value for each column.
+    """
+    medians = {col: StreamingMedian(sample_size) for col in numeric_columns}
+    modes = {col: StreamingMode() for col in categorical_columns}
+    seen_hashes = set()
+    for chunk in chunks:
+        chunk = drop_seen_rows(normalize_chunk(chunk, numeric_columns), seen_hashes)
+        for col, median in medians.items():
+            median.update(chunk[col].to_numpy())
+        for col, mode in modes.items():
+            mode.update(chunk[col])
+    fill_values = {col: median.result() for col, median in medians.items()}
+    fill_values.update({col: mode.result() for col, mode in modes.items()})
+    return fill_values
+
+
+def stream_clean_data(input_path, output_path, chunksize=100_000, sample_size=100_000):
+    """
+    Streaming equivalent of load_data -> clean_data -> save_data for inputs larger than memory.
+
+    Pass 1 reads the CSV in chunks, drops duplicate rows with a set of 64-bit row hashes and
+    accumulates medians (reservoir sample of sample_size values, exact below that) and modes.
+    Pass 2 re-reads the file, drops the same duplicates, fills missing values and appends each
+    cleaned chunk to output_path. Only one chunk plus the hash set is held in memory.
+    """
+    try:
+        numeric_columns, categorical_columns = infer_column_kinds(input_path)
+        logger.info(f"Streaming ingestion of {input_path} in chunks of {chunksize} rows")
+
+        fill_values = compute_fill_values(
+            pd.read_csv(input_path, chunksize=chunksize), numeric_columns, categorical_columns, sample_size
+        )
+        logger.info(f"Fill values computed: {fill_values}")
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp_path = f"{output_path}.tmp"
+        seen_hashes = set()
+        rows_in, rows_out = 0, 0
+        for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+            rows_in += len(chunk)
+            chunk = drop_seen_rows(normalize_chunk(chunk, numeric_columns), seen_hashes)
+            chunk = chunk.fillna(value=fill_values)
+            chunk.to_csv(tmp_path, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+            rows_out += len(chunk)
+        os.replace(tmp_path, output_path)
+
+        logger.info(f"Streaming ingestion finished: {rows_in} rows read, {rows_out} rows written to {output_path}")
+        return rows_in, rows_out
+    except Exception as e:
+        raise CustomException(f"Error during streaming ingestion: {e}", sys)
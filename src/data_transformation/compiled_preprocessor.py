@@ -0,0 +1,236 @@
+import os
+import sys
+import time
+import argparse
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+# Below this many rows categories are looked up in plain dicts; above it with a hashed pandas Index
+DICT_LOOKUP_MAX_ROWS = 64
+
+
+def _steps(transformer):
+    return [step for _, step in transformer.steps] if isinstance(transformer, Pipeline) else [transformer]
+
+
+def _scaler_arrays(scaler, n_features):
+    """mean_/scale_ of a fitted StandardScaler as arrays (0 and 1 where centering/scaling is disabled)."""
+    mean = scaler.mean_ if scaler is not None and scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler is not None and scaler.with_std else np.ones(n_features)
+    return mean, scale
+
+
+class CompiledPreprocessor:
+    """
+    A fitted ColumnTransformer reduced to flat NumPy arrays.
+
+    Numeric block: per-column fill values, mean and scale, applied with the same in-place
+    subtract/divide as StandardScaler. Categorical block: a category -> output-column map per
+    input column plus, for every one-hot column, its precomputed "cold" and "hot" value
+    ((0 - mean) / scale and (1 - mean) / scale). The output is bit-identical to
+    preprocessor.transform for the imputer -> scaler and imputer -> one-hot -> scaler
+    pipelines built in DataTransformation.
+    """
+    def __init__(self, numeric_columns, numeric_fill, numeric_mean, numeric_scale,
+                 categorical_columns, categorical_fill, category_maps, cold_values, hot_values,
+                 handle_unknown="ignore"):
+        self.numeric_columns = list(numeric_columns)
+        self.numeric_fill = numeric_fill
+        self.numeric_mean = numeric_mean
+        self.numeric_scale = numeric_scale
+        self.categorical_columns = list(categorical_columns)
+        self.categorical_fill = list(categorical_fill)
+        self.category_maps = category_maps
+        self.category_indexes = [pd.Index(list(mapping)) for mapping in category_maps]
+        self.category_offsets = [np.fromiter(mapping.values(), dtype=np.intp, count=len(mapping))
+                                 for mapping in category_maps]
+        self.cold_values = cold_values
+        self.hot_values = hot_values
+        self.handle_unknown = handle_unknown
+        self.n_features_out = len(self.numeric_columns) + len(cold_values)
+
+    def _column(self, data, col):
+        if isinstance(data, pd.DataFrame):
+            column = data[col]
+            # Categorical columns are kept as codes + categories instead of materializing strings
+            return column.array if isinstance(column.dtype, pd.CategoricalDtype) else column.to_numpy()
+        return np.array([record.get(col) for record in data], dtype=object)
+
+    def _numeric_block(self, data, n_rows):
+        columns = [self._column(data, col) for col in self.numeric_columns]
+        # Like sklearn's check_array: float inputs keep their (common) precision, anything else becomes float64
+        if columns and all(values.dtype.kind == "f" for values in columns):
+            dtype = np.result_type(*columns)
+        else:
+            dtype = np.float64
+        block = np.empty((n_rows, len(columns)), dtype=dtype)
+        for j, values in enumerate(columns):
+            block[:, j] = values if values.dtype.kind == "f" else pd.to_numeric(values, errors="coerce")
+        missing = np.isnan(block)
+        if missing.any():
+            block[missing] = np.broadcast_to(self.numeric_fill, block.shape)[missing]
+        block -= self.numeric_mean
+        block /= self.numeric_scale
+        return block
+
+    def _category_codes(self, values, j):
+        """Output-column index of every value of categorical column j (-1 for unknown categories)."""
+        mapping = self.category_maps[j]
+        if isinstance(values, pd.Categorical):
+            # Look up each category once and gather by code; code -1 (NaN) takes the fill value's column
+            lookup = np.append(self._category_codes(np.asarray(values.categories, dtype=object), j),
+                               mapping.get(self.categorical_fill[j], -1))
+            return lookup[values.codes]
+        if len(values) <= DICT_LOOKUP_MAX_ROWS:
+            codes = np.fromiter((mapping.get(value, -1) for value in values), dtype=np.intp, count=len(values))
+        else:
+            positions = self.category_indexes[j].get_indexer(values)
+            codes = np.where(positions >= 0, self.category_offsets[j][positions], -1)
+        # NaN never matches a category, so only the misses need checking. Like SimpleImputer
+        # (missing_values=np.nan) only NaN counts as missing; None stays an unknown category.
+        misses = np.flatnonzero(codes < 0)
+        if len(misses):
+            missed = values[misses]
+            missing = misses[missed != missed]
+            codes[missing] = mapping.get(self.categorical_fill[j], -1)
+        return codes
+
+    def transform(self, data):
+        """Transforms a DataFrame, a single record (dict) or a list of records."""
+        if isinstance(data, Mapping):
+            data = [data]
+        n_rows = len(data)
+        numeric_block = self._numeric_block(data, n_rows)
+        # ColumnTransformer stacks the blocks in their common dtype
+        output = np.empty((n_rows, self.n_features_out), dtype=np.result_type(numeric_block.dtype, self.cold_values.dtype))
+        n_numeric = len(self.numeric_columns)
+        output[:, :n_numeric] = numeric_block
+        output[:, n_numeric:] = self.cold_values
+
+        rows = np.arange(n_rows)
+        for j, col in enumerate(self.categorical_columns):
+            codes = self._category_codes(self._column(data, col), j)
+            known = codes >= 0
+            if not known.all():
+                if self.handle_unknown == "error":
+                    raise ValueError(f"Found unknown categories in column '{col}' during transform")
+                codes, row_index = codes[known], rows[known]
+            else:
+                row_index = rows
+            output[row_index, n_numeric + codes] = self.hot_values[codes]
+        return output
+
+
+def compile_preprocessor(preprocessor):
+    """
+    Compiles a fitted ColumnTransformer of the shape built by DataTransformation (one numeric
+    imputer -> scaler block followed by one categorical imputer -> one-hot -> scaler block)
+    into a CompiledPreprocessor. Raises ValueError for structures it cannot reproduce exactly.
+    """
+    if not isinstance(preprocessor, ColumnTransformer):
+        raise ValueError("Only fitted ColumnTransformer objects can be compiled")
+    if preprocessor.remainder != "drop" and any(name == "remainder" for name, _, _ in preprocessor.transformers_):
+        raise ValueError("ColumnTransformer remainder columns are not supported")
+
+    blocks = [(transformer, columns) for name, transformer, columns in preprocessor.transformers_
+              if name != "remainder" and transformer != "drop"]
+    if len(blocks) != 2:
+        raise ValueError("Expected exactly one numeric and one categorical transformer")
+    (num_transformer, numeric_columns), (cat_transformer, categorical_columns) = blocks
+
+    # Numeric block: [SimpleImputer] -> [StandardScaler]
+    num_steps = _steps(num_transformer)
+    imputer = next((step for step in num_steps if isinstance(step, SimpleImputer)), None)
+    scaler = next((step for step in num_steps if isinstance(step, StandardScaler)), None)
+    if len(num_steps) != (imputer is not None) + (scaler is not None):
+        raise ValueError(f"Unsupported numeric steps: {num_steps}")
+    n_numeric = len(numeric_columns)
+    numeric_fill = imputer.statistics_.astype(np.float64) if imputer is not None else np.full(n_numeric, np.nan)
+    if np.isnan(numeric_fill).any() and imputer is not None:
+        raise ValueError("Numeric imputer dropped an all-missing column")
+    numeric_mean, numeric_scale = _scaler_arrays(scaler, n_numeric)
+
+    # Categorical block: [SimpleImputer] -> OneHotEncoder -> [StandardScaler]
+    cat_steps = _steps(cat_transformer)
+    imputer = next((step for step in cat_steps if isinstance(step, SimpleImputer)), None)
+    encoder = next((step for step in cat_steps if isinstance(step, OneHotEncoder)), None)
+    scaler = next((step for step in cat_steps if isinstance(step, StandardScaler)), None)
+    if encoder is None or len(cat_steps) != 1 + (imputer is not None) + (scaler is not None):
+        raise ValueError(f"Unsupported categorical steps: {cat_steps}")
+    if cat_steps.index(encoder) < (imputer is not None) or (scaler is not None and cat_steps[-1] is not scaler):
+        raise ValueError("Categorical steps must be ordered imputer -> one-hot encoder -> scaler")
+    if encoder.drop_idx_ is not None or getattr(encoder, "_infrequent_enabled", False):
+        raise ValueError("OneHotEncoder with drop or infrequent categories is not supported")
+    categorical_fill = list(imputer.statistics_) if imputer is not None else [np.nan] * len(categorical_columns)
+
+    category_maps, offset = [], 0
+    for categories in encoder.categories_:
+        category_maps.append({category: offset + k for k, category in enumerate(categories)})
+        offset += len(categories)
+    mean, scale = _scaler_arrays(scaler, offset)
+    # Same in-place operations StandardScaler applies to a 0/1 one-hot matrix of the encoder's dtype
+    cold_values = np.zeros(offset, dtype=encoder.dtype)
+    hot_values = np.ones(offset, dtype=encoder.dtype)
+    for values in (cold_values, hot_values):
+        values -= mean
+        values /= scale
+
+    return CompiledPreprocessor(
+        numeric_columns, numeric_fill, numeric_mean, numeric_scale,
+        categorical_columns, categorical_fill, category_maps, cold_values, hot_values,
+        handle_unknown=encoder.handle_unknown
+    )
+
+
+def benchmark_compiled_preprocessor(preprocessor, data, batch_sizes=(1, 10_000), repeats=200):
+    """
+    Checks that the compiled kernel reproduces preprocessor.transform bit for bit and reports
+    the per-call latency of both at each batch size.
+    """
+    try:
+        compiled = compile_preprocessor(preprocessor)
+        report = []
+        for batch_size in batch_sizes:
+            batch = data.sample(batch_size, replace=len(data) < batch_size, random_state=42).reset_index(drop=True)
+            expected, actual = preprocessor.transform(batch), compiled.transform(batch)
+            if not np.array_equal(expected, actual) or expected.dtype != actual.dtype:
+                raise AssertionError(f"Compiled preprocessor output differs at batch size {batch_size}")
+            n_calls = max(3, repeats // max(1, batch_size // 1000))
+            timings = {}
+            for label, transform in (("sklearn", preprocessor.transform), ("compiled", compiled.transform)):
+                start = time.perf_counter()
+                for _ in range(n_calls):
+                    transform(batch)
+                timings[label] = (time.perf_counter() - start) / n_calls * 1000
+            entry = {"batch_size": batch_size, "sklearn_ms": timings["sklearn"], "compiled_ms": timings["compiled"],
+                     "speedup": timings["sklearn"] / timings["compiled"]}
+            logger.info(f"Preprocessor benchmark: {entry}")
+            report.append(entry)
+        return report
+    except Exception as e:
+        raise CustomException(f"Error benchmarking compiled preprocessor: {e}", sys)
+
+
+if __name__ == "__main__":
+    from src.data_ingestion.schema import read_students_csv
+    from src.utils.artifact_cache import load_cached_object
+
+    parser = argparse.ArgumentParser(description="Check and benchmark the compiled preprocessor.")
+    parser.add_argument("--preprocessor", default=os.path.join("artifacts", "preprocessor.pkl"))
+    parser.add_argument("--data", default=os.path.join("data", "cleaned", "test.csv"))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10_000])
+    args = parser.parse_args()
+
+    data = read_students_csv(args.data).drop(columns=["math_score"], errors="ignore")
+    print(pd.DataFrame(benchmark_compiled_preprocessor(load_cached_object(args.preprocessor), data, args.batch_sizes)))
@@ -2,12 +2,17 @@
 
 import os
 import sys
+import time
+import tempfile
+import tracemalloc
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.metrics import r2_score
 from dataclasses import dataclass
 
 # Add the project root to the system path
@@ -15,24 +20,50 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'
 
 from src.log_config.logger import logger
 from src.utils.common_utils import save_object
-from src.model.model_evaluation import evaluate_regression_models
+from src.utils.array_store import (open_array_for_writing, save_sparse_array, load_array,
+                                   load_transformed_data, export_csv)
+from src.utils.resource_usage import peak_rss_mb
+from src.model.model_evaluation import evaluate_regression_models, get_regression_models
+from src.data_ingestion.schema import read_students_csv, log_memory_footprint, memory_footprint_mb
 
 @dataclass
 class DataTransformationConfig:
     preprocessor_obj_file_path: str = os.path.join('artifacts', "preprocessor.pkl")
-    transformed_train_data_path: str = os.path.join('artifacts', 'transformed_train_data.csv')
-    transformed_test_data_path: str = os.path.join('artifacts', 'transformed_test_data.csv')
+    transformed_train_data_path: str = os.path.join('artifacts', 'transformed_train_data.npy')
+    transformed_test_data_path: str = os.path.join('artifacts', 'transformed_test_data.npy')
+    # CSV copies of the transformed data are only written on request
+    export_csv: bool = False
+    transformed_train_csv_path: str = os.path.join('artifacts', 'transformed_train_data.csv')
+    transformed_test_csv_path: str = os.path.join('artifacts', 'transformed_test_data.csv')
+    # Rows transformed per chunk when writing the memory-mapped feature matrices
+    transform_chunk_size: int = 100_000
+    # One-hot columns are float32 like the schema's scores, so the whole feature matrix is float32
+    feature_dtype: type = np.float32
+    # Keep the one-hot expansion sparse (CSR) end to end and save it as .npz instead of .npy
+    sparse_output: bool = False
+    transformed_train_sparse_path: str = os.path.join('artifacts', 'transformed_train_data.npz')
+    transformed_test_sparse_path: str = os.path.join('artifacts', 'transformed_test_data.npz')
+
+    def transformed_paths(self):
+        """(train, test) paths of the transformed data for the configured output mode."""
+        if self.sparse_output:
+            return self.transformed_train_sparse_path, self.transformed_test_sparse_path
+        return self.transformed_train_data_path, self.transformed_test_data_path
 
 
 class DataTransformation:
-    def __init__(self):
-        self.data_transformation_config = DataTransformationConfig()
+    def __init__(self, export_csv=False, sparse_output=False):
+        self.data_transformation_config = DataTransformationConfig(export_csv=export_csv, sparse_output=sparse_output)
         logger.info("DataTransformation object initialized.")
 
     def get_data_transformer_object(self):
-        """Creates and returns the data preprocessing object."""
+        """
+        Creates and returns the data preprocessing object.
+        In sparse mode the one-hot output stays CSR through the scaler and the ColumnTransformer.
+        """
         try:
             logger.info("Creating data transformation pipelines.")
+            sparse_output = self.data_transformation_config.sparse_output
 
             # Define pipelines
             num_pipeline = Pipeline(steps=[
@@ -42,11 +73,13 @@ class DataTransformation:
 
             cat_pipeline = Pipeline(steps=[
                 ("imputer", SimpleImputer(strategy="most_frequent")),
-                ("one_hot_encoder", OneHotEncoder(handle_unknown="ignore", sparse=False)),
+                ("one_hot_encoder", OneHotEncoder(handle_unknown="ignore", sparse=sparse_output,
+                                                  dtype=self.data_transformation_config.feature_dtype)),
                 ("scaler", StandardScaler(with_mean=False))
             ])
 
-            # Combine pipelines
+            # Combine pipelines. In sparse mode sparse_threshold=1.0 keeps the stacked output CSR;
+            # with the default 0.3 the two dense score columns would tip it back to dense.
             preprocessor = ColumnTransformer(transformers=[
                 ("num_pipeline", num_pipeline, ["writing_score", "reading_score"]),
                 ("cat_pipeline", cat_pipeline, [
@@ -56,7 +89,7 @@ class DataTransformation:
                     "lunch",
                     "test_preparation_course"
                 ])
-            ])
+            ], sparse_threshold=1.0 if sparse_output else 0.3)
             logger.info("Data transformation pipelines created successfully.")
             return preprocessor
         except Exception as e:
@@ -64,17 +97,55 @@ class DataTransformation:
             from src.exceptions.exceptions import CustomException
             raise CustomException(f"Error in creating data transformer object: {e}", sys)
 
-    def initiate_data_transformation(self, train_path, test_path):
-        """Transforms train and test datasets and saves the preprocessor object."""
+    def transform_to_memmap(self, preprocessing_obj, input_features, target, file_path):
+        """
+        Transforms input_features chunk by chunk straight into a memory-mapped .npy file
+        (features followed by the target column), so the dense matrix is never held in memory.
+        """
+        chunk_size = self.data_transformation_config.transform_chunk_size
+        n_rows = len(input_features)
+        first_chunk = preprocessing_obj.transform(input_features.iloc[:chunk_size])
+
+        with open_array_for_writing(file_path, (n_rows, first_chunk.shape[1] + 1), dtype=first_chunk.dtype) as data:
+            data[:len(first_chunk), :-1] = first_chunk
+            for start in range(chunk_size, n_rows, chunk_size):
+                stop = start + chunk_size
+                data[start:stop, :-1] = preprocessing_obj.transform(input_features.iloc[start:stop])
+            data[:, -1] = target.to_numpy()
+
+    def transform_to_sparse(self, preprocessing_obj, input_features, target, file_path):
+        """Transforms input_features chunk by chunk into a CSR matrix (target as last column) saved as .npz."""
+        chunk_size = self.data_transformation_config.transform_chunk_size
+        target = target.to_numpy().reshape(-1, 1)
+        chunks = []
+        for start in range(0, len(input_features), chunk_size):
+            stop = start + chunk_size
+            chunks.append(sparse.hstack([
+                preprocessing_obj.transform(input_features.iloc[start:stop]), target[start:stop]
+            ], format="csr"))
+        save_sparse_array(file_path, sparse.vstack(chunks, format="csr"))
+
+    def save_transformed(self, preprocessing_obj, input_features, target, file_path):
+        if self.data_transformation_config.sparse_output:
+            self.transform_to_sparse(preprocessing_obj, input_features, target, file_path)
+        else:
+            self.transform_to_memmap(preprocessing_obj, input_features, target, file_path)
+
+    def initiate_data_transformation(self, train_path, test_path, evaluate_models=True):
+        """
+        Transforms train and test datasets and saves the preprocessor object.
+        evaluate_models=False skips the model evaluation step (the pipeline runs it as its own stage).
+        """
         try:
             logger.info(f"Checking existence of train and test files.")
             if not os.path.exists(train_path) or not os.path.exists(test_path):
                 raise FileNotFoundError(f"Train or test file does not exist: {train_path}, {test_path}")
 
             logger.info(f"Reading train data from {train_path}")
-            train_df = pd.read_csv(train_path)
+            train_df = read_students_csv(train_path)
             logger.info(f"Reading test data from {test_path}")
-            test_df = pd.read_csv(test_path)
+            test_df = read_students_csv(test_path)
+            log_memory_footprint("transformation (train load)", train_df)
 
             logger.info(f"Train dataset shape: {train_df.shape}")
             logger.info(f"Test dataset shape: {test_df.shape}")
@@ -98,21 +169,25 @@ class DataTransformation:
             input_features_test = test_df.drop(columns=[target_column_name])
             target_feature_test = test_df[target_column_name]
 
+            logger.info(f"Peak RSS before transformation: {peak_rss_mb()} MB")
             logger.info("Applying transformations.")
-            input_features_train_transformed = preprocessing_obj.fit_transform(input_features_train)
-            input_features_test_transformed = preprocessing_obj.transform(input_features_test)
+            preprocessing_obj.fit(input_features_train)
 
-            # Combine transformed data with the target variable
-            train_data = np.c_[input_features_train_transformed, target_feature_train.to_numpy()]
-            test_data = np.c_[input_features_test_transformed, target_feature_test.to_numpy()]
+            # Write transformed features and target straight to memory-mapped .npy files (.npz in sparse mode)
+            config = self.data_transformation_config
+            train_data_path, test_data_path = config.transformed_paths()
+            self.save_transformed(preprocessing_obj, input_features_train, target_feature_train, train_data_path)
+            self.save_transformed(preprocessing_obj, input_features_test, target_feature_test, test_data_path)
+            del train_df, test_df, input_features_train, input_features_test
 
-            # Save transformed data
-            os.makedirs(os.path.dirname(self.data_transformation_config.transformed_train_data_path), exist_ok=True)
-            pd.DataFrame(train_data).to_csv(self.data_transformation_config.transformed_train_data_path, index=False)
-            pd.DataFrame(test_data).to_csv(self.data_transformation_config.transformed_test_data_path, index=False)
+            log_memory_footprint("transformation (train features)", load_array(train_data_path))
+            logger.info(f"Transformed train data saved at {train_data_path}")
+            logger.info(f"Transformed test data saved at {test_data_path}")
+            logger.info(f"Peak RSS after transformation: {peak_rss_mb()} MB")
 
-            logger.info(f"Transformed train data saved at {self.data_transformation_config.transformed_train_data_path}")
-            logger.info(f"Transformed test data saved at {self.data_transformation_config.transformed_test_data_path}")
+            if config.export_csv:
+                export_csv(load_array(train_data_path), config.transformed_train_csv_path)
+                export_csv(load_array(test_data_path), config.transformed_test_csv_path)
 
             # Save preprocessor object
             save_object(
@@ -121,18 +196,17 @@ class DataTransformation:
             )
             logger.info(f"Preprocessor object saved at {self.data_transformation_config.preprocessor_obj_file_path}")
 
-            # Perform model evaluation (if needed)
-            logger.info("Starting model evaluation with transformed data.")
-            evaluate_regression_models(
-                input_features_train_transformed,
-                target_feature_train,
-                input_features_test_transformed,
-                target_feature_test
-            )
+            # Perform model evaluation (if needed) on read-only views of the memory-mapped data
+            if evaluate_models:
+                logger.info("Starting model evaluation with transformed data.")
+                X_train, y_train = load_transformed_data(train_data_path)
+                X_test, y_test = load_transformed_data(test_data_path)
+                evaluate_regression_models(X_train, y_train, X_test, y_test)
+                logger.info(f"Peak RSS after model evaluation: {peak_rss_mb()} MB")
 
             return (
-                self.data_transformation_config.transformed_train_data_path,
-                self.data_transformation_config.transformed_test_data_path,
+                train_data_path,
+                test_data_path,
                 self.data_transformation_config.preprocessor_obj_file_path
             )
         except Exception as e:
@@ -141,13 +215,73 @@ class DataTransformation:
             raise CustomException(f"Error in data transformation process: {e}", sys)
 
 
+def compare_transformation_modes(train_path, test_path,
+                                 model_names=("Ridge", "Random Forest Regressor", "XGBRegressor")):
+    """
+    Runs the transformation in dense and sparse mode on the same data (artifacts go to a
+    temporary directory) and reports, per mode: transform time, peak traced allocations,
+    size of the train matrix in memory and on disk, and fit+predict time and R2 of a few models.
+    """
+    train_df, test_df = read_students_csv(train_path), read_students_csv(test_path)
+    target_column_name = "math_score"
+    report = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for sparse_output in (False, True):
+            transformation = DataTransformation(sparse_output=sparse_output)
+            suffix = "npz" if sparse_output else "npy"
+            train_file, test_file = (os.path.join(tmp_dir, f"{name}.{suffix}") for name in ("train", "test"))
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            preprocessing_obj = transformation.get_data_transformer_object()
+            preprocessing_obj.fit(train_df.drop(columns=[target_column_name]))
+            for df, file_path in ((train_df, train_file), (test_df, test_file)):
+                transformation.save_transformed(preprocessing_obj, df.drop(columns=[target_column_name]),
+                                                df[target_column_name], file_path)
+            transform_seconds = time.perf_counter() - start
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            X_train, y_train = load_transformed_data(train_file)
+            X_test, y_test = load_transformed_data(test_file)
+            entry = {
+                "mode": "sparse" if sparse_output else "dense",
+                "transform_seconds": transform_seconds,
+                "peak_traced_mb": peak_bytes / 1e6,
+                "train_matrix_mb": memory_footprint_mb(X_train),
+                "train_file_mb": os.path.getsize(train_file) / 1e6,
+            }
+            models = get_regression_models()
+            for model_name in model_names:
+                start = time.perf_counter()
+                model = models[model_name].fit(X_train, y_train)
+                entry[f"{model_name} r2"] = r2_score(y_test, model.predict(X_test))
+                entry[f"{model_name} seconds"] = time.perf_counter() - start
+            logger.info(f"Transformation mode report: {entry}")
+            report.append(entry)
+    return report
+
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Transform the train/test data and save the preprocessor.")
+    parser.add_argument("--export-csv", action="store_true", help="Also write CSV copies of the transformed data.")
+    parser.add_argument("--sparse", action="store_true", help="Keep the one-hot features sparse and save them as .npz.")
+    parser.add_argument("--compare-modes", action="store_true",
+                        help="Report memory and speed of the dense and sparse modes instead of transforming.")
+    args = parser.parse_args()
+
     train_file_path = os.path.join('data', 'cleaned', 'train.csv')
     test_file_path = os.path.join('data', 'cleaned', 'test.csv')
 
+    if args.compare_modes:
+        print(pd.DataFrame(compare_transformation_modes(train_file_path, test_file_path)).T)
+        sys.exit(0)
+
     try:
         logger.info("Starting the data transformation process.")
-        data_transformation = DataTransformation()
+        data_transformation = DataTransformation(export_csv=args.export_csv, sparse_output=args.sparse)
         data_transformation.initiate_data_transformation(train_path=train_file_path, test_path=test_file_path)
         logger.info("Data transformation process completed successfully.")
     except Exception as e:
@@ -1,68 +1,105 @@
 import os
 import sys
-import pickle
 import numpy as np
+import argparse
+from scipy import sparse
+from scipy.stats import loguniform
 from sklearn.linear_model import Ridge
-from sklearn.model_selection import GridSearchCV
 from sklearn.exceptions import NotFittedError
 from src.log_config.logger import logger
 from src.exceptions.exceptions import CustomException
+from src.hyperparameter_tuning.search import run_search, SEARCH_STRATEGIES
+from src.hyperparameter_tuning.ridge_path import ridge_path_search
+from src.utils.array_store import load_transformed_data
+from src.utils.artifact_store import save_artifact
 
-def hyperparameter_tuning(X_train, y_train):
+def hyperparameter_tuning(X_train, y_train, search="grid", n_jobs=None, n_iter=10, time_budget=None,
+                          random_state=42):
     """
     Perform hyperparameter tuning for Ridge Regression.
+
+    search selects the engine: "grid" (the full alpha/solver grid), "random" (n_iter draws
+    with alpha sampled log-uniformly), "halving" (successive halving over the grid) or
+    "ridge_path" (closed-form CV scores for every alpha from one SVD per fold; the solver
+    only changes how Ridge is solved numerically, so it is not searched).
+    n_jobs sets the number of parallel workers and time_budget (seconds) caps the search.
+    A per-trial timing table is written next to tuned_model.pkl.
     """
     try:
-        logger.info("Starting hyperparameter tuning for Ridge Regression...")
+        logger.info(f"Starting hyperparameter tuning for Ridge Regression ({search} search)...")
         
         # Define hyperparameter grid
         param_grid = {
             'alpha': [0.01, 0.1, 1, 10, 100],
             'solver': ['auto', 'svd', 'cholesky', 'lsqr']
         }
+        if sparse.issparse(X_train):
+            # svd and cholesky cannot fit Ridge's intercept on sparse input
+            param_grid['solver'] = ['auto', 'lsqr', 'sparse_cg']
+        if search == "random":
+            param_grid = {**param_grid, 'alpha': loguniform(0.01, 100)}
         
         # Initialize Ridge model
         ridge = Ridge()
         
-        # GridSearchCV for hyperparameter tuning
-        grid_search = GridSearchCV(
-            estimator=ridge,
-            param_grid=param_grid,
-            scoring='r2',
-            cv=5,
-            verbose=2
-        )
-        
-        # Fit GridSearchCV
-        grid_search.fit(X_train, y_train)
-        logger.info(f"Best parameters: {grid_search.best_params_}")
-        logger.info(f"Best R2 score: {grid_search.best_score_}")
+        # Run the search
+        if search == "ridge_path":
+            result = ridge_path_search(X_train, y_train, alphas=param_grid['alpha'], cv=5)
+        else:
+            result = run_search(
+                ridge,
+                param_grid,
+                X_train,
+                y_train,
+                strategy=search,
+                n_iter=n_iter,
+                cv=5,
+                scoring='r2',
+                n_jobs=n_jobs,
+                time_budget=time_budget,
+                random_state=random_state
+            )
+        logger.info(f"Best parameters: {result.best_params}")
+        logger.info(f"Best R2 score: {result.best_score}")
 
         # Save the tuned model
         tuned_model_path = os.path.join("artifacts", "tuned_model.pkl")
-        with open(tuned_model_path, 'wb') as f:
-            pickle.dump(grid_search.best_estimator_, f)
+        save_artifact(tuned_model_path, result.best_estimator,
+                      metadata={"best_params": result.best_params, "cv_r2": float(result.best_score)})
         logger.info(f"Tuned model saved at {tuned_model_path}")
 
+        # Save the per-trial timing table next to the tuned model
+        trials_path = os.path.join("artifacts", "tuning_trials.csv")
+        result.trials_table().drop(columns=["params"]).to_csv(trials_path, index=False)
+        logger.info(f"Tuning trials saved at {trials_path}")
+
+        return result
+
     except Exception as e:
         logger.error(f"Error during hyperparameter tuning: {e}")
         raise CustomException(f"Error during hyperparameter tuning: {e}", sys)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune Ridge Regression hyperparameters.")
+    parser.add_argument("--search", choices=SEARCH_STRATEGIES + ("ridge_path",), default="grid")
+    parser.add_argument("--n-jobs", type=int, default=None)
+    parser.add_argument("--n-iter", type=int, default=10)
+    parser.add_argument("--time-budget", type=float, default=None, help="Search time budget in seconds.")
+    parser.add_argument("--sparse", action="store_true", help="Tune on the sparse (.npz) transformed data.")
+    args = parser.parse_args()
+
     try:
         logger.info("Loading transformed training data for hyperparameter tuning...")
         
-        # Load transformed train data
-        train_data_path = os.path.join("artifacts", "transformed_train_data.csv")
-        train_data = np.loadtxt(train_data_path, delimiter=',', skiprows=1)
-        
-        # Separate features and target
-        X_train = train_data[:, :-1]
-        y_train = train_data[:, -1]
+        # Load transformed train data (memory-mapped) as feature and target views
+        train_data_path = os.path.join("artifacts", "transformed_train_data.npz" if args.sparse
+                                       else "transformed_train_data.npy")
+        X_train, y_train = load_transformed_data(train_data_path)
         
         logger.info("Data loaded successfully. Initiating hyperparameter tuning...")
-        hyperparameter_tuning(X_train, y_train)
+        hyperparameter_tuning(X_train, y_train, search=args.search, n_jobs=args.n_jobs,
+                              n_iter=args.n_iter, time_budget=args.time_budget)
         logger.info("Hyperparameter tuning completed successfully.")
     except Exception as e:
         logger.error(f"Failed during hyperparameter tuning: {e}")
@@ -0,0 +1,146 @@
+import os
+import sys
+import time
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import KFold, GridSearchCV
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.hyperparameter_tuning.search import SearchResult
+from src.utils.array_store import load_transformed_data
+
+
+def _centered_svd(X, y):
+    """Centers X and y (Ridge fits an unpenalized intercept) and returns the thin SVD of X."""
+    X_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    U, s, Vt = np.linalg.svd(X - X_mean, full_matrices=False)
+    return U, s, Vt, X_mean, y_mean
+
+
+def ridge_coefficients_path(X, y, alphas):
+    """
+    Ridge coefficients and intercepts for every alpha from one SVD of the centered design matrix:
+    w(alpha) = V diag(s / (s^2 + alpha)) U^T (y - y_mean).
+    Returns (coefs of shape (n_alphas, n_features), intercepts of shape (n_alphas,)).
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    U, s, Vt, X_mean, y_mean = _centered_svd(X, y)
+    UTy = U.T @ (y - y_mean)
+    shrink = s[None, :] / (s[None, :] ** 2 + alphas[:, None])
+    coefs = (shrink * UTy[None, :]) @ Vt
+    intercepts = y_mean - coefs @ X_mean
+    return coefs, intercepts
+
+
+def ridge_kfold_scores(X, y, alphas, cv=5):
+    """
+    Mean R2 over KFold(cv) splits for every alpha, with one SVD per fold.
+    Uses the same unshuffled folds as GridSearchCV(cv=cv) for a regressor.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    fold_scores = []
+    for train_idx, val_idx in KFold(n_splits=cv).split(X):
+        coefs, intercepts = ridge_coefficients_path(X[train_idx], y[train_idx], alphas)
+        predictions = X[val_idx] @ coefs.T + intercepts[None, :]
+        y_val = y[val_idx]
+        ss_res = ((y_val[:, None] - predictions) ** 2).sum(axis=0)
+        ss_tot = ((y_val - y_val.mean()) ** 2).sum()
+        fold_scores.append(1 - ss_res / ss_tot)
+    fold_scores = np.array(fold_scores)
+    return fold_scores.mean(axis=0), fold_scores.std(axis=0)
+
+
+def ridge_loo_mse(X, y, alphas):
+    """
+    Exact leave-one-out mean squared error for every alpha from a single SVD,
+    using the hat-matrix shortcut e_loo = (y - y_hat) / (1 - h_ii).
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    alphas = np.asarray(alphas, dtype=float)
+    U, s, _, _, y_mean = _centered_svd(X, y)
+    UTy = U.T @ (y - y_mean)
+    n_samples = len(y)
+    loo_mse = np.empty(len(alphas))
+    for i, alpha in enumerate(alphas):
+        weights = s ** 2 / (s ** 2 + alpha)
+        fitted = y_mean + U @ (weights * UTy)
+        # The centered intercept adds 1/n to every leverage
+        leverage = (U ** 2) @ weights + 1.0 / n_samples
+        loo_mse[i] = np.mean(((y - fitted) / (1 - leverage)) ** 2)
+    return loo_mse
+
+
+def ridge_path_search(X, y, alphas=(0.01, 0.1, 1, 10, 100), cv=5):
+    """
+    Fast Ridge tuner: scores the whole alpha path by k-fold CV (cv=int) or exact
+    leave-one-out (cv="loo") and refits Ridge at the best alpha.
+    """
+    try:
+        alphas = list(alphas)
+        if sparse.issparse(X):
+            # The SVD path needs a dense matrix; the feature count is small, so densify once here
+            X = X.toarray()
+        start = time.perf_counter()
+        if cv == "loo":
+            loo_mse = ridge_loo_mse(X, y, alphas)
+            y_var = np.var(np.asarray(y, dtype=float))
+            mean_scores, std_scores = 1 - loo_mse / y_var, np.full(len(alphas), np.nan)
+        else:
+            mean_scores, std_scores = ridge_kfold_scores(X, y, alphas, cv=cv)
+        seconds = time.perf_counter() - start
+
+        # np.argmax returns the first maximum, the same tie-break as GridSearchCV
+        best_index = int(np.argmax(mean_scores))
+        best_params = {"alpha": alphas[best_index]}
+        best_estimator = Ridge(alpha=alphas[best_index]).fit(X, y)
+        trials = [{
+            "param_alpha": alpha,
+            "params": {"alpha": alpha},
+            "rung": 0,
+            "n_samples": len(y),
+            "mean_score": float(mean_scores[i]),
+            "std_score": float(std_scores[i]),
+            # One decomposition per fold serves every alpha, so the time is shared
+            "seconds": seconds / len(alphas),
+            "status": "ok",
+        } for i, alpha in enumerate(alphas)]
+        logger.info(f"Ridge path search ({cv}) finished in {seconds:.4f}s: best alpha {best_params['alpha']}")
+        return SearchResult(best_params, float(mean_scores[best_index]), best_estimator, trials)
+    except Exception as e:
+        raise CustomException(f"Error during Ridge path search: {e}", sys)
+
+
+def benchmark_ridge_path(X, y, alphas=(0.01, 0.1, 1, 10, 100), solvers=('auto', 'svd', 'cholesky', 'lsqr'), cv=5):
+    """Times the closed-form path against GridSearchCV over the same alphas (and solvers)."""
+    start = time.perf_counter()
+    grid_search = GridSearchCV(Ridge(), {"alpha": list(alphas), "solver": list(solvers)}, scoring="r2", cv=cv)
+    grid_search.fit(X, y)
+    grid_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = ridge_path_search(X, y, alphas, cv=cv)
+    path_seconds = time.perf_counter() - start
+
+    report = {
+        "grid_search_best_alpha": grid_search.best_params_["alpha"],
+        "grid_search_seconds": grid_seconds,
+        "ridge_path_best_alpha": result.best_params["alpha"],
+        "ridge_path_seconds": path_seconds,
+        "speedup": grid_seconds / path_seconds,
+        "same_best_alpha": grid_search.best_params_["alpha"] == result.best_params["alpha"],
+    }
+    logger.info(f"Ridge path benchmark: {report}")
+    return report
+
+
+if __name__ == "__main__":
+    X_train, y_train = load_transformed_data(os.path.join("artifacts", "transformed_train_data.npy"))
+    print(benchmark_ridge_path(X_train, y_train))
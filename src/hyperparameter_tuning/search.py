@@ -0,0 +1,133 @@
+import sys
+import math
+import time
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, ParameterSampler, cross_val_score
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.model.model_selection import halving_rungs
+
+SEARCH_STRATEGIES = ("grid", "random", "halving")
+
+
+@dataclass
+class SearchResult:
+    best_params: dict
+    best_score: float
+    best_estimator: object
+    trials: list = field(default_factory=list)
+
+    def trials_table(self):
+        """One row per evaluated trial: parameters, CV score and wall time."""
+        return pd.DataFrame(self.trials)
+
+
+def _evaluate_candidate(estimator, params, X, y, cv, scoring, rung, n_samples):
+    start = time.perf_counter()
+    try:
+        scores = cross_val_score(clone(estimator).set_params(**params), X, y, cv=cv, scoring=scoring)
+        mean_score, std_score, status = float(np.mean(scores)), float(np.std(scores)), "ok"
+    except Exception as e:
+        logger.warning(f"Trial {params} failed: {e}")
+        mean_score, std_score, status = float("nan"), float("nan"), "failed"
+    return {
+        **{f"param_{name}": value for name, value in params.items()},
+        "params": params,
+        "rung": rung,
+        "n_samples": n_samples,
+        "mean_score": mean_score,
+        "std_score": std_score,
+        "seconds": time.perf_counter() - start,
+        "status": status,
+    }
+
+
+def _run_trials(estimator, candidates, X, y, cv, scoring, n_jobs, deadline, rung=0):
+    """
+    Evaluates candidates on a joblib pool, one wave of n_jobs trials at a time, so the
+    time budget is checked between waves and no new trial starts once it is exhausted.
+    """
+    n_workers = max(1, effective_n_jobs(n_jobs))
+    trials = []
+    with Parallel(n_jobs=n_workers) as parallel:
+        for start in range(0, len(candidates), n_workers):
+            if deadline is not None and time.perf_counter() >= deadline:
+                logger.warning(f"Time budget exhausted: skipping {len(candidates) - start} remaining trials.")
+                break
+            wave = candidates[start:start + n_workers]
+            trials.extend(parallel(
+                delayed(_evaluate_candidate)(estimator, params, X, y, cv, scoring, rung, len(y))
+                for params in wave
+            ))
+    return trials
+
+
+def _best_trial(trials):
+    scored = [trial for trial in trials if not math.isnan(trial["mean_score"])]
+    if not scored:
+        raise ValueError("No trial completed successfully.")
+    # Ties go to the earliest trial, as in GridSearchCV
+    return max(scored, key=lambda trial: (trial["mean_score"], -trials.index(trial)))
+
+
+def run_search(estimator, param_space, X, y, strategy="grid", n_iter=10, cv=5, scoring="r2",
+               n_jobs=None, time_budget=None, factor=3, min_samples=None, random_state=42):
+    """
+    Hyperparameter search over param_space with a pluggable strategy.
+
+    - "grid":    every combination of param_space (lists of values).
+    - "random":  n_iter samples of param_space (lists or scipy.stats distributions).
+    - "halving": every grid combination on a small subsample, keeping the top 1/factor
+                 on factor-times larger subsamples until the full training set is reached.
+
+    Trials run on n_jobs workers; time_budget (seconds) stops dispatching new trials once
+    it is exceeded. The best candidate is refitted on the full data.
+    """
+    try:
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"Unknown search strategy '{strategy}'. Choose from {SEARCH_STRATEGIES}.")
+
+        deadline = time.perf_counter() + time_budget if time_budget else None
+        y = np.asarray(y)
+
+        if strategy == "random":
+            candidates = list(ParameterSampler(param_space, n_iter=n_iter, random_state=random_state))
+        else:
+            candidates = list(ParameterGrid(param_space))
+        logger.info(f"Starting {strategy} search over {len(candidates)} candidates (n_jobs={n_jobs}, "
+                    f"time_budget={time_budget})")
+
+        if strategy == "halving":
+            n_samples = len(y)
+            n_rungs = halving_rungs(len(candidates), factor)
+            min_samples = min_samples or max(cv * 2, n_samples // factor ** (n_rungs - 1))
+            order = np.random.RandomState(random_state).permutation(n_samples)
+            trials = []
+            for rung in range(n_rungs):
+                budget = n_samples if rung == n_rungs - 1 else min(n_samples, min_samples * factor ** rung)
+                subset = np.sort(order[:budget])
+                rung_trials = _run_trials(estimator, candidates, X[subset], y[subset], cv, scoring,
+                                          n_jobs, deadline, rung)
+                trials.extend(rung_trials)
+                if not rung_trials or len(rung_trials) < len(candidates):
+                    break
+                keep = max(1, math.ceil(len(candidates) / factor))
+                ranked = sorted(rung_trials, key=lambda trial: -np.nan_to_num(trial["mean_score"], nan=-np.inf))
+                candidates = [trial["params"] for trial in ranked[:keep]]
+            # No trials at all (budget exhausted before the first wave) leaves nothing to pick from
+            last_rung = max((trial["rung"] for trial in trials), default=None)
+            best = _best_trial([trial for trial in trials if trial["rung"] == last_rung])
+        else:
+            trials = _run_trials(estimator, candidates, X, y, cv, scoring, n_jobs, deadline)
+            best = _best_trial(trials)
+
+        best_estimator = clone(estimator).set_params(**best["params"]).fit(X, y)
+        logger.info(f"{strategy} search finished: {len(trials)} trials, best score {best['mean_score']}")
+        return SearchResult(best["params"], best["mean_score"], best_estimator, trials)
+
+    except Exception as e:
+        raise CustomException(f"Error during {strategy} search: {e}", sys)
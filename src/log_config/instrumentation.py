@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import time
+import logging
+import pstats
+import cProfile
+import inspect
+import functools
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from src.log_config.logger import logger
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack every interval seconds from a background thread
+    (py-spy style, in-process) and writes the counts as collapsed stacks ("a;b;c count"),
+    the input format of flamegraph.pl and speedscope.
+    """
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, file_path):
+        self._stop.set()
+        self._thread.join()
+        with open(file_path, "w") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(f"{sum(self.counts.values())} stack samples written to {file_path}")
+
+
+class CProfiler:
+    """cProfile of the calling thread, saved as .prof with a cumulative-time summary next to it."""
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self, file_path):
+        self.profile.disable()
+        self.profile.dump_stats(f"{file_path}.prof")
+        with open(f"{file_path}.txt", "w") as f:
+            pstats.Stats(self.profile, stream=f).sort_stats("cumulative").print_stats(30)
+        logger.info(f"cProfile output written to {file_path}.prof and {file_path}.txt")
+
+
+class Tracer:
+    """
+    Collects timed spans (wall time, CPU time, RSS delta, rows) from every thread and
+    exports them as a Chrome trace (chrome://tracing, Perfetto).
+
+    Setting profile_stage (env MLPROJECT_PROFILE_STAGE) to a span name profiles that span
+    with cProfile or the stack sampler (profile_mode, env MLPROJECT_PROFILE_MODE), writing
+    the output to profile_dir.
+    """
+    def __init__(self, max_events=100_000):
+        self.events = deque(maxlen=max_events)
+        self.thread_names = {}
+        self.origin = time.perf_counter()
+        self.profile_stage = os.environ.get("MLPROJECT_PROFILE_STAGE")
+        self.profile_mode = os.environ.get("MLPROJECT_PROFILE_MODE", "cprofile")
+        self.profile_dir = os.environ.get("MLPROJECT_PROFILE_DIR", os.path.join("artifacts", "profiles"))
+        self._lock = threading.Lock()
+
+    def record(self, event):
+        with self._lock:
+            self.events.append(event)
+            self.thread_names[event["tid"]] = threading.current_thread().name
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self.thread_names.clear()
+
+    def start_profiler(self, name):
+        if self.profile_stage != name:
+            return None
+        if self.profile_mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {self.profile_mode!r}; expected one of {PROFILE_MODES}")
+        profiler = CProfiler() if self.profile_mode == "cprofile" else StackSampler(threading.get_ident())
+        profiler.start()
+        logger.info(f"Profiling '{name}' ({self.profile_mode})")
+        return profiler
+
+    def stop_profiler(self, profiler, name):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        file_name = name.replace(os.sep, "_").replace(" ", "_")
+        if isinstance(profiler, StackSampler):
+            file_name += ".folded"
+        profiler.stop(os.path.join(self.profile_dir, file_name))
+
+    def export_chrome_trace(self, file_path):
+        """Writes the spans as complete ("X") events of the Chrome trace event format."""
+        pid = os.getpid()
+        with self._lock:
+            events, thread_names = list(self.events), dict(self.thread_names)
+        trace_events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                        for tid, name in thread_names.items()]
+        trace_events += [{"name": event["name"], "cat": event["category"], "ph": "X", "pid": pid,
+                          "tid": event["tid"], "ts": (event["start"] - self.origin) * 1e6,
+                          "dur": event["wall_seconds"] * 1e6,
+                          "args": {key: value for key, value in event.items()
+                                   if key not in ("name", "category", "tid", "start")}}
+                         for event in events]
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, default=str)
+        logger.info(f"Trace with {len(events)} spans written to {file_path}")
+
+
+# Process-wide tracer shared by every instrumented block
+tracer = Tracer()
+
+
+@contextmanager
+def span(name, category="stage", rows=None, hot_path=False, **attributes):
+    """
+    Times the enclosed block and records it on the tracer: wall time, process and thread CPU
+    time (process CPU includes native threads such as BLAS/OpenMP, but not worker processes),
+    change in resident memory and row count. Yields a dict of attributes; setting
+    attrs["rows"] inside the block fills in a count only known at the end.
+
+    hot_path=True is for per-request code such as single-record predictions: the span is
+    still recorded, but without the two RSS reads from /proc, and its summary is logged at
+    DEBUG instead of INFO.
+    """
+    from src.utils.resource_usage import current_rss_mb  # Local import: src.utils imports the model modules
+
+    attrs = {"rows": rows, **attributes}
+    profiler = tracer.start_profiler(name)
+    rss_before = None if hot_path else current_rss_mb()
+    start, cpu_start, thread_cpu_start = time.perf_counter(), time.process_time(), time.thread_time()
+    try:
+        yield attrs
+    except BaseException as e:
+        attrs["error"] = repr(e)
+        raise
+    finally:
+        wall = time.perf_counter() - start
+        cpu, thread_cpu = time.process_time() - cpu_start, time.thread_time() - thread_cpu_start
+        rss_after = None if hot_path else current_rss_mb()
+        if profiler is not None:
+            tracer.stop_profiler(profiler, name)
+        rss_delta = rss_after - rss_before if rss_after is not None and rss_before is not None else None
+        tracer.record({"name": name, "category": category, "tid": threading.get_ident(), "start": start,
+                       "wall_seconds": wall, "cpu_seconds": cpu, "thread_cpu_seconds": thread_cpu,
+                       "rss_mb": rss_after, "rss_delta_mb": rss_delta, **attrs})
+        level = logging.DEBUG if hot_path else logging.INFO
+        if logger.isEnabledFor(level):
+            details = f"cpu {cpu:.3f}s"
+            if rss_delta is not None:
+                details += f", rss {rss_delta:+.1f} MB"
+            if attrs["rows"] is not None:
+                details += f", {attrs['rows']} rows"
+            logger.log(level, f"{category} '{name}' finished in {wall:.3f}s ({details})")
+
+
+def instrumented(name=None, category="function", rows_arg=None, hot_path=False):
+    """
+    Decorator form of span. The span is named after the function unless name is given;
+    rows_arg names an argument whose length is recorded as the row count.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rows = None
+            if rows_arg is not None:
+                value = signature.bind(*args, **kwargs).arguments.get(rows_arg)
+                rows = value.shape[0] if hasattr(value, "shape") else len(value) if value is not None else None
+            with span(span_name, category=category, rows=rows, hot_path=hot_path):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -31,40 +31,53 @@ logging.basicConfig(
 logger = logging.getLogger("MLProjectLogger")
 
 # Import other modules
-from exceptions.exceptions import CustomException  
-from data_ingestion import load_data
-from data_transformation import transform_data
-from hyperparameter_tuning import tune_parameters
-from model.train_model import train
-from model.model_evaluation import evaluate
-from model.feature_importance import calculate
-from api.app import run
+from src.exceptions.exceptions import CustomException
+from src.pipeline.dag import Pipeline
+from src.pipeline.stages import build_stages
+from src.log_config.instrumentation import tracer, PROFILE_MODES
 
 
-def main():
-    """Main function to execute the application flow."""
+def main(force=False, only=None, n_jobs=1, selection="exhaustive", search="grid", serve=False, max_workers=1,
+         sparse_output=False, profile_stage=None, profile_mode="cprofile"):
+    """
+    Main function to execute the application flow.
+    Stages whose inputs, parameters and code are unchanged since the last run are skipped;
+    with max_workers > 1, independent stages (e.g. evaluate and tune) run concurrently.
+    profile_stage names a stage (or span, e.g. "Ridge.fit") to profile with profile_mode.
+    """
     try:
-        # Example usage of the imported modules
         logger.info("Starting the application workflow.")
-        load_data()
-        transform_data()
-        tune_parameters()
-        train()
-        evaluate()
-        calculate()
-        run()
+        if profile_stage:
+            tracer.profile_stage, tracer.profile_mode = profile_stage, profile_mode
+        pipeline = Pipeline(build_stages(n_jobs=n_jobs, selection=selection, search=search,
+                                         sparse_output=sparse_output))
+        pipeline.run(force=force, only=only, max_workers=max_workers)
+        if serve:
+            from src.api.app import run
+            run()
         logger.info("Application workflow completed successfully.")
     except Exception as e:
         raise CustomException(e, sys)
 
 
 if __name__ == "__main__":
-    # Run the main application
-    main()
+    import argparse
 
-    # Additional logging examples
-    logger.info("Logging has been started.")
-    logger.warning("Logging warning: look at it.")
-    logger.error("Logging error: please fix it.")
-    logger.critical("Logging critical message: the serious message.")
+    parser = argparse.ArgumentParser(description="Run the training pipeline.")
+    parser.add_argument("--force", action="store_true", help="Re-run every stage, ignoring the stage cache.")
+    parser.add_argument("--only", nargs="+", help="Run only these stages (plus anything upstream of them).")
+    parser.add_argument("--n-jobs", type=int, default=1)
+    parser.add_argument("--max-workers", type=int, default=1, help="Number of stages that may run concurrently.")
+    parser.add_argument("--selection", choices=["exhaustive", "halving"], default="exhaustive")
+    parser.add_argument("--search", choices=["grid", "random", "halving", "ridge_path"], default="grid")
+    parser.add_argument("--sparse", action="store_true", help="Keep one-hot features sparse (CSR) end to end.")
+    parser.add_argument("--serve", action="store_true", help="Start the prediction API after the pipeline.")
+    parser.add_argument("--profile-stage", help="Profile this stage or span (e.g. evaluate, Ridge.fit).")
+    parser.add_argument("--profile-mode", choices=PROFILE_MODES, default="cprofile",
+                        help="cProfile, or sampling of the stage's Python stack (collapsed-stack output).")
+    args = parser.parse_args()
 
+    # Run the main application
+    main(force=args.force, only=args.only, n_jobs=args.n_jobs, selection=args.selection,
+         search=args.search, serve=args.serve, max_workers=args.max_workers, sparse_output=args.sparse,
+         profile_stage=args.profile_stage, profile_mode=args.profile_mode)
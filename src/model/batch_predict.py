@@ -0,0 +1,199 @@
+import io
+import os
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.data_ingestion.schema import read_students_csv
+from src.data_transformation.compiled_preprocessor import compile_preprocessor
+from src.utils.artifact_cache import load_cached_object
+from src.model.native_models import predict_batch
+
+PREDICTION_COLUMN = "Predicted Values"
+
+# Per-process scoring state, filled once by _init_worker
+_worker_state = {}
+
+
+def _init_worker(model_path, preprocessor_path):
+    """Loads the model and preprocessor once per worker process."""
+    preprocessor = load_cached_object(preprocessor_path)
+    try:
+        preprocessor = compile_preprocessor(preprocessor)
+    except ValueError as e:
+        logger.warning(f"Preprocessor could not be compiled ({e}); using it as is.")
+    _worker_state["preprocessor"] = preprocessor
+    _worker_state["model"] = load_cached_object(model_path)
+
+
+def _score_chunk(chunk):
+    return predict_batch(_worker_state["model"], _worker_state["preprocessor"].transform(chunk))
+
+
+def _fingerprint(file_path):
+    stat = os.stat(file_path)
+    return {"path": os.path.abspath(file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_checkpoint(checkpoint_path, expected):
+    """The saved progress if it belongs to the same input, model and chunking; otherwise None."""
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+    if {key: checkpoint.get(key) for key in expected} != expected or "input_bytes" not in checkpoint:
+        logger.warning(f"Checkpoint {checkpoint_path} is for a different input or model; starting over.")
+        return None
+    return checkpoint
+
+
+def _write_checkpoint(checkpoint_path, checkpoint):
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _read_record(handle):
+    """
+    The next CSV record as bytes (b"" at end of file). A line ending inside a quoted field
+    does not end the record: a record is complete once it contains an even number of quotes.
+    """
+    record = handle.readline()
+    while record.count(b'"') % 2 and record.endswith(b"\n"):
+        line = handle.readline()
+        if not line:
+            break
+        record += line
+    return record
+
+
+def _record_chunks(handle, chunksize):
+    """Yields (bytes of up to chunksize records, byte offset just after them) from handle's position."""
+    while True:
+        records = []
+        for _ in range(chunksize):
+            record = _read_record(handle)
+            if not record:
+                break
+            records.append(record)
+        if not records:
+            return
+        yield b"".join(records), handle.tell()
+        if len(records) < chunksize:
+            return
+
+
+def _parse_chunks(handle, chunksize, columns):
+    """Typed DataFrames of up to chunksize records, each with the input offset just after it."""
+    for data, end in _record_chunks(handle, chunksize):
+        chunk = read_students_csv(io.BytesIO(data), header=None, names=columns)
+        if len(chunk):  # e.g. only blank lines left
+            yield chunk, end
+
+
+def score_file(input_path, output_path, model_path, preprocessor_path, chunksize=100_000, n_workers=None,
+               resume=True, checkpoint_path=None):
+    """
+    Scores a CSV too large for memory and writes one prediction per input row, in input order.
+
+    The input is streamed in chunks of chunksize rows with the typed schema. Chunks are scored
+    on n_workers processes that each load the model once (n_workers=1 scores in-process),
+    with at most 2 * n_workers chunks in flight, and appended to output_path as soon as all
+    earlier chunks are written. After every chunk a checkpoint records the rows and output
+    bytes written and the input byte offset of the next unread record; with resume=True a
+    rerun for the same input and model truncates any partial write and seeks the input
+    straight to that offset. Returns rows, seconds and rows/sec.
+    """
+    try:
+        checkpoint_path = checkpoint_path or f"{output_path}.checkpoint.json"
+        n_workers = n_workers or os.cpu_count() or 1
+        expected = {"input": _fingerprint(input_path), "model": _fingerprint(model_path),
+                    "preprocessor": _fingerprint(preprocessor_path), "chunksize": chunksize}
+        checkpoint = _load_checkpoint(checkpoint_path, expected) if resume else None
+        if checkpoint is None or not os.path.exists(output_path):
+            checkpoint = {**expected, "chunks_done": 0, "rows_done": 0, "output_bytes": 0, "input_bytes": None}
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        resumed_rows = checkpoint["rows_done"]
+        if resumed_rows:
+            logger.info(f"Resuming batch scoring of {input_path} after {resumed_rows} rows "
+                        f"(input byte {checkpoint['input_bytes']})")
+
+        start = time.perf_counter()
+        with open(input_path, "rb") as source, \
+                open(output_path, "r+b" if checkpoint["output_bytes"] else "wb") as output:
+            columns = pd.read_csv(io.BytesIO(_read_record(source)), nrows=0).columns.tolist()
+            if checkpoint["input_bytes"] is not None:
+                source.seek(checkpoint["input_bytes"])
+            # Records are split off before parsing, so the input offset after each chunk is exact
+            chunks = _parse_chunks(source, chunksize, columns)
+
+            # Drop anything written after the last checkpoint (e.g. a chunk cut off by a crash)
+            output.truncate(checkpoint["output_bytes"])
+            output.seek(checkpoint["output_bytes"])
+
+            def write(predictions, input_bytes):
+                frame = pd.DataFrame({PREDICTION_COLUMN: predictions})
+                output.write(frame.to_csv(index=False, header=checkpoint["output_bytes"] == 0).encode())
+                output.flush()
+                os.fsync(output.fileno())
+                checkpoint["chunks_done"] += 1
+                checkpoint["rows_done"] += len(predictions)
+                checkpoint["output_bytes"] = output.tell()
+                checkpoint["input_bytes"] = input_bytes
+                _write_checkpoint(checkpoint_path, checkpoint)
+
+            if n_workers == 1:
+                _init_worker(model_path, preprocessor_path)
+                for chunk, input_bytes in chunks:
+                    write(_score_chunk(chunk), input_bytes)
+            else:
+                with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                         initargs=(model_path, preprocessor_path)) as executor:
+                    # Futures complete out of order; writing from the head of the queue keeps input order
+                    pending = deque()
+                    for chunk, input_bytes in chunks:
+                        pending.append((executor.submit(_score_chunk, chunk), input_bytes))
+                        if len(pending) >= 2 * n_workers:
+                            future, input_bytes = pending.popleft()
+                            write(future.result(), input_bytes)
+                    while pending:
+                        future, input_bytes = pending.popleft()
+                        write(future.result(), input_bytes)
+
+        seconds = time.perf_counter() - start
+        rows = checkpoint["rows_done"] - resumed_rows
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        report = {"rows": rows, "total_rows": checkpoint["rows_done"], "resumed_from": resumed_rows,
+                  "seconds": seconds, "rows_per_sec": rows / seconds if seconds else float("nan"),
+                  "workers": n_workers}
+        logger.info(f"Batch scoring of {input_path} finished: {report}")
+        return report
+    except Exception as e:
+        raise CustomException(f"Error during batch scoring: {e}", sys)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a large CSV in chunks on a pool of worker processes.")
+    parser.add_argument("--input", default=os.path.join("data", "cleaned", "cleaned_students.csv"))
+    parser.add_argument("--output", default=os.path.join("artifacts", "predictions.csv"))
+    parser.add_argument("--model", default=os.path.join("artifacts", "best_model.pkl"))
+    parser.add_argument("--preprocessor", default=os.path.join("artifacts", "preprocessor.pkl"))
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-resume", action="store_true", help="Ignore any checkpoint and start from scratch.")
+    args = parser.parse_args()
+
+    print(score_file(args.input, args.output, args.model, args.preprocessor, chunksize=args.chunksize,
+                     n_workers=args.workers, resume=not args.no_resume))
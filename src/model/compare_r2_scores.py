@@ -1,49 +1,114 @@
 import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
 from src.log_config.logger import logger
-from src.model.predict import make_predictions
-from sklearn.metrics import r2_score
+from src.exceptions.exceptions import CustomException
+from src.data_ingestion.schema import read_students_csv
+from src.utils.artifact_cache import load_cached_object
+from src.model.native_models import predict_batch
 
-def compare_r2_scores():
-    try:
-        # Paths for models and preprocessor
-        model_path_before_tuning = os.path.join("artifacts", "best_model.pkl")
-        model_path_after_tuning = os.path.join("artifacts", "tuned_model.pkl")
-        preprocessor_path = os.path.join("artifacts", "preprocessor.pkl")
-        
-        # Read the data
-        new_data_path = os.path.join("data", "cleaned", "cleaned_students.csv")
-        new_data = pd.read_csv(new_data_path)
-
-        # Make predictions for the original model
-        logger.info("Making predictions using the original model...")
-        predictions_before_tuning = make_predictions(new_data, model_path_before_tuning, preprocessor_path)
-        
-        # Make predictions for the tuned model
-        logger.info("Making predictions using the tuned model...")
-        predictions_after_tuning = make_predictions(new_data, model_path_after_tuning, preprocessor_path)
-
-        # Actual values (target) - Adjust this to your dataset
-        y_actual = new_data["math_score"]  # Replace with the actual column name
-
-        # Calculate R2 scores for both models
-        r2_before = r2_score(y_actual, predictions_before_tuning)
-        r2_after = r2_score(y_actual, predictions_after_tuning)
-
-        # Logging the R2 scores
-        logger.info(f"R2 Score before tuning: {r2_before}")
-        logger.info(f"R2 Score after tuning: {r2_after}")
-
-        # Compare and save results
-        with open(os.path.join("artifacts", "r2_comparison.txt"), "w") as file:
-            file.write(f"R2 Score before tuning: {r2_before}\n")
-            file.write(f"R2 Score after tuning: {r2_after}\n")
-
-        logger.info("R2 comparison saved successfully.")
+DEFAULT_MODEL_PATHS = {
+    "before_tuning": os.path.join("artifacts", "best_model.pkl"),
+    "after_tuning": os.path.join("artifacts", "tuned_model.pkl"),
+}
+LEADERBOARD_JSON_PATH = os.path.join("artifacts", "model_leaderboard.json")
+LEADERBOARD_CSV_PATH = os.path.join("artifacts", "model_leaderboard.csv")
+
+
+def regression_metrics(y_true, predictions):
+    """
+    R2, MAE and RMSE of every row of predictions (n_models x n_samples) against y_true,
+    computed together in float64 from one residual matrix.
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuals = np.asarray(predictions, dtype=np.float64) - y_true[None, :]
+    squared_error = np.einsum("ij,ij->i", residuals, residuals)
+    total = np.sum((y_true - y_true.mean()) ** 2)
+    return {
+        "r2": 1 - squared_error / total,
+        "mae": np.abs(residuals).mean(axis=1),
+        "rmse": np.sqrt(squared_error / len(y_true)),
+    }
+
+
+def _predict(name, model_path, X):
+    start = time.perf_counter()
+    predictions = predict_batch(load_cached_object(model_path), X)
+    return name, predictions, time.perf_counter() - start
+
+
+def compare_models(data_path, model_paths, preprocessor_path, n_jobs=1, target_column="math_score"):
+    """
+    Transforms data_path once with the preprocessor, scores every model in model_paths
+    ({name: path}) on the shared matrix (on n_jobs threads) and returns a leaderboard
+    DataFrame sorted by R2 plus run metadata.
+    """
+    data = read_students_csv(data_path)
+    y_true = data[target_column].to_numpy()
 
+    start = time.perf_counter()
+    X = load_cached_object(preprocessor_path).transform(data.drop(columns=[target_column]))
+    transform_seconds = time.perf_counter() - start
+    logger.info(f"Transformed {X.shape[0]} rows once in {transform_seconds:.3f}s")
+
+    results = Parallel(n_jobs=n_jobs, backend="threading")(
+        delayed(_predict)(name, path, X) for name, path in model_paths.items()
+    )
+    names = [name for name, _, _ in results]
+    metrics = regression_metrics(y_true, np.vstack([predictions for _, predictions, _ in results]))
+
+    leaderboard = pd.DataFrame({
+        "model": names,
+        "path": [model_paths[name] for name in names],
+        **metrics,
+        "predict_seconds": [seconds for _, _, seconds in results],
+    }).sort_values("r2", ascending=False, kind="stable").reset_index(drop=True)
+    leaderboard.insert(0, "rank", np.arange(1, len(leaderboard) + 1))
+    metadata = {"data_path": data_path, "n_rows": int(len(y_true)), "transform_seconds": transform_seconds}
+    return leaderboard, metadata
+
+
+def save_leaderboard(leaderboard, metadata, json_path=LEADERBOARD_JSON_PATH, csv_path=LEADERBOARD_CSV_PATH):
+    os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+    with open(json_path, "w") as f:
+        json.dump({**metadata, "models": leaderboard.to_dict(orient="records")}, f, indent=2)
+    leaderboard.to_csv(csv_path, index=False)
+    logger.info(f"Model leaderboard saved to {json_path} and {csv_path}")
+
+
+def compare_r2_scores(model_paths=None, data_path=os.path.join("data", "cleaned", "cleaned_students.csv"),
+                      preprocessor_path=os.path.join("artifacts", "preprocessor.pkl"), n_jobs=1,
+                      json_path=LEADERBOARD_JSON_PATH, csv_path=LEADERBOARD_CSV_PATH):
+    """Compares the models before and after tuning (or any model_paths) and writes the leaderboard."""
+    try:
+        model_paths = model_paths or DEFAULT_MODEL_PATHS
+        leaderboard, metadata = compare_models(data_path, model_paths, preprocessor_path, n_jobs=n_jobs)
+        for row in leaderboard.itertuples():
+            logger.info(f"#{row.rank} {row.model}: R2 {row.r2:.6f}, MAE {row.mae:.4f}, RMSE {row.rmse:.4f}")
+        save_leaderboard(leaderboard, metadata, json_path, csv_path)
+        return leaderboard
     except Exception as e:
         logger.error(f"Error in comparing R2 scores: {e}")
+        raise CustomException(f"Error in comparing R2 scores: {e}", sys)
+
 
 # Call the comparison function
 if __name__ == "__main__":
-    compare_r2_scores()
+    parser = argparse.ArgumentParser(description="Score model artifacts on shared transformed data.")
+    parser.add_argument("--models", nargs="+", metavar="NAME=PATH",
+                        help="Models to compare (default: best_model.pkl before and tuned_model.pkl after tuning).")
+    parser.add_argument("--data", default=os.path.join("data", "cleaned", "cleaned_students.csv"))
+    parser.add_argument("--n-jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    model_paths = dict(spec.split("=", 1) for spec in args.models) if args.models else None
+    print(compare_r2_scores(model_paths, data_path=args.data, n_jobs=args.n_jobs))
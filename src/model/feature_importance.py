@@ -1,16 +1,15 @@
 import os
-import pickle
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import sys
 from src.log_config.logger import logger
 from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import load_artifact
 
 # Load model
 def load_model(file_path):
     try:
-        with open(file_path, 'rb') as f:
-            model = pickle.load(f)
+        model = load_artifact(file_path)
         logger.info(f"Model loaded successfully from {file_path}")
         return model
     except Exception as e:
@@ -20,8 +19,7 @@ def load_model(file_path):
 # Load preprocessor
 def load_preprocessor(file_path):
     try:
-        with open(file_path, 'rb') as f:
-            preprocessor = pickle.load(f)
+        preprocessor = load_artifact(file_path)
         logger.info(f"Preprocessor loaded successfully from {file_path}")
         return preprocessor
     except Exception as e:
@@ -38,18 +36,21 @@ def plot_ridge_coefficients(model, feature_names, save_path):
             if len(coefficients) != len(feature_names):
                 raise ValueError(f"Mismatch: {len(coefficients)} coefficients and {len(feature_names)} features.")
 
-            plt.figure(figsize=(10, 6))
-            plt.bar(range(len(coefficients)), coefficients, align="center")
-            plt.xticks(range(len(coefficients)), feature_names, rotation=90)
-            plt.title("Feature Importances (Coefficients)")
-            plt.xlabel("Features")
-            plt.ylabel("Coefficient Value")
-            plt.tight_layout()
+            # A standalone Figure (no pyplot) needs no GUI backend and keeps no global state,
+            # so the plot is safe off the main thread, e.g. in a parallel pipeline run
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            ax.bar(range(len(coefficients)), coefficients, align="center")
+            ax.set_xticks(range(len(coefficients)))
+            ax.set_xticklabels(feature_names, rotation=90)
+            ax.set_title("Feature Importances (Coefficients)")
+            ax.set_xlabel("Features")
+            ax.set_ylabel("Coefficient Value")
+            fig.tight_layout()
 
             # Save the plot
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
+            fig.savefig(save_path)
             logger.info(f"Feature importance plot saved at {save_path}")
         else:
             logger.info("Feature importance not available for this model.")
@@ -57,29 +58,29 @@ def plot_ridge_coefficients(model, feature_names, save_path):
         logger.error(f"Error plotting feature importance: {e}")
         raise CustomException(f"Error plotting feature importance: {e}", sys)
 
-if __name__ == "__main__":
-    try:
-        logger.info("Starting feature importance visualization...")
-        model_path = os.path.join("artifacts", "best_model.pkl")
-        preprocessor_path = os.path.join("artifacts", "preprocessor.pkl")
-        feature_importance_path = os.path.join("artifacts", "feature_importance.png")
+def calculate_feature_importance(model_path=os.path.join("artifacts", "best_model.pkl"),
+                                 preprocessor_path=os.path.join("artifacts", "preprocessor.pkl"),
+                                 feature_importance_path=os.path.join("artifacts", "feature_importance.png")):
+    """Loads the model and preprocessor and saves the coefficient plot."""
+    # Load the model and preprocessor
+    best_model = load_model(model_path)
+    preprocessor = load_preprocessor(preprocessor_path)
 
-        # Load the model and preprocessor
-        best_model = load_model(model_path)
-        preprocessor = load_preprocessor(preprocessor_path)
+    # Extract feature names from the preprocessor
+    numeric_features = ["writing_score", "reading_score"]
+    categorical_features = [
+        "gender", "race_ethnicity", "parental_level_of_education", "lunch", "test_preparation_course"
+    ]
+    one_hot_encoded_features = preprocessor.named_transformers_["cat_pipeline"]["one_hot_encoder"].get_feature_names_out(categorical_features)
+    feature_names = np.hstack([numeric_features, one_hot_encoded_features])
 
-        # Extract feature names from the preprocessor
-        numeric_features = ["writing_score", "reading_score"]
-        categorical_features = [
-            "gender", "race_ethnicity", "parental_level_of_education", "lunch", "test_preparation_course"
-        ]
-        one_hot_encoded_features = preprocessor.named_transformers_["cat_pipeline"]["one_hot_encoder"].get_feature_names_out(categorical_features)
-        feature_names = np.hstack([numeric_features, one_hot_encoded_features])
+    # Plot Ridge coefficients as feature importance
+    plot_ridge_coefficients(best_model, feature_names, feature_importance_path)
+    return feature_importance_path
 
-        # Plot Ridge coefficients as feature importance
-        plot_ridge_coefficients(best_model, feature_names, feature_importance_path)
+if __name__ == "__main__":
+    try:
+        logger.info("Starting feature importance visualization...")
+        calculate_feature_importance()
     except Exception as e:
         logger.error(f"Feature importance visualization failed: {e}")
-
-
-        
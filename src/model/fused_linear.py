@@ -0,0 +1,186 @@
+import os
+import sys
+import json
+import argparse
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.data_transformation.compiled_preprocessor import compile_preprocessor, DICT_LOOKUP_MAX_ROWS
+from src.utils.artifact_cache import load_cached_object
+
+
+def is_linear_model(model):
+    """True for fitted single-output sklearn linear models (Ridge, Lasso, LinearRegression, ...)."""
+    coef = getattr(model, "coef_", None)
+    return (type(model).__module__.startswith("sklearn.linear_model") and coef is not None
+            and np.ndim(coef) == 1 and np.ndim(getattr(model, "intercept_", None)) == 0)
+
+
+class FusedLinearScorer:
+    """
+    A preprocessor and a linear model folded into one set of weights over the raw inputs:
+    prediction = intercept + sum(numeric_weights * raw numeric values)
+                 + sum over categorical columns of the weight of the row's category.
+    Missing values use the preprocessor's fill values; unknown categories contribute 0.
+    """
+    def __init__(self, numeric_columns, numeric_fill, numeric_weights, categorical_columns,
+                 categorical_fill, category_weights, intercept):
+        self.numeric_columns = list(numeric_columns)
+        self.numeric_fill = np.asarray(numeric_fill, dtype=np.float64)
+        self.numeric_weights = np.asarray(numeric_weights, dtype=np.float64)
+        self.categorical_columns = list(categorical_columns)
+        self.categorical_fill = list(categorical_fill)
+        self.category_weights = [dict(weights) for weights in category_weights]
+        self.intercept = float(intercept)
+        self.category_indexes = [pd.Index(list(weights)) for weights in self.category_weights]
+        # Trailing 0 so that get_indexer's -1 (unknown category) gathers a zero weight
+        self.weight_tables = [np.append(np.fromiter(weights.values(), dtype=np.float64, count=len(weights)), 0.0)
+                              for weights in self.category_weights]
+
+    def _column(self, data, col):
+        if isinstance(data, pd.DataFrame):
+            return data[col].to_numpy()
+        return np.array([record.get(col) for record in data], dtype=object)
+
+    def _category_scores(self, values, j):
+        weights = self.category_weights[j]
+        if len(values) <= DICT_LOOKUP_MAX_ROWS:
+            scores = np.fromiter((weights.get(value, 0.0) for value in values), dtype=np.float64, count=len(values))
+            misses = np.flatnonzero(scores == 0.0)
+        else:
+            positions = self.category_indexes[j].get_indexer(values)
+            scores = self.weight_tables[j][positions]
+            misses = np.flatnonzero(positions < 0)
+        if len(misses):
+            # Only NaN is imputed (as SimpleImputer does); anything else unknown scores 0
+            missed = values[misses]
+            scores[misses[missed != missed]] = weights.get(self.categorical_fill[j], 0.0)
+        return scores
+
+    def predict(self, data):
+        """Scores a DataFrame, a single record (dict) or a list of records."""
+        if isinstance(data, Mapping):
+            data = [data]
+        numeric = np.empty((len(data), len(self.numeric_columns)), dtype=np.float64)
+        for j, col in enumerate(self.numeric_columns):
+            numeric[:, j] = pd.to_numeric(self._column(data, col), errors="coerce")
+        missing = np.isnan(numeric)
+        if missing.any():
+            numeric[missing] = np.broadcast_to(self.numeric_fill, numeric.shape)[missing]
+        predictions = numeric @ self.numeric_weights + self.intercept
+        for j, col in enumerate(self.categorical_columns):
+            predictions += self._category_scores(self._column(data, col), j)
+        return predictions
+
+    def to_dict(self):
+        return {
+            "numeric_columns": self.numeric_columns,
+            "numeric_fill": self.numeric_fill.tolist(),
+            "numeric_weights": self.numeric_weights.tolist(),
+            "categorical_columns": self.categorical_columns,
+            "categorical_fill": self.categorical_fill,
+            "category_weights": self.category_weights,
+            "intercept": self.intercept,
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        return cls(**payload)
+
+
+def fuse_linear_model(preprocessor, model):
+    """
+    Folds the fitted preprocessor's standardization and one-hot encoding into the linear
+    model's coefficients. Raises ValueError if the model is not linear or the preprocessor
+    cannot be compiled.
+    """
+    if not is_linear_model(model):
+        raise ValueError(f"{type(model).__name__} is not a single-output linear model")
+    compiled = compile_preprocessor(preprocessor)
+    if compiled.handle_unknown != "ignore":
+        raise ValueError("Only preprocessors that ignore unknown categories can be fused")
+    coef = np.asarray(model.coef_, dtype=np.float64)
+    if len(coef) != compiled.n_features_out:
+        raise ValueError(f"Model expects {len(coef)} features, preprocessor produces {compiled.n_features_out}")
+
+    n_numeric = len(compiled.numeric_columns)
+    numeric_coef, categorical_coef = coef[:n_numeric], coef[n_numeric:]
+    # w * (x - mean) / scale == (w / scale) * x - w * mean / scale
+    numeric_weights = numeric_coef / compiled.numeric_scale
+    intercept = float(model.intercept_) - numeric_weights @ compiled.numeric_mean
+    # Every one-hot column contributes its "cold" value unless the row's category makes it hot
+    intercept += categorical_coef @ compiled.cold_values
+    hot_gain = categorical_coef * (compiled.hot_values - compiled.cold_values)
+    category_weights = [{category: float(hot_gain[index]) for category, index in mapping.items()}
+                        for mapping in compiled.category_maps]
+
+    return FusedLinearScorer(
+        compiled.numeric_columns, compiled.numeric_fill, numeric_weights,
+        compiled.categorical_columns, compiled.categorical_fill, category_weights, intercept
+    )
+
+
+def export_fused_model(model_path, preprocessor_path, output_path):
+    """Writes the fused scorer for a linear model as a small JSON artifact."""
+    try:
+        scorer = fuse_linear_model(load_cached_object(preprocessor_path), load_cached_object(model_path))
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(scorer.to_dict(), f, indent=2)
+        os.replace(tmp_path, output_path)
+        logger.info(f"Fused linear scorer for {model_path} saved to {output_path}")
+        return scorer
+    except Exception as e:
+        raise CustomException(f"Error exporting fused linear model: {e}", sys)
+
+
+def load_fused_model(file_path):
+    with open(file_path) as f:
+        return FusedLinearScorer.from_dict(json.load(f))
+
+
+def check_parity(input_data, fused_path, model_path, preprocessor_path, rtol=None):
+    """
+    Compares the fused scorer with make_predictions on input_data (a DataFrame). Folding the
+    scaler into the weights reorders floating-point operations, and the fused scorer always
+    works in float64, so predictions agree to the rounding of the preprocessor's output dtype
+    (rtol defaults to 10 eps of that dtype), not bitwise. Returns the largest absolute
+    difference and raises AssertionError above the tolerance.
+    """
+    from src.model.predict import make_predictions
+
+    expected = make_predictions(input_data, model_path, preprocessor_path)
+    actual = load_fused_model(fused_path).predict(input_data)
+    if rtol is None:
+        feature_dtype = load_cached_object(preprocessor_path).transform(input_data.iloc[:1]).dtype
+        rtol = 10 * np.finfo(feature_dtype).eps
+    max_abs_diff = float(np.max(np.abs(expected - actual))) if len(expected) else 0.0
+    if not np.allclose(expected, actual, rtol=rtol, atol=0):
+        raise AssertionError(f"Fused scorer differs from make_predictions by up to {max_abs_diff}")
+    logger.info(f"Fused scorer matches make_predictions on {len(expected)} rows (max |diff| {max_abs_diff:.3g})")
+    return max_abs_diff
+
+
+if __name__ == "__main__":
+    from src.data_ingestion.schema import read_students_csv
+    parser = argparse.ArgumentParser(description="Fuse the preprocessor and a linear model into one scoring artifact.")
+    parser.add_argument("--model", default=os.path.join("artifacts", "best_model.pkl"))
+    parser.add_argument("--preprocessor", default=os.path.join("artifacts", "preprocessor.pkl"))
+    parser.add_argument("--output", default=None, help="Defaults to artifacts/fused_<model name>.json")
+    parser.add_argument("--check", default=os.path.join("data", "cleaned", "test.csv"),
+                        help="CSV used for the parity check against make_predictions.")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(
+        os.path.dirname(args.model), f"fused_{os.path.splitext(os.path.basename(args.model))[0]}.json"
+    )
+    export_fused_model(args.model, args.preprocessor, output)
+    data = read_students_csv(args.check).drop(columns=["math_score"], errors="ignore")
+    print(f"max |fused - make_predictions| = {check_parity(data, output, args.model, args.preprocessor):.3g}")
@@ -6,7 +6,10 @@ from sklearn.tree import DecisionTreeRegressor
 from sklearn.ensemble import RandomForestRegressor, AdaBoostRegressor
 from xgboost import XGBRegressor
 from catboost import CatBoostRegressor
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
 from src.log_config.logger import logger  # Global import for logger
+from src.log_config.instrumentation import span
 import sys
 import os
 
@@ -34,46 +37,99 @@ def evaluate_model(model, X_test, y_test):
         raise CustomException("Error in model evaluation.", sys)
 
 
-def evaluate_regression_models(X_train, y_train, X_test, y_test):
+def get_regression_models(n_threads=None, random_state=42):
+    """
+    Returns the candidate regressors keyed by display name. All of them accept sparse (CSR)
+    features; a model that needs dense input must not be added without densifying for it.
+    n_threads caps the native thread pool of the multi-threaded models (None keeps library defaults).
+    """
+    return {
+        "Linear Regression": LinearRegression(),
+        "Lasso": Lasso(),
+        "Ridge": Ridge(),
+        "K-Neighbors Regressor": KNeighborsRegressor(n_jobs=n_threads),
+        "Decision Tree": DecisionTreeRegressor(random_state=random_state),
+        "Random Forest Regressor": RandomForestRegressor(n_jobs=n_threads, random_state=random_state),
+        "XGBRegressor": XGBRegressor(n_jobs=n_threads, random_state=random_state),
+        "CatBoost Regressor": CatBoostRegressor(verbose=False, thread_count=n_threads or -1, random_seed=random_state),
+        "AdaBoost Regressor": AdaBoostRegressor(random_state=random_state)
+    }
+
+
+def fit_and_evaluate_model(model_name, model, X_train, y_train, X_test, y_test):
+    """
+    Fits one model and scores it on the test set.
+    """
+    logger.info(f"Training model: {model_name}")
+    with span(f"{model_name}.fit", category="fit", rows=X_train.shape[0]):
+        model.fit(X_train, y_train)
+    with span(f"{model_name}.predict", category="predict", rows=X_test.shape[0]):
+        mae, rmse, r2_score_value = evaluate_model(model, X_test, y_test)
+    logger.info("=" * 35)
+    return model_name, model, (mae, rmse, r2_score_value)
+
+
+def evaluate_regression_models(X_train, y_train, X_test, y_test, n_jobs=1, backend="threading",
+                               selection="exhaustive", compare_exhaustive=False):
     """
     Trains and evaluates multiple regression models and logs their performance.
+
+    selection="halving" uses successive halving (see src.model.model_selection) instead of
+    fitting every candidate on the full training set; compare_exhaustive=True additionally
+    runs the exhaustive loop so the saved report shows the time saved and whether the
+    selected model matches.
+
+    With n_jobs != 1 the candidates are fitted concurrently on a joblib pool ("threading" or
+    "loky" backend) and the available cores are split evenly between the running models.
+    The best model is picked from the results in the same order as the sequential loop, so
+    both modes select the same model.
     """
     from src.utils.common_utils import save_object, CustomException  # Local imports for circular import handling
     try:
-        models = {
-            "Linear Regression": LinearRegression(),
-            "Lasso": Lasso(),
-            "Ridge": Ridge(),
-            "K-Neighbors Regressor": KNeighborsRegressor(),
-            "Decision Tree": DecisionTreeRegressor(),
-            "Random Forest Regressor": RandomForestRegressor(),
-            "XGBRegressor": XGBRegressor(),
-            "CatBoost Regressor": CatBoostRegressor(verbose=False),
-            "AdaBoost Regressor": AdaBoostRegressor()
-        }
+        if selection == "halving":
+            from src.model.model_selection import successive_halving_selection, save_selection_report
+            best_model_name, best_model, best_r2_score, report = successive_halving_selection(
+                X_train, y_train, X_test, y_test, compare_exhaustive=compare_exhaustive
+            )
+            save_selection_report(report)
+            results = [(best_model_name, best_model, (None, None, best_r2_score))]
+        elif n_jobs == 1:
+            models = get_regression_models()
+            results = [
+                fit_and_evaluate_model(model_name, model, X_train, y_train, X_test, y_test)
+                for model_name, model in models.items()
+            ]
+        else:
+            cpu_count = os.cpu_count() or 1
+            n_workers = cpu_count if n_jobs in (None, -1) else n_jobs
+            n_workers = max(1, min(n_workers, len(get_regression_models())))
+            threads_per_model = max(1, cpu_count // n_workers)
+            models = get_regression_models(n_threads=threads_per_model)
+            logger.info(f"Evaluating {len(models)} models on {n_workers} workers "
+                        f"({threads_per_model} threads per model, backend={backend})")
+            # threadpool_limits is process-wide, so it is applied once around the pool rather than per fit:
+            # threading workers share this cap, loky workers get the same cap from joblib, and the
+            # multi-threaded models use threads_per_model through their own n_jobs/thread_count
+            with threadpool_limits(limits=threads_per_model):
+                results = Parallel(n_jobs=n_workers, backend=backend)(
+                    delayed(fit_and_evaluate_model)(model_name, model, X_train, y_train, X_test, y_test)
+                    for model_name, model in models.items()
+                )
 
         best_model = None
         best_r2_score = float("-inf")
         best_model_name = None
 
-        for model_name, model in models.items():
-            logger.info(f"Training model: {model_name}")
-            model.fit(X_train, y_train)
-
-            # Evaluate the model
-            mae, rmse, r2_score_value = evaluate_model(model, X_test, y_test)
-
+        for model_name, model, (mae, rmse, r2_score_value) in results:
             # Update the best model if current model has a better R2 score
             if r2_score_value > best_r2_score:
                 best_r2_score = r2_score_value
                 best_model = model
                 best_model_name = model_name
 
-            logger.info("=" * 35)
-
-        # Save the best model
+        # Save the best model (XGBoost and CatBoost winners in their native format)
         best_model_path = os.path.join("artifacts", "best_model.pkl")
-        save_object(best_model_path, best_model)
+        save_object(best_model_path, best_model, metadata={"model_name": best_model_name, "r2": float(best_r2_score)})
         logger.info(f"Best Model: {best_model_name} with R2 Score: {best_r2_score}")
         logger.info(f"Best Model saved at: {best_model_path}")
 
@@ -0,0 +1,179 @@
+import os
+import sys
+import json
+import uuid
+import shutil
+import argparse
+from datetime import datetime, timezone
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import file_sha256, load_artifact, read_artifact_header
+
+REGISTRY_ROOT = os.environ.get("MLPROJECT_MODEL_REGISTRY", os.path.join("artifacts", "registry"))
+MODEL_FILE = "model.pkl"
+PREPROCESSOR_FILE = "preprocessor.pkl"
+METADATA_FILE = "metadata.json"
+CURRENT_FILE = "CURRENT"
+
+
+def _copy_artifact(source, destination):
+    """Copies an artifact together with its .meta.json sidecar, if it has one."""
+    shutil.copy2(source, destination)
+    if os.path.exists(f"{source}.meta.json"):
+        shutil.copy2(f"{source}.meta.json", f"{destination}.meta.json")
+
+
+def _model_params(model_path):
+    # Native-format artifacts record the params at save time; others have to be loaded
+    header = read_artifact_header(model_path) or {}
+    params = header["params"] if "params" in header else load_artifact(model_path).get_params()
+    return {key: value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+            for key, value in params.items()}
+
+
+class ModelRegistry:
+    """
+    Versioned model store: root/<name>/v0001/{model.pkl, preprocessor.pkl, metadata.json}.
+
+    A version directory is assembled under a temporary name and renamed into place, so it is
+    either complete or absent, and never modified afterwards. root/<name>/CURRENT holds the
+    served version and is replaced atomically, so readers see either the old or the new one.
+    """
+    def __init__(self, root=REGISTRY_ROOT):
+        self.root = root
+
+    def _model_dir(self, name):
+        return os.path.join(self.root, name)
+
+    def version_dir(self, name, version):
+        return os.path.join(self._model_dir(name), version)
+
+    def versions(self, name):
+        """Registered versions of name, oldest first."""
+        if not os.path.isdir(self._model_dir(name)):
+            return []
+        return sorted(entry for entry in os.listdir(self._model_dir(name))
+                      if entry.startswith("v") and entry[1:].isdigit())
+
+    def current_version(self, name):
+        """The version CURRENT points to, or None when nothing is registered under name."""
+        try:
+            with open(os.path.join(self._model_dir(name), CURRENT_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def metadata(self, name, version=None):
+        version = version or self.current_version(name)
+        with open(os.path.join(self.version_dir(name, version), METADATA_FILE)) as f:
+            return json.load(f)
+
+    def resolve(self, name, version=None):
+        """(version, model_path, preprocessor_path) of a version (default: current), or None."""
+        version = version or self.current_version(name)
+        if version is None:
+            return None
+        version_dir = self.version_dir(name, version)
+        return version, os.path.join(version_dir, MODEL_FILE), os.path.join(version_dir, PREPROCESSOR_FILE)
+
+    def promote(self, name, version):
+        """Atomically points CURRENT at version (also used to roll back)."""
+        if version not in self.versions(name):
+            raise ValueError(f"Unknown version {version} of model '{name}'")
+        tmp_path = os.path.join(self._model_dir(name), f"{CURRENT_FILE}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(self._model_dir(name), CURRENT_FILE))
+        logger.info(f"Model '{name}' now points at {version}")
+
+    def register(self, name, model_path, preprocessor_path, metrics=None, data_path=None, promote=True):
+        """
+        Adds model_path and its preprocessor as the next version of name, with metadata (metrics,
+        model params, SHA-256 of the model and of the training data at data_path) and, with
+        promote=True, makes it current. Registering the same model file as the current version
+        again returns that version instead of creating a new one.
+        """
+        try:
+            model_sha256 = file_sha256(model_path)
+            current = self.current_version(name)
+            if current is not None and self.metadata(name, current)["model_sha256"] == model_sha256:
+                logger.info(f"Model '{name}' at {model_path} is already registered as {current}")
+                return current
+
+            metadata = {
+                "name": name,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "source_model_path": model_path,
+                "model_sha256": model_sha256,
+                "preprocessor_sha256": file_sha256(preprocessor_path),
+                "data_path": data_path,
+                "data_sha256": file_sha256(data_path) if data_path else None,
+                "metrics": metrics or {},
+                "params": _model_params(model_path),
+                "artifact": read_artifact_header(model_path),
+            }
+            os.makedirs(self._model_dir(name), exist_ok=True)
+            staging_dir = os.path.join(self._model_dir(name), f".staging-{uuid.uuid4().hex}")
+            os.makedirs(staging_dir)
+            try:
+                _copy_artifact(model_path, os.path.join(staging_dir, MODEL_FILE))
+                _copy_artifact(preprocessor_path, os.path.join(staging_dir, PREPROCESSOR_FILE))
+                while True:
+                    existing = self.versions(name)
+                    version = f"v{int(existing[-1][1:]) + 1 if existing else 1:04d}"
+                    metadata["version"] = version
+                    with open(os.path.join(staging_dir, METADATA_FILE), "w") as f:
+                        json.dump(metadata, f, indent=2, default=str)
+                    try:
+                        # Fails if a concurrent register already took this version number
+                        os.rename(staging_dir, self.version_dir(name, version))
+                        break
+                    except OSError:
+                        if not os.path.isdir(self.version_dir(name, version)):
+                            raise
+            except Exception:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+            logger.info(f"Registered {model_path} as model '{name}' {version}")
+            if promote:
+                self.promote(name, version)
+            return version
+        except Exception as e:
+            raise CustomException(f"Error registering model '{name}': {e}", sys)
+
+
+def register_pipeline_models(model_paths, preprocessor_path, leaderboard_path, data_path, root=REGISTRY_ROOT):
+    """Registers every model of the pipeline ({name: path}) with its leaderboard metrics."""
+    with open(leaderboard_path) as f:
+        leaderboard = {entry["path"]: entry for entry in json.load(f)["models"]}
+    registry = ModelRegistry(root)
+    versions = {}
+    for name, model_path in model_paths.items():
+        entry = leaderboard.get(model_path, {})
+        metrics = {key: entry[key] for key in ("r2", "mae", "rmse") if key in entry}
+        versions[name] = registry.register(name, model_path, preprocessor_path, metrics=metrics, data_path=data_path)
+    return versions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect the model registry or move a model's CURRENT pointer.")
+    parser.add_argument("name", help="Model name, e.g. best or tuned.")
+    parser.add_argument("--promote", metavar="VERSION", help="Make VERSION current (e.g. to roll back).")
+    parser.add_argument("--root", default=REGISTRY_ROOT)
+    args = parser.parse_args()
+
+    registry = ModelRegistry(args.root)
+    if args.promote:
+        registry.promote(args.name, args.promote)
+    current = registry.current_version(args.name)
+    for version in registry.versions(args.name):
+        metadata = registry.metadata(args.name, version)
+        marker = "*" if version == current else " "
+        print(f"{marker} {version}  {metadata['created_at']}  {metadata['artifact'] and metadata['artifact']['object_type']}"
+              f"  {metadata['metrics']}")
@@ -0,0 +1,123 @@
+import os
+import sys
+import json
+import math
+import time
+import numpy as np
+from sklearn.base import clone
+from src.log_config.logger import logger
+from src.model.model_evaluation import get_regression_models, fit_and_evaluate_model
+
+
+def halving_rungs(n_candidates, factor):
+    """
+    Number of successive-halving rungs for n_candidates: one per division by factor needed
+    to get down to a single candidate, plus the last (ceil(log_factor(n_candidates)) + 1).
+    Shared by model selection and the halving hyperparameter search.
+    """
+    # Integer arithmetic: math.ceil(math.log(125, 5)) is 4, since log(125, 5) == 3.0000000000000004
+    n_rungs, survivors = 1, 1
+    while survivors < n_candidates:
+        survivors *= factor
+        n_rungs += 1
+    return n_rungs
+
+
+def _halving_schedule(n_samples, n_candidates, factor, min_samples):
+    """Returns the training-set size used at each rung, ending with the full training set."""
+    n_rungs = halving_rungs(n_candidates, factor)
+    budgets = [int(n_samples / factor ** (n_rungs - 1 - rung)) for rung in range(n_rungs)]
+    return [min(n_samples, max(budget, min_samples)) for budget in budgets]
+
+
+def successive_halving_selection(X_train, y_train, X_test, y_test, models=None, factor=3,
+                                 min_samples=50, random_state=42, compare_exhaustive=False):
+    """
+    Selects the best regressor by successive halving.
+
+    Every candidate is scored on a small random subsample of the training data, and only the
+    top 1/factor of them (by test R2) is promoted to the next, factor-times larger, subsample.
+    The last rung trains the remaining candidate(s) on the full training set.
+
+    Returns (best_model_name, best_model, best_r2_score, report). With compare_exhaustive=True
+    the exhaustive loop is also run so the report includes the wall-clock saved and whether
+    both strategies agree on the winner.
+    """
+    from src.utils.common_utils import CustomException  # Local import for circular import handling
+    try:
+        models = models or get_regression_models()
+        y_train = np.asarray(y_train)
+        n_samples = len(y_train)
+        order = np.random.RandomState(random_state).permutation(n_samples)
+        budgets = _halving_schedule(n_samples, len(models), factor, min_samples)
+
+        start = time.perf_counter()
+        candidates = list(models)
+        rungs = []
+        scores = {}
+        fitted = {}
+        for rung, budget in enumerate(budgets):
+            # Nested subsamples: every rung sees a superset of the previous rung's rows
+            subset = np.sort(order[:budget])
+            X_subset, y_subset = X_train[subset], y_train[subset]
+            logger.info(f"Successive halving rung {rung}: {len(candidates)} candidates on {budget} samples")
+
+            scores = {}
+            for model_name in candidates:
+                _, model, (_, _, r2_score_value) = fit_and_evaluate_model(
+                    model_name, clone(models[model_name]), X_subset, y_subset, X_test, y_test
+                )
+                scores[model_name] = r2_score_value
+                fitted[model_name] = model
+            rungs.append({"samples": int(budget), "scores": dict(scores)})
+
+            if rung < len(budgets) - 1:
+                keep = max(1, math.ceil(len(candidates) / factor))
+                # Stable sort keeps the original model order on ties, matching the exhaustive loop
+                candidates = sorted(candidates, key=lambda name: -scores[name])[:keep]
+
+        best_model_name = max(candidates, key=lambda name: (scores[name], -candidates.index(name)))
+        best_r2_score = scores[best_model_name]
+        halving_seconds = time.perf_counter() - start
+
+        report = {
+            "strategy": "successive_halving",
+            "factor": factor,
+            "rungs": rungs,
+            "best_model": best_model_name,
+            "best_r2_score": best_r2_score,
+            "wall_clock_seconds": halving_seconds,
+        }
+
+        if compare_exhaustive:
+            start = time.perf_counter()
+            exhaustive_best, exhaustive_r2 = None, float("-inf")
+            for model_name, model in models.items():
+                _, _, (_, _, r2_score_value) = fit_and_evaluate_model(
+                    model_name, clone(model), X_train, y_train, X_test, y_test
+                )
+                if r2_score_value > exhaustive_r2:
+                    exhaustive_best, exhaustive_r2 = model_name, r2_score_value
+            exhaustive_seconds = time.perf_counter() - start
+            report.update({
+                "exhaustive_best_model": exhaustive_best,
+                "exhaustive_r2_score": exhaustive_r2,
+                "exhaustive_wall_clock_seconds": exhaustive_seconds,
+                "wall_clock_saved_seconds": exhaustive_seconds - halving_seconds,
+                "matches_exhaustive": exhaustive_best == best_model_name,
+            })
+            logger.info(f"Successive halving took {halving_seconds:.2f}s vs {exhaustive_seconds:.2f}s exhaustive; "
+                        f"selected {best_model_name}, exhaustive selected {exhaustive_best}")
+
+        return best_model_name, fitted[best_model_name], best_r2_score, report
+
+    except Exception as e:
+        raise CustomException(f"Error in successive halving model selection: {e}", sys)
+
+
+def save_selection_report(report, file_path=os.path.join("artifacts", "model_selection_report.json")):
+    """Writes the selection report next to best_model.pkl."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Model selection report saved at {file_path}")
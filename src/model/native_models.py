@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+import tempfile
+import numpy as np
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import save_artifact, load_artifact, native_format
+
+
+def predict_batch(model, X):
+    """
+    model.predict(X), through XGBoost's inplace_predict for XGBoost models: the booster reads
+    the dense or CSR matrix directly instead of the wrapper building a DMatrix per call.
+    CatBoost's predict already runs natively on all cores, and other models are unchanged.
+    """
+    if native_format(model) == "xgboost":
+        booster = model.get_booster()
+        # Same trees as XGBRegressor.predict: up to the best iteration when early stopping was used
+        best_iteration = booster.attr("best_iteration")
+        iteration_range = (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+        return booster.inplace_predict(X, iteration_range=iteration_range)
+    return model.predict(X)
+
+
+def benchmark_native_format(model, X, repeats=5):
+    """
+    Load time and predict throughput on X of model saved as a plain pickle (loaded with
+    pickle.load, scored with model.predict) versus its native format (loaded with
+    load_artifact, scored with predict_batch). Raises ValueError for models without one.
+    """
+    if native_format(model) is None:
+        raise ValueError(f"{type(model).__name__} has no native format")
+    report = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pickle_path, native_path = os.path.join(tmp_dir, "model.pkl"), os.path.join(tmp_dir, "model.native")
+        with open(pickle_path, "wb") as f:
+            pickle.dump(model, f)
+        save_artifact(native_path, model, backend="native")
+
+        def load_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        reference = model.predict(X)
+        for label, file_path, load, predict in (("pickle", pickle_path, load_pickle, lambda m: m.predict(X)),
+                                                ("native", native_path, lambda: load_artifact(native_path),
+                                                 lambda m: predict_batch(m, X))):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                loaded = load()
+            load_seconds = (time.perf_counter() - start) / repeats
+            predictions = predict(loaded)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                predict(loaded)
+            predict_seconds = (time.perf_counter() - start) / repeats
+            report.append({"format": label, "size_mb": os.path.getsize(file_path) / 1e6,
+                           "load_seconds": load_seconds, "predict_seconds": predict_seconds,
+                           "rows_per_sec": X.shape[0] / predict_seconds,
+                           "max_abs_diff": float(np.max(np.abs(predictions - reference)))})
+    logger.info(f"Native format benchmark for {type(model).__name__}: {report}")
+    return report
+
+
+if __name__ == "__main__":
+    import pandas as pd
+    from src.model.model_evaluation import get_regression_models
+    from src.utils.array_store import load_transformed_data
+
+    parser = argparse.ArgumentParser(description="Benchmark native XGBoost/CatBoost persistence against pickle.")
+    parser.add_argument("--model", default=None, help="A saved XGBoost or CatBoost model artifact.")
+    parser.add_argument("--candidate", default="XGBRegressor", choices=["XGBRegressor", "CatBoost Regressor"],
+                        help="Candidate fitted on the transformed training data when --model is not given.")
+    parser.add_argument("--train", default=os.path.join("artifacts", "transformed_train_data.npy"))
+    parser.add_argument("--test", default=os.path.join("artifacts", "transformed_test_data.npy"))
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows scored per predict call (test rows tiled).")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        if args.model:
+            model = load_artifact(args.model)
+        else:
+            X_train, y_train = load_transformed_data(args.train)
+            model = get_regression_models()[args.candidate].fit(X_train, y_train)
+        X_test, _ = load_transformed_data(args.test)
+        X = np.resize(np.asarray(X_test), (args.rows, X_test.shape[1]))
+        print(pd.DataFrame(benchmark_native_format(model, X, repeats=args.repeats)).set_index("format"))
+    except Exception as e:
+        raise CustomException(f"Error in native format benchmark: {e}", sys)
@@ -1,15 +1,18 @@
 import os
-import pickle
+import sys
 import numpy as np
 import pandas as pd
 from src.log_config.logger import logger
 from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import load_artifact
+from src.utils.artifact_cache import load_cached_object
+from src.model.native_models import predict_batch
+from src.log_config.instrumentation import instrumented
 
 # Load the best model
 def load_model(file_path):
     try:
-        with open(file_path, 'rb') as f:
-            model = pickle.load(f)
+        model = load_artifact(file_path)
         logger.info(f"Model loaded successfully from {file_path}")
         return model
     except Exception as e:
@@ -17,21 +20,21 @@ def load_model(file_path):
         raise CustomException(f"Error loading model: {e}", sys)
 
 # Predict with the model
+# Also the per-request path of the API, so no RSS sampling or INFO line per call
+@instrumented(category="predict", rows_arg="input_data", hot_path=True)
 def make_predictions(input_data, model_file_path, preprocessor_file_path):
     try:
-        # Load the preprocessor
-        with open(preprocessor_file_path, 'rb') as f:
-            preprocessor = pickle.load(f)
-        logger.info(f"Preprocessor loaded successfully from {preprocessor_file_path}")
+        # Load the preprocessor (served from the in-process cache after the first call)
+        preprocessor = load_cached_object(preprocessor_file_path)
 
         # Transform the input data
         transformed_data = preprocessor.transform(input_data)
 
         # Load the trained model
-        model = load_model(model_file_path)
+        model = load_cached_object(model_file_path)
 
         # Make predictions
-        predictions = model.predict(transformed_data)
+        predictions = predict_batch(model, transformed_data)
         logger.info(f"Predictions made successfully")
         return predictions
     except Exception as e:
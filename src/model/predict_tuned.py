@@ -1,16 +1,18 @@
 import os
-import pickle
+import sys
 import numpy as np
 import pandas as pd
 from src.log_config.logger import logger
 from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import load_artifact
+from src.utils.artifact_cache import load_cached_object
+from src.model.native_models import predict_batch
 
 
 # Function to load the model
 def load_model(file_path):
     try:
-        with open(file_path, 'rb') as f:
-            model = pickle.load(f)
+        model = load_artifact(file_path)
         logger.info(f"Model loaded successfully from {file_path}")
         return model
     except Exception as e:
@@ -21,19 +23,17 @@ def load_model(file_path):
 # Function to make predictions
 def make_predictions(input_data, model_file_path, preprocessor_file_path):
     try:
-        # Load the preprocessor
-        with open(preprocessor_file_path, 'rb') as f:
-            preprocessor = pickle.load(f)
-        logger.info(f"Preprocessor loaded successfully from {preprocessor_file_path}")
+        # Load the preprocessor (served from the in-process cache after the first call)
+        preprocessor = load_cached_object(preprocessor_file_path)
 
         # Transform the input data
         transformed_data = preprocessor.transform(input_data)
 
         # Load the trained model
-        model = load_model(model_file_path)
+        model = load_cached_object(model_file_path)
 
         # Make predictions
-        predictions = model.predict(transformed_data)
+        predictions = predict_batch(model, transformed_data)
         logger.info(f"Predictions made successfully")
         return predictions
     except Exception as e:
@@ -62,17 +62,16 @@ if __name__ == "__main__":
         # Make predictions
         predictions = make_predictions(new_data, model_path, preprocessor_path)
         print("Predictions using the tuned model:", predictions)
+
+        # Save predictions to a CSV file (src/model/batch_predict.py scores large files in chunks)
+        predictions_df = pd.DataFrame(predictions, columns=["Predicted Values"])
+        predictions_df.to_csv('artifacts/predictions_tuned_model.csv', index=False)
+
+        logger.info("Predictions saved to 'artifacts/predictions_tuned_model.csv'")
         logger.info("Prediction process completed successfully.")
     except FileNotFoundError as fnf_error:
         logger.error(fnf_error)
         print(f"Error: {fnf_error}")
     except Exception as e:
         logger.error(f"Prediction process failed: {e}")
-        raise CustomException(f"Prediction process failed: {e}", sys)
-
-# Save predictions to a CSV file
-predictions_df = pd.DataFrame(predictions, columns=["Predicted Values"])
-predictions_df.to_csv('artifacts/predictions_tuned_model.csv', index=False)
-
-logger.info("Predictions saved to 'artifacts/predictions_tuned_model.csv'")
-logger.info("Prediction process completed successfully.")
\ No newline at end of file
+        raise CustomException(f"Prediction process failed: {e}", sys)
\ No newline at end of file
@@ -0,0 +1,270 @@
+import os
+import sys
+import glob
+import json
+import time
+import hashlib
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable
+from src.log_config.logger import logger
+from src.log_config.instrumentation import span, tracer
+from src.exceptions.exceptions import CustomException
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline step. func(**params) is called to run it. inputs/outputs are file paths
+    (globs allowed) whose contents, together with params and the stage's code, form its
+    cache key. Dependencies are inferred from inputs that are another stage's outputs;
+    `after` adds explicit ones.
+    """
+    name: str
+    func: Callable
+    inputs: list = field(default_factory=list)
+    outputs: list = field(default_factory=list)
+    params: dict = field(default_factory=dict)
+    code: list = field(default_factory=list)
+    after: list = field(default_factory=list)
+    cache: bool = True
+
+
+def _expand(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        paths.extend(matches if matches else [pattern])
+    return paths
+
+
+class FileHasher:
+    """SHA-256 of file contents, memoized on (size, mtime) so unchanged files are hashed only once."""
+    def __init__(self, memo_path=None):
+        self.memo_path = memo_path
+        self.memo = {}
+        if memo_path and os.path.exists(memo_path):
+            with open(memo_path) as f:
+                self.memo = json.load(f)
+
+    def digest(self, file_path):
+        if not os.path.exists(file_path):
+            return None
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        entry = self.memo.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+        sha = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        self.memo[key] = [fingerprint, sha.hexdigest()]
+        return sha.hexdigest()
+
+    def save(self):
+        if self.memo_path:
+            with open(self.memo_path, "w") as f:
+                json.dump(self.memo, f)
+
+
+class Pipeline:
+    """A DAG of stages with a content-addressed cache: a stage is skipped when its key is unchanged."""
+    def __init__(self, stages, cache_dir=os.path.join("artifacts", ".pipeline_cache")):
+        self.stages = {stage.name: stage for stage in stages}
+        self.cache_dir = cache_dir
+        self.dependencies = self._infer_dependencies()
+        self.order = self._topological_order()
+
+    def _infer_dependencies(self):
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                producers[os.path.normpath(output)] = stage.name
+        dependencies = {}
+        for stage in self.stages.values():
+            upstream = {producers[os.path.normpath(path)] for path in stage.inputs
+                        if os.path.normpath(path) in producers}
+            upstream.update(stage.after)
+            upstream.discard(stage.name)
+            dependencies[stage.name] = sorted(upstream)
+        return dependencies
+
+    def _topological_order(self):
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a cycle through stage '{name}'")
+            visiting.add(name)
+            for upstream in self.dependencies[name]:
+                visit(upstream)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def cache_key(self, stage, hasher):
+        """Hash of the stage name, params, code and the current contents of its inputs."""
+        code_files = stage.code or [inspect.getsourcefile(stage.func)]
+        payload = {
+            "stage": stage.name,
+            "params": stage.params,
+            "code": {path: hasher.digest(path) for path in sorted(code_files)},
+            "inputs": {path: hasher.digest(path) for path in _expand(stage.inputs)},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _record_path(self, stage):
+        return os.path.join(self.cache_dir, f"{stage.name}.json")
+
+    def _is_fresh(self, stage, key, hasher):
+        record_path = self._record_path(stage)
+        if not stage.cache or not os.path.exists(record_path):
+            return False
+        with open(record_path) as f:
+            record = json.load(f)
+        # Outputs must still be what this stage produced last time
+        outputs = {path: hasher.digest(path) for path in _expand(stage.outputs)}
+        return record.get("key") == key and record.get("outputs") == outputs
+
+    def run_stage(self, stage, hasher, force=False):
+        """Runs one stage unless its cache key matches; returns a timing record."""
+        key = self.cache_key(stage, hasher)
+        start = time.perf_counter()
+        if not force and self._is_fresh(stage, key, hasher):
+            logger.info(f"Stage '{stage.name}' is up to date; skipping.")
+            status = "skipped"
+        else:
+            logger.info(f"Running stage '{stage.name}'")
+            try:
+                with span(stage.name, category="pipeline_stage"):
+                    stage.func(**stage.params)
+            except Exception as e:
+                raise CustomException(f"Stage '{stage.name}' failed: {e}", sys)
+            record = {
+                "key": key,
+                "outputs": {path: hasher.digest(path) for path in _expand(stage.outputs)},
+            }
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._record_path(stage), "w") as f:
+                json.dump(record, f, indent=2)
+            status = "ran"
+        end = time.perf_counter()
+        return {"stage": stage.name, "status": status, "seconds": end - start,
+                "start": start, "end": end, "worker": threading.current_thread().name}
+
+    def run(self, force=False, only=None, max_workers=1):
+        """
+        Runs the stages in dependency order. force=True ignores the cache; `only` restricts
+        the run to the named stages (their upstream stages are still brought up to date).
+        With max_workers > 1, stages whose dependencies are done run concurrently on a
+        thread pool; with max_workers=1 they run in order on the calling thread. A
+        Gantt-style timing report with the critical path is logged and written to
+        pipeline_timing.json in the cache directory, and the spans recorded during the
+        run (stages, model fits and predicts) to pipeline_trace.json as a Chrome trace.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        hasher = FileHasher(os.path.join(self.cache_dir, "file_hashes.json"))
+        selected = self._with_upstream(only) if only else set(self.order)
+        results = {}
+        run_start = time.perf_counter()
+        tracer.clear()
+        try:
+            if max_workers == 1:
+                # Inline on the calling thread: no pool overhead, and stages that are not thread-safe stay safe
+                for name in self.order:
+                    if name in selected:
+                        results[name] = self.run_stage(self.stages[name], hasher, force)
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage") as executor:
+                    running = {}
+                    while len(results) < len(selected):
+                        for name in self.order:
+                            ready = (name in selected and name not in results and name not in running.values()
+                                     and all(dep in results for dep in self.dependencies[name] if dep in selected))
+                            if ready:
+                                running[executor.submit(self.run_stage, self.stages[name], hasher, force)] = name
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            name = running.pop(future)
+                            try:
+                                results[name] = future.result()
+                            except Exception:
+                                for pending in running:
+                                    pending.cancel()
+                                raise
+        finally:
+            hasher.save()
+            tracer.export_chrome_trace(os.path.join(self.cache_dir, "pipeline_trace.json"))
+
+        report = self.timing_report([results[name] for name in self.order if name in results], run_start)
+        logger.info("Pipeline timing:\n" + format_gantt(report))
+        with open(os.path.join(self.cache_dir, "pipeline_timing.json"), "w") as f:
+            json.dump(report, f, indent=2)
+        return report["stages"]
+
+    def timing_report(self, results, run_start):
+        """Stage timings relative to run_start, plus the critical path through the DAG."""
+        stages = [{**result, "start": result["start"] - run_start, "end": result["end"] - run_start}
+                  for result in results]
+        durations = {stage["stage"]: stage["seconds"] for stage in stages}
+
+        # Longest (by duration) dependency chain ending at each stage
+        finish, previous = {}, {}
+        for name in self.order:
+            if name not in durations:
+                continue
+            upstream = [dep for dep in self.dependencies[name] if dep in finish]
+            longest = max(upstream, key=lambda dep: finish[dep], default=None)
+            previous[name] = longest
+            finish[name] = durations[name] + (finish[longest] if longest else 0.0)
+
+        critical_path = []
+        name = max(finish, key=finish.get, default=None)
+        while name is not None:
+            critical_path.append(name)
+            name = previous[name]
+        critical_path.reverse()
+
+        return {
+            "wall_clock_seconds": max((stage["end"] for stage in stages), default=0.0),
+            "sum_of_stage_seconds": sum(durations.values()),
+            "critical_path": critical_path,
+            "critical_path_seconds": sum(durations[name] for name in critical_path),
+            "stages": stages,
+        }
+
+    def _with_upstream(self, names):
+        selected, pending = set(), list(names)
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.dependencies[name])
+        return selected
+
+
+def format_gantt(report, width=50):
+    """Renders a timing report as a text Gantt chart; '#' marks stages on the critical path."""
+    total = report["wall_clock_seconds"] or 1.0
+    name_width = max((len(stage["stage"]) for stage in report["stages"]), default=5)
+    lines = []
+    for stage in report["stages"]:
+        begin = int(stage["start"] / total * width)
+        length = max(1, int(round(stage["seconds"] / total * width)))
+        bar_char = "#" if stage["stage"] in report["critical_path"] else "="
+        bar = " " * begin + bar_char * min(length, width - begin if width > begin else 1)
+        lines.append(f"{stage['stage']:<{name_width}} |{bar:<{width}}| {stage['start']:7.2f}s +{stage['seconds']:6.2f}s "
+                     f"{stage['status']:<7} {stage['worker']}")
+    lines.append(f"wall clock {report['wall_clock_seconds']:.2f}s, sum of stages {report['sum_of_stage_seconds']:.2f}s, "
+                 f"critical path {' -> '.join(report['critical_path'])} ({report['critical_path_seconds']:.2f}s)")
+    return "\n".join(lines)
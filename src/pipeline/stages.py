@@ -0,0 +1,149 @@
+import os
+from src.log_config.logger import logger
+from src.pipeline.dag import Stage
+from src.utils.array_store import load_transformed_data
+
+# Artifact locations shared by the stages
+RAW_DATA_PATH = os.path.join("data", "uncleaned", "students.csv")
+CLEANED_DATA_PATH = os.path.join("data", "cleaned", "cleaned_students.csv")
+TRAIN_PATH = os.path.join("data", "cleaned", "train.csv")
+TEST_PATH = os.path.join("data", "cleaned", "test.csv")
+PREPROCESSOR_PATH = os.path.join("artifacts", "preprocessor.pkl")
+TRANSFORMED_TRAIN_PATH = os.path.join("artifacts", "transformed_train_data.npy")
+TRANSFORMED_TEST_PATH = os.path.join("artifacts", "transformed_test_data.npy")
+TRANSFORMED_TRAIN_SPARSE_PATH = os.path.join("artifacts", "transformed_train_data.npz")
+TRANSFORMED_TEST_SPARSE_PATH = os.path.join("artifacts", "transformed_test_data.npz")
+BEST_MODEL_PATH = os.path.join("artifacts", "best_model.pkl")
+TUNED_MODEL_PATH = os.path.join("artifacts", "tuned_model.pkl")
+TUNING_TRIALS_PATH = os.path.join("artifacts", "tuning_trials.csv")
+FEATURE_IMPORTANCE_PATH = os.path.join("artifacts", "feature_importance.png")
+LEADERBOARD_JSON_PATH = os.path.join("artifacts", "model_leaderboard.json")
+LEADERBOARD_CSV_PATH = os.path.join("artifacts", "model_leaderboard.csv")
+REGISTRY_ROOT = os.path.join("artifacts", "registry")
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _src(*parts):
+    return os.path.join(SRC_DIR, *parts)
+
+
+# The on-disk format of every .pkl artifact; stages that write or read them must re-run when it changes
+ARTIFACT_IO_CODE = [_src("utils", "artifact_store.py"), _src("utils", "common_utils.py"),
+                    _src("model", "native_models.py")]
+
+
+def ingest(input_path, output_path):
+    from src.data_ingestion.data_ingestion import load_data, clean_data, save_data
+
+    data = load_data(input_path)
+    if data is None:
+        raise FileNotFoundError(f"Could not load raw data from {input_path}")
+    save_data(clean_data(data), output_path)
+
+
+def split(cleaned_path, train_path, test_path, test_size, random_state):
+    from src.data_ingestion.split_data import split_data
+
+    split_data(cleaned_path, train_path, test_path, test_size=test_size, random_state=random_state)
+
+
+def transform(train_path, test_path, sparse_output):
+    from src.data_transformation.data_transformation import DataTransformation
+
+    DataTransformation(sparse_output=sparse_output).initiate_data_transformation(
+        train_path, test_path, evaluate_models=False
+    )
+
+
+def evaluate(train_data_path, test_data_path, n_jobs, selection):
+    from src.model.model_evaluation import evaluate_regression_models
+
+    X_train, y_train = load_transformed_data(train_data_path)
+    X_test, y_test = load_transformed_data(test_data_path)
+    evaluate_regression_models(X_train, y_train, X_test, y_test, n_jobs=n_jobs, selection=selection)
+
+
+def tune(train_data_path, search, n_jobs):
+    from src.hyperparameter_tuning.hyperparameter_tuning import hyperparameter_tuning
+
+    X_train, y_train = load_transformed_data(train_data_path)
+    hyperparameter_tuning(X_train, y_train, search=search, n_jobs=n_jobs)
+
+
+def feature_importance(model_path, preprocessor_path, output_path):
+    from src.model.feature_importance import calculate_feature_importance
+
+    calculate_feature_importance(model_path, preprocessor_path, output_path)
+
+
+def compare(model_paths, data_path, preprocessor_path, n_jobs, json_path, csv_path):
+    from src.model.compare_r2_scores import compare_r2_scores
+
+    compare_r2_scores(model_paths, data_path=data_path, preprocessor_path=preprocessor_path, n_jobs=n_jobs,
+                      json_path=json_path, csv_path=csv_path)
+
+
+def register(model_paths, preprocessor_path, leaderboard_path, data_path, root):
+    from src.model.model_registry import register_pipeline_models
+
+    register_pipeline_models(model_paths, preprocessor_path, leaderboard_path, data_path, root=root)
+
+
+def build_stages(n_jobs=1, selection="exhaustive", search="grid", sparse_output=False):
+    """
+    The training pipeline from raw CSV to the model leaderboard and registry, as cacheable stages.
+    sparse_output=True keeps the one-hot features in CSR .npz files instead of dense .npy.
+    """
+    logger.info("Building pipeline stages.")
+    if sparse_output:
+        transformed_train_path, transformed_test_path = TRANSFORMED_TRAIN_SPARSE_PATH, TRANSFORMED_TEST_SPARSE_PATH
+    else:
+        transformed_train_path, transformed_test_path = TRANSFORMED_TRAIN_PATH, TRANSFORMED_TEST_PATH
+    return [
+        Stage("ingest", ingest,
+              inputs=[RAW_DATA_PATH], outputs=[CLEANED_DATA_PATH],
+              params={"input_path": RAW_DATA_PATH, "output_path": CLEANED_DATA_PATH},
+              code=[_src("data_ingestion", "data_ingestion.py"), _src("data_ingestion", "schema.py")]),
+        Stage("split", split,
+              inputs=[CLEANED_DATA_PATH], outputs=[TRAIN_PATH, TEST_PATH],
+              params={"cleaned_path": CLEANED_DATA_PATH, "train_path": TRAIN_PATH, "test_path": TEST_PATH,
+                      "test_size": 0.2, "random_state": 42},
+              code=[_src("data_ingestion", "split_data.py"), _src("data_ingestion", "schema.py")]),
+        Stage("transform", transform,
+              inputs=[TRAIN_PATH, TEST_PATH],
+              outputs=[PREPROCESSOR_PATH, transformed_train_path, transformed_test_path],
+              params={"train_path": TRAIN_PATH, "test_path": TEST_PATH, "sparse_output": sparse_output},
+              code=[_src("data_transformation", "data_transformation.py"), _src("utils", "array_store.py"),
+                    _src("data_ingestion", "schema.py"), *ARTIFACT_IO_CODE]),
+        Stage("evaluate", evaluate,
+              inputs=[transformed_train_path, transformed_test_path], outputs=[BEST_MODEL_PATH],
+              params={"train_data_path": transformed_train_path, "test_data_path": transformed_test_path,
+                      "n_jobs": n_jobs, "selection": selection},
+              code=[_src("model", "model_evaluation.py"), _src("model", "model_selection.py"), *ARTIFACT_IO_CODE]),
+        Stage("tune", tune,
+              inputs=[transformed_train_path], outputs=[TUNED_MODEL_PATH, TUNING_TRIALS_PATH],
+              params={"train_data_path": transformed_train_path, "search": search, "n_jobs": n_jobs},
+              code=[_src("hyperparameter_tuning", "hyperparameter_tuning.py"),
+                    _src("hyperparameter_tuning", "search.py"),
+                    _src("hyperparameter_tuning", "ridge_path.py"), *ARTIFACT_IO_CODE]),
+        Stage("feature_importance", feature_importance,
+              inputs=[BEST_MODEL_PATH, PREPROCESSOR_PATH], outputs=[FEATURE_IMPORTANCE_PATH],
+              params={"model_path": BEST_MODEL_PATH, "preprocessor_path": PREPROCESSOR_PATH,
+                      "output_path": FEATURE_IMPORTANCE_PATH},
+              code=[_src("model", "feature_importance.py"), *ARTIFACT_IO_CODE]),
+        Stage("compare", compare,
+              inputs=[CLEANED_DATA_PATH, BEST_MODEL_PATH, TUNED_MODEL_PATH, PREPROCESSOR_PATH],
+              outputs=[LEADERBOARD_JSON_PATH, LEADERBOARD_CSV_PATH],
+              params={"model_paths": {"before_tuning": BEST_MODEL_PATH, "after_tuning": TUNED_MODEL_PATH},
+                      "data_path": CLEANED_DATA_PATH, "preprocessor_path": PREPROCESSOR_PATH, "n_jobs": n_jobs,
+                      "json_path": LEADERBOARD_JSON_PATH, "csv_path": LEADERBOARD_CSV_PATH},
+              code=[_src("model", "compare_r2_scores.py"), *ARTIFACT_IO_CODE]),
+        Stage("register", register,
+              inputs=[BEST_MODEL_PATH, TUNED_MODEL_PATH, PREPROCESSOR_PATH, LEADERBOARD_JSON_PATH, TRAIN_PATH],
+              outputs=[os.path.join(REGISTRY_ROOT, name, "CURRENT") for name in ("best", "tuned")],
+              params={"model_paths": {"best": BEST_MODEL_PATH, "tuned": TUNED_MODEL_PATH},
+                      "preprocessor_path": PREPROCESSOR_PATH, "leaderboard_path": LEADERBOARD_JSON_PATH,
+                      "data_path": TRAIN_PATH, "root": REGISTRY_ROOT},
+              code=[_src("model", "model_registry.py"), *ARTIFACT_IO_CODE]),
+    ]
@@ -0,0 +1,100 @@
+import os
+import sys
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+
+def save_array(file_path, array):
+    """Save a 2-D array in NumPy's binary .npy format (atomically, via a temporary file)."""
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_path, file_path)
+        logger.info(f"Array of shape {np.shape(array)} saved at {file_path}")
+    except Exception as e:
+        raise CustomException(f"Error saving array to {file_path}: {e}", sys)
+
+
+def save_sparse_array(file_path, matrix):
+    """Save a sparse matrix as CSR in scipy's .npz format (atomically, via a temporary file)."""
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        # Passing a file object stops save_npz from appending another .npz suffix
+        with open(tmp_path, "wb") as f:
+            sparse.save_npz(f, sparse.csr_matrix(matrix))
+        os.replace(tmp_path, file_path)
+        logger.info(f"Sparse array of shape {matrix.shape} ({matrix.nnz} non-zeros) saved at {file_path}")
+    except Exception as e:
+        raise CustomException(f"Error saving sparse array to {file_path}: {e}", sys)
+
+
+@contextmanager
+def open_array_for_writing(file_path, shape, dtype=np.float64):
+    """
+    Create a .npy file of the given shape and yield it as a writable np.memmap, so large
+    arrays can be filled in chunks without ever being held in memory. The file only
+    appears at file_path once the block exits successfully.
+    """
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    tmp_path = f"{file_path}.tmp"
+    array = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=shape)
+    try:
+        yield array
+        array.flush()
+    except Exception:
+        del array
+        os.remove(tmp_path)
+        raise
+    del array
+    os.replace(tmp_path, file_path)
+    logger.info(f"Memory-mapped array of shape {shape} saved at {file_path}")
+
+
+def export_csv(array, csv_path):
+    """Write an array as CSV in the layout of the original transformed_*.csv artifacts."""
+    try:
+        os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+        dense = array.toarray() if sparse.issparse(array) else np.asarray(array)
+        pd.DataFrame(dense).to_csv(csv_path, index=False)
+        logger.info(f"CSV export saved at {csv_path}")
+    except Exception as e:
+        raise CustomException(f"Error exporting CSV to {csv_path}: {e}", sys)
+
+
+def load_array(file_path, mmap_mode="r"):
+    """
+    Load an array saved by save_array or save_sparse_array. .npy files are memory-mapped
+    (zero-copy, read-only by default), .npz files are read as CSR matrices, and legacy .csv
+    artifacts are still parsed so older artifact folders keep working.
+    """
+    try:
+        if not os.path.exists(file_path):
+            csv_path = os.path.splitext(file_path)[0] + ".csv"
+            if file_path.endswith(".npy") and os.path.exists(csv_path):
+                logger.warning(f"{file_path} not found; falling back to legacy CSV {csv_path}")
+                file_path = csv_path
+            else:
+                raise FileNotFoundError(f"Array file not found: {file_path}")
+
+        if file_path.endswith(".csv"):
+            return np.loadtxt(file_path, delimiter=",", skiprows=1)
+        if file_path.endswith(".npz"):
+            return sparse.load_npz(file_path).tocsr()
+        return np.load(file_path, mmap_mode=mmap_mode)
+    except Exception as e:
+        raise CustomException(f"Error loading array from {file_path}: {e}", sys)
+
+
+def load_transformed_data(file_path, mmap_mode="r"):
+    """Load a transformed dataset and split it into feature and target views (last column is the target)."""
+    data = load_array(file_path, mmap_mode=mmap_mode)
+    if sparse.issparse(data):
+        return data[:, :-1], data[:, -1].toarray().ravel()
+    return data[:, :-1], data[:, -1]
@@ -0,0 +1,106 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import load_artifact
+
+
+class ArtifactCache:
+    """
+    Thread-safe, bounded LRU cache of unpickled artifacts (preprocessors and models).
+
+    Entries are keyed by the absolute path of the artifact and validated against the
+    file's modification time and size, so a rewritten artifact is reloaded automatically.
+    """
+    def __init__(self, max_entries=8):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._path_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _fingerprint(file_path):
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _lock_for(self, key):
+        # One lock per path so two threads never unpickle the same file twice,
+        # while loads of different artifacts still run concurrently.
+        with self._lock:
+            return self._path_locks.setdefault(key, threading.Lock())
+
+    def _lookup(self, key, fingerprint):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+        return False, None
+
+    def get(self, file_path, loader=None):
+        """Return the artifact stored at file_path, loading it only if it is missing or stale."""
+        key = os.path.abspath(file_path)
+        fingerprint = self._fingerprint(key)
+
+        found, obj = self._lookup(key, fingerprint)
+        if found:
+            return obj
+
+        with self._lock_for(key):
+            # Another thread may have loaded it while we were waiting
+            fingerprint = self._fingerprint(key)
+            found, obj = self._lookup(key, fingerprint)
+            if found:
+                return obj
+
+            obj = (loader or _artifact_loader)(key)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = (fingerprint, obj)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    logger.info(f"Evicted artifact from cache: {evicted}")
+            logger.info(f"Artifact cached from {key}")
+            return obj
+
+    def invalidate(self, file_path=None):
+        """Drop one artifact (or every artifact when file_path is None) from the cache."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(file_path), None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, file_path):
+        with self._lock:
+            return os.path.abspath(file_path) in self._entries
+
+
+def _artifact_loader(file_path):
+    # Checksum verified once per load; cached hits reuse the (memory-mapped) object
+    return load_artifact(file_path)
+
+
+# Process-wide cache shared by every prediction entry point
+artifact_cache = ArtifactCache(max_entries=int(os.environ.get("MLPROJECT_ARTIFACT_CACHE_SIZE", 8)))
+
+
+def load_cached_object(file_path):
+    """Load an artifact through the process-wide cache."""
+    try:
+        return artifact_cache.get(file_path)
+    except Exception as e:
+        logger.error(f"Error loading artifact from {file_path}: {e}")
+        raise CustomException(f"Error loading artifact from {file_path}: {e}", sys)
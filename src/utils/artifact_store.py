@@ -0,0 +1,375 @@
+import os
+import sys
+import json
+import mmap
+import time
+import pickle
+import struct
+import importlib
+import hashlib
+import platform
+import argparse
+import tempfile
+from datetime import datetime, timezone
+
+# Add the project root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from src.log_config.logger import logger
+from src.exceptions.exceptions import CustomException
+
+BACKENDS = ("pickle5", "joblib", "native")
+COMPRESSIONS = (None, "zstd", "lz4")
+DEFAULT_BACKEND = os.environ.get("MLPROJECT_ARTIFACT_BACKEND", "pickle5")
+DEFAULT_COMPRESSION = os.environ.get("MLPROJECT_ARTIFACT_COMPRESSION") or None
+
+# pickle5 container: MAGIC, uint32 header length, JSON header, then the pickle stream and its
+# out-of-band buffers, each starting on an ALIGNMENT boundary so numpy views of them are aligned
+MAGIC = b"MLARTIF1"
+ALIGNMENT = 64
+HASH_BLOCK_SIZE = 1 << 20
+# First two bytes of a legacy plain pickle: the PROTO opcode and protocol 2-5
+PICKLE_PROTOCOL_PREFIXES = {pickle.PROTO + bytes([protocol]) for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1)}
+
+# Libraries whose models are saved in their own binary format by the native backend, with the
+# extension that selects that format
+NATIVE_FORMATS = {"xgboost": ".ubj", "catboost": ".cbm"}
+
+
+def _compressor(compression):
+    """(compress, decompress) functions for an optional compression codec."""
+    if compression is None:
+        return None, None
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("compression='zstd' requires the 'zstandard' package") from e
+        return zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress
+    if compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImportError("compression='lz4' requires the 'lz4' package") from e
+        return lz4.frame.compress, lz4.frame.decompress
+    raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+
+
+def native_format(obj):
+    """'xgboost' or 'catboost' for models of a library with a native binary format, else None."""
+    library = type(obj).__module__.split(".")[0]
+    return library if library in NATIVE_FORMATS and hasattr(obj, "save_model") else None
+
+
+def _sidecar_path(file_path):
+    return f"{file_path}.meta.json"
+
+
+def _base_header(obj, backend, compression, metadata):
+    import numpy
+    import sklearn
+
+    return {
+        "format_version": 1,
+        "backend": backend,
+        "compression": compression,
+        "object_type": f"{type(obj).__module__}.{type(obj).__qualname__}",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "sklearn": sklearn.__version__,
+        "metadata": metadata or {},
+    }
+
+
+def file_sha256(file_path):
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def _to_json(header, **kwargs):
+    # Metadata often carries numpy scalars (e.g. a tuned alpha); anything else unknown is stringified
+    return json.dumps(header, default=lambda value: value.item() if hasattr(value, "item") else str(value), **kwargs)
+
+
+def _padding(offset):
+    return -offset % ALIGNMENT
+
+
+def _write_container(tmp_path, header, sections):
+    """Writes MAGIC, the JSON header and the (already compressed) sections; returns the final header."""
+    sha = hashlib.sha256()
+    for section in sections:
+        sha.update(section)
+    # Offsets are relative to the end of the header, so they do not depend on the header's own length
+    layout, offset = [], 0
+    for section in sections:
+        offset += _padding(offset)
+        layout.append({"offset": offset, "size": len(section)})
+        offset += len(section)
+    header = {**header, "sections": layout, "sha256": sha.hexdigest()}
+    encoded = _to_json(header).encode()
+    encoded += b" " * _padding(len(MAGIC) + 4 + len(encoded))
+
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(encoded)))
+        f.write(encoded)
+        position = 0
+        for entry, section in zip(layout, sections):
+            f.write(b"\0" * (entry["offset"] - position))
+            f.write(section)
+            position = entry["offset"] + entry["size"]
+    return header
+
+
+def _read_header(f):
+    if f.read(len(MAGIC)) != MAGIC:
+        return None
+    (length,) = struct.unpack("<I", f.read(4))
+    return json.loads(f.read(length))
+
+
+def _read_container(file_path, mmap_arrays, verify):
+    """(header, sections) of a container file, checksum-verified and decompressed."""
+    with open(file_path, "rb") as f:
+        header = _read_header(f)
+        data_start = f.tell()
+        _, decompress = _compressor(header["compression"])
+        if mmap_arrays and decompress is None:
+            # Sections stay views of the mapping, so unpickled numpy arrays are read-only and backed by the file
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            view = memoryview(f.read())
+            data_start = 0
+    sections = [view[data_start + entry["offset"]:data_start + entry["offset"] + entry["size"]]
+                for entry in header["sections"]]
+    if verify:
+        sha = hashlib.sha256()
+        for section in sections:
+            sha.update(section)
+        if sha.hexdigest() != header["sha256"]:
+            raise ValueError(f"Checksum mismatch for {file_path}; the artifact is corrupted")
+    if decompress is not None:
+        sections = [decompress(bytes(section)) for section in sections]
+    return header, sections
+
+
+def _save_pickle5(tmp_path, obj, header):
+    compress, _ = _compressor(header["compression"])
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    sections = [payload] + [buffer.raw() for buffer in buffers]
+    if compress is not None:
+        sections = [compress(section) for section in sections]
+    return _write_container(tmp_path, header, sections)
+
+
+def _load_pickle5(file_path, mmap_arrays, verify):
+    _, sections = _read_container(file_path, mmap_arrays, verify)
+    return pickle.loads(sections[0], buffers=sections[1:])
+
+
+def _save_joblib(tmp_path, obj, header):
+    import joblib
+
+    compression = header["compression"]
+    if compression == "zstd":
+        raise ValueError("The joblib backend supports compression=None or 'lz4'")
+    joblib.dump(obj, tmp_path, compress=(compression, 3) if compression else 0)
+    return {**header, "size": os.path.getsize(tmp_path), "sha256": file_sha256(tmp_path)}
+
+
+def _load_joblib(file_path, header, mmap_arrays, verify):
+    import joblib
+
+    # The size check is cheap enough to run even with verify=False
+    if os.path.getsize(file_path) != header["size"] or verify and file_sha256(file_path) != header["sha256"]:
+        raise ValueError(f"{file_path} does not match the checksum in {_sidecar_path(file_path)}; "
+                         f"the artifact is corrupted or being replaced")
+    # joblib can only memory-map arrays of uncompressed dumps
+    mmap_mode = "r" if mmap_arrays and header["compression"] is None else None
+    return joblib.load(file_path, mmap_mode=mmap_mode)
+
+
+def _native_params(obj):
+    """obj.get_params() restricted to JSON-safe values, so load can restore them with set_params."""
+    params = {}
+    for key, value in obj.get_params().items():
+        value = value.item() if hasattr(value, "item") else value
+        try:
+            json.dumps(value)
+            params[key] = value
+        except (TypeError, ValueError):
+            logger.warning(f"Parameter {key}={value!r} is not JSON-serializable and is not saved with the model")
+    return params
+
+
+def _save_native(tmp_path, obj, header):
+    library = native_format(obj)
+    if library is None:
+        raise ValueError(f"{type(obj).__name__} has no native format")
+    if header["compression"] is not None:
+        raise ValueError("The native backend does not support compression")
+    # XGBoost picks the format (UBJSON) from the extension, so write under it, then wrap the
+    # model bytes in the container so that model and header are replaced together
+    native_tmp_path = tmp_path + NATIVE_FORMATS[library]
+    try:
+        if library == "xgboost":
+            obj.save_model(native_tmp_path)
+        else:
+            obj.save_model(native_tmp_path, format="cbm")
+        with open(native_tmp_path, "rb") as f:
+            model_bytes = f.read()
+    finally:
+        if os.path.exists(native_tmp_path):
+            os.remove(native_tmp_path)
+    header = {**header, "native_format": library, "library_version": importlib.import_module(library).__version__,
+              "params": _native_params(obj)}
+    return _write_container(tmp_path, header, [model_bytes])
+
+
+def _load_native(file_path, verify):
+    header, (model_bytes,) = _read_container(file_path, mmap_arrays=False, verify=verify)
+    module, _, name = header["object_type"].rpartition(".")
+    model = getattr(importlib.import_module(module), name)()
+    # The native formats keep the booster, not the estimator's constructor arguments
+    model.set_params(**header.get("params", {}))
+    # Loading from memory also keeps XGBoost from guessing the format from the file extension
+    if header["native_format"] == "xgboost":
+        model.load_model(bytearray(model_bytes))
+    else:
+        model.load_model(blob=bytes(model_bytes))
+    return model
+
+
+def save_artifact(file_path, obj, backend=None, compression=None, metadata=None):
+    """
+    Save obj atomically with a checksum and a metadata header; returns the header.
+
+    backend="pickle5" writes one file: a JSON header followed by the protocol-5 pickle stream
+    and its out-of-band buffers (the data of numpy arrays), aligned so they can be
+    memory-mapped on load. backend="joblib" writes a joblib dump with the header in a
+    <file_path>.meta.json sidecar. compression ("zstd" or "lz4") trades memory-mapping for size.
+    backend="native" (the default for XGBoost and CatBoost models) stores the library's own
+    format (XGBoost UBJSON, CatBoost .cbm) in the same single-file container as pickle5, which
+    loads faster and across library versions.
+    """
+    backend = backend or ("native" if native_format(obj) else DEFAULT_BACKEND)
+    compression = compression if compression is not None else DEFAULT_COMPRESSION
+    try:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        header = _base_header(obj, backend, compression, metadata)
+        if backend == "joblib":
+            header = _save_joblib(tmp_path, obj, header)
+            with open(f"{_sidecar_path(file_path)}.tmp", "w") as f:
+                f.write(_to_json(header, indent=2))
+            # The dump and its sidecar cannot be swapped in together. The sidecar goes first: a
+            # reader in between sees the new checksum with the old dump and refuses it, and
+            # never finds a dump without any header
+            os.replace(f"{_sidecar_path(file_path)}.tmp", _sidecar_path(file_path))
+            os.replace(tmp_path, file_path)
+        else:
+            save = _save_pickle5 if backend == "pickle5" else _save_native
+            header = save(tmp_path, obj, header)
+            os.replace(tmp_path, file_path)
+            if os.path.exists(_sidecar_path(file_path)):
+                os.remove(_sidecar_path(file_path))
+        logger.info(f"Artifact ({backend}, compression={compression}) saved at {file_path}")
+        return header
+    except Exception as e:
+        for leftover in (f"{file_path}.tmp", f"{_sidecar_path(file_path)}.tmp"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise CustomException(f"Error saving artifact to {file_path}: {e}", sys)
+
+
+def read_artifact_header(file_path):
+    """The metadata header of an artifact, or None for a legacy plain pickle."""
+    with open(file_path, "rb") as f:
+        header = _read_header(f)
+    if header is None and os.path.exists(_sidecar_path(file_path)):
+        with open(_sidecar_path(file_path)) as f:
+            header = json.load(f)
+    return header
+
+
+def load_artifact(file_path, mmap_arrays=True, verify=True):
+    """
+    Load an artifact written by save_artifact, checking its checksum when verify=True.
+    With mmap_arrays=True the numpy arrays of uncompressed artifacts are memory-mapped
+    (read-only) instead of copied. Files without a header are read as legacy plain pickles
+    if they start like one.
+    """
+    try:
+        header = read_artifact_header(file_path)
+        if header is None:
+            with open(file_path, "rb") as f:
+                # Legacy pickles (protocol 2+) start with the PROTO opcode; anything else without a
+                # header (e.g. raw model bytes) needs the sidecar that should have described it
+                if f.read(2) not in PICKLE_PROTOCOL_PREFIXES:
+                    raise ValueError(f"{file_path} has no artifact header, its sidecar {_sidecar_path(file_path)} "
+                                     f"is missing, and it is not a plain pickle")
+                f.seek(0)
+                return pickle.load(f)
+        if header["backend"] == "pickle5":
+            return _load_pickle5(file_path, mmap_arrays, verify)
+        if header["backend"] == "native":
+            return _load_native(file_path, verify)
+        return _load_joblib(file_path, header, mmap_arrays, verify)
+    except Exception as e:
+        raise CustomException(f"Error loading artifact from {file_path}: {e}", sys)
+
+
+def benchmark_backends(obj, repeats=5):
+    """Save/load time and file size of obj for plain pickle and every available backend/compression."""
+    available = []
+    for compression in COMPRESSIONS:
+        try:
+            _compressor(compression)
+            available.append(compression)
+        except ImportError as e:
+            logger.info(f"Skipping compression={compression}: {e}")
+    backends = [backend for backend in BACKENDS if backend != "native" or native_format(obj)]
+    variants = [("pickle", None)] + [(backend, compression) for backend in backends for compression in available
+                                     if not (backend == "joblib" and compression == "zstd")
+                                     and not (backend == "native" and compression is not None)]
+    report = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend, compression in variants:
+            file_path = os.path.join(tmp_dir, f"{backend}_{compression}.bin")
+            start = time.perf_counter()
+            if backend == "pickle":
+                with open(file_path, "wb") as f:
+                    pickle.dump(obj, f)
+            else:
+                save_artifact(file_path, obj, backend=backend, compression=compression)
+            save_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(repeats):
+                load_artifact(file_path)
+            report.append({"backend": backend, "compression": compression, "size_mb": os.path.getsize(file_path) / 1e6,
+                           "save_seconds": save_seconds, "load_seconds": (time.perf_counter() - start) / repeats})
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect an artifact or benchmark the serialization backends.")
+    parser.add_argument("path", help="Artifact file (legacy pickles are accepted).")
+    parser.add_argument("--benchmark", action="store_true", help="Time save/load of the object with every backend.")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        import pandas as pd
+
+        print(pd.DataFrame(benchmark_backends(load_artifact(args.path))))
+    else:
+        print(json.dumps(read_artifact_header(args.path), indent=2))
@@ -1,6 +1,7 @@
-import pickle
 import os
+import sys
 from src.log_config.logger import logger
+from src.utils.artifact_store import save_artifact
 
 
 class CustomException(Exception):
@@ -14,12 +15,10 @@ class CustomException(Exception):
         return self.error_message
 
 
-def save_object(file_path, obj):
-    """Save a Python object to a file using pickle."""
+def save_object(file_path, obj, metadata=None):
+    """Save a Python object to a file through the artifact store (atomic, checksummed)."""
     try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as f:
-            pickle.dump(obj, f)
+        save_artifact(file_path, obj, metadata=metadata)
         logger.info(f"Object saved successfully at {file_path}")
     except Exception as e:
         logger.error(f"Error occurred while saving object: {e}")
@@ -1,20 +1,17 @@
-import pickle
-import os
-from src.exception import CustomException
 import sys
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import save_artifact, load_artifact
 
-def save_object(file_path, obj):
+def save_object(file_path, obj, metadata=None):
     """Function to save a Python object to a file."""
     try:
-        with open(file_path, 'wb') as file:
-            pickle.dump(obj, file)
+        save_artifact(file_path, obj, metadata=metadata)
     except Exception as e:
         raise CustomException(e, sys)
 
 def load_object(file_path):
     """Function to load a Python object from a file."""
     try:
-        with open(file_path, 'rb') as file:
-            return pickle.load(file)
+        return load_artifact(file_path)
     except Exception as e:
         raise CustomException(e, sys)
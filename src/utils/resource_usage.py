@@ -0,0 +1,74 @@
+import os
+import sys
+import threading
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where the platform does not report it)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb():
+    """Current resident set size of this process in MB, falling back to the peak where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+
+def reset_peak_rss():
+    """
+    Resets the kernel's peak RSS counter (ru_maxrss, VmHWM) to the current RSS via
+    /proc/self/clear_refs (Linux 4.0+). Returns False where that is not possible.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class PeakRSSMonitor:
+    """
+    Measures the peak RSS (MB) reached inside a with block, as peak_mb. On Linux the kernel's
+    peak counter is reset on entry, so the peak is exact and excludes earlier allocations;
+    elsewhere RSS is sampled every interval seconds on a background thread, which can miss
+    spikes shorter than the interval.
+    """
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak_mb = None
+        self._reset = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb() or 0.0)
+
+    def __enter__(self):
+        self._reset = reset_peak_rss()
+        self.peak_mb = current_rss_mb() or 0.0
+        if not self._reset:
+            self._thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        self.peak_mb = max(self.peak_mb, (peak_rss_mb() if self._reset else current_rss_mb()) or 0.0)
+        return False
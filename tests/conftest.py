@@ -0,0 +1,57 @@
+import os
+import sys
+import pytest
+
+# Make the src package importable when pytest is run from the project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """Modules write to relative paths (artifacts/, catboost_info/), so keep them out of the tree."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def student_data():
+    """Cleaned synthetic student data with the typed schema."""
+    from src.benchmarks.synthetic_data import generate_students
+    from src.data_ingestion.data_ingestion import clean_data
+
+    return clean_data(generate_students(2000, seed=0)).reset_index(drop=True)
+
+
+@pytest.fixture
+def scoring_data(student_data):
+    """Features without the target, with a missing numeric value, a missing category and an unseen category."""
+    import numpy as np
+
+    data = student_data.drop(columns=["math_score"]).copy()
+    data.loc[0, "reading_score"] = np.nan
+    data.loc[1, "gender"] = np.nan
+    data["race_ethnicity"] = data["race_ethnicity"].cat.add_categories(["group Z"])
+    data.loc[2, "race_ethnicity"] = "group Z"
+    return data
+
+
+@pytest.fixture
+def fitted_preprocessor(student_data):
+    """The repo's preprocessor fitted on student_data."""
+    from src.data_transformation.data_transformation import DataTransformation
+
+    preprocessor = DataTransformation().get_data_transformer_object()
+    preprocessor.fit(student_data.drop(columns=["math_score"]))
+    return preprocessor
+
+
+@pytest.fixture
+def linear_artifacts(tmp_path, student_data, fitted_preprocessor):
+    """(model_path, preprocessor_path) of a Ridge fitted with the repo's preprocessor."""
+    from sklearn.linear_model import Ridge
+    from src.utils.common_utils import save_object
+
+    X = fitted_preprocessor.transform(student_data.drop(columns=["math_score"]))
+    model_path, preprocessor_path = str(tmp_path / "model.pkl"), str(tmp_path / "preprocessor.pkl")
+    save_object(model_path, Ridge().fit(X, student_data["math_score"]))
+    save_object(preprocessor_path, fitted_preprocessor)
+    return model_path, preprocessor_path
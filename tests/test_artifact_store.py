@@ -0,0 +1,75 @@
+import os
+import pickle
+import numpy as np
+import pytest
+from catboost import CatBoostRegressor
+from sklearn.linear_model import Ridge
+from xgboost import XGBRegressor
+from src.exceptions.exceptions import CustomException
+from src.utils.artifact_store import MAGIC, load_artifact, read_artifact_header, save_artifact
+
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 5))
+    return X, X @ rng.normal(size=5) + rng.normal(scale=0.1, size=300)
+
+
+@pytest.mark.parametrize("model", [
+    XGBRegressor(n_estimators=25, max_depth=3, learning_rate=0.2, subsample=0.9, random_state=1),
+    CatBoostRegressor(iterations=25, depth=4, learning_rate=0.2, random_seed=1, verbose=False),
+], ids=["xgboost", "catboost"])
+def test_native_round_trip_keeps_predictions_and_params(tmp_path, regression_data, model):
+    X, y = regression_data
+    model.fit(X, y)
+    path = str(tmp_path / "model.pkl")
+    save_artifact(path, model)
+
+    loaded = load_artifact(path)
+
+    assert read_artifact_header(path)["backend"] == "native"
+    assert type(loaded) is type(model)
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X), rtol=1e-6)
+    # load_model may fill in defaults left as None (e.g. XGBoost's base_score), but must keep every set param
+    loaded_params = loaded.get_params()
+    for key, value in model.get_params().items():
+        if value is not None:
+            assert loaded_params[key] == value or value != value, key  # value != value: NaN
+
+
+def test_native_artifact_is_one_self_describing_file(tmp_path, regression_data):
+    X, y = regression_data
+    path = str(tmp_path / "model.pkl")
+    save_artifact(path, XGBRegressor(n_estimators=5).fit(X, y))
+
+    assert sorted(os.listdir(tmp_path)) == ["model.pkl"]
+    with open(path, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+
+
+def test_joblib_dump_with_a_stale_sidecar_is_refused(tmp_path, regression_data):
+    X, y = regression_data
+    path = str(tmp_path / "model.pkl")
+    save_artifact(path, Ridge().fit(X, y), backend="joblib")
+    stale_sidecar = (tmp_path / "model.pkl.meta.json").read_text()
+    save_artifact(path, Ridge(alpha=10.0).fit(X[:100], y[:100]), backend="joblib")
+
+    # What a reader sees mid-save: the new dump next to the previous save's sidecar, or vice versa
+    (tmp_path / "model.pkl.meta.json").write_text(stale_sidecar)
+    with pytest.raises(CustomException, match="does not match"):
+        load_artifact(path)
+
+
+def test_headerless_files_load_only_if_they_are_pickles(tmp_path, regression_data):
+    X, y = regression_data
+    legacy_path, orphan_path = str(tmp_path / "legacy.pkl"), str(tmp_path / "orphan.pkl")
+    with open(legacy_path, "wb") as f:
+        pickle.dump(Ridge().fit(X, y), f)
+    # Raw native model bytes, as the native backend wrote them next to a sidecar before the container
+    XGBRegressor(n_estimators=5).fit(X, y).save_model(f"{orphan_path}.ubj")
+    os.replace(f"{orphan_path}.ubj", orphan_path)
+
+    assert hasattr(load_artifact(legacy_path), "coef_")
+    with pytest.raises(CustomException, match="orphan.pkl.meta.json is missing"):
+        load_artifact(orphan_path)
@@ -0,0 +1,56 @@
+import json
+import pytest
+from src.exceptions.exceptions import CustomException
+from src.model import batch_predict
+from src.model.batch_predict import score_file
+
+CHUNKSIZE = 150
+
+
+@pytest.fixture
+def input_csv(tmp_path, student_data):
+    data = student_data.copy()
+    # A quoted field spanning two physical lines must still count as one record
+    data["parental_level_of_education"] = data["parental_level_of_education"].cat.add_categories(["some\ncollege"])
+    data.loc[3, "parental_level_of_education"] = "some\ncollege"
+    path = tmp_path / "input.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+def test_resume_after_interruption_matches_uninterrupted_run(tmp_path, input_csv, linear_artifacts, monkeypatch):
+    model_path, preprocessor_path = linear_artifacts
+    reference_path, output_path = str(tmp_path / "reference.csv"), str(tmp_path / "output.csv")
+    reference = score_file(input_csv, reference_path, model_path, preprocessor_path,
+                           chunksize=CHUNKSIZE, n_workers=1, resume=False)
+    n_chunks = -(-reference["rows"] // CHUNKSIZE)
+
+    real_score_chunk = batch_predict._score_chunk
+    calls = []
+
+    def interrupted_score_chunk(chunk):
+        if len(calls) == 3:
+            raise KeyboardInterrupt("simulated crash")
+        calls.append(len(chunk))
+        return real_score_chunk(chunk)
+
+    monkeypatch.setattr(batch_predict, "_score_chunk", interrupted_score_chunk)
+    with pytest.raises((CustomException, KeyboardInterrupt)):
+        score_file(input_csv, output_path, model_path, preprocessor_path, chunksize=CHUNKSIZE, n_workers=1)
+    with open(f"{output_path}.checkpoint.json") as f:
+        checkpoint = json.load(f)
+    assert checkpoint["chunks_done"] == 3 and checkpoint["rows_done"] == 3 * CHUNKSIZE
+
+    # A write cut off by the crash must be discarded on resume
+    with open(output_path, "ab") as f:
+        f.write(b"12.3\n45")
+
+    calls.clear()
+    monkeypatch.setattr(batch_predict, "_score_chunk", lambda chunk: calls.append(len(chunk)) or real_score_chunk(chunk))
+    resumed = score_file(input_csv, output_path, model_path, preprocessor_path, chunksize=CHUNKSIZE, n_workers=1)
+
+    assert len(calls) == n_chunks - 3
+    assert resumed["resumed_from"] == 3 * CHUNKSIZE
+    assert resumed["total_rows"] == reference["rows"]
+    with open(reference_path, "rb") as expected, open(output_path, "rb") as actual:
+        assert actual.read() == expected.read()
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import pytest
+from src.api.batching import MicroBatcher
+
+
+def test_batches_records_and_returns_each_prediction():
+    async def scenario():
+        batcher = MicroBatcher(lambda records: [record["x"] * 2 for record in records], max_wait_ms=20)
+        await batcher.start()
+        results = await asyncio.gather(*(batcher.submit({"x": x}) for x in range(10)))
+        await batcher.stop()
+        return results, batcher.metrics.summary()
+
+    results, summary = asyncio.run(scenario())
+    assert results == [x * 2 for x in range(10)]
+    assert summary["records"] == 10 and summary["batches"] < 10
+
+
+def test_stop_fails_in_flight_and_queued_requests():
+    release = threading.Event()
+
+    def slow_predict(records):
+        release.wait(5)
+        return [0.0] * len(records)
+
+    async def scenario():
+        batcher = MicroBatcher(slow_predict, max_batch_size=2, max_wait_ms=1)
+        await batcher.start()
+        tasks = [asyncio.create_task(batcher.submit({"x": x})) for x in range(5)]
+        await asyncio.sleep(0.1)  # The worker is now blocked scoring the first batch
+        await asyncio.wait_for(batcher.stop(), 1)
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+        with pytest.raises(RuntimeError):
+            await batcher.submit({"x": 0})
+        return results
+
+    results = asyncio.run(scenario())
+    assert len(results) == 5
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_transformation.compiled_preprocessor import DICT_LOOKUP_MAX_ROWS, compile_preprocessor
+
+
+def _assert_identical(actual, expected):
+    assert actual.dtype == expected.dtype
+    # equal_nan is not needed: both paths impute every NaN
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("n_rows", [1, DICT_LOOKUP_MAX_ROWS, DICT_LOOKUP_MAX_ROWS + 1, 2000])
+@pytest.mark.parametrize("categorical", [True, False], ids=["categorical", "object"])
+def test_compiled_transform_is_bit_identical(fitted_preprocessor, scoring_data, n_rows, categorical):
+    data = scoring_data.iloc[:n_rows]
+    if not categorical:
+        data = data.astype({col: object for col in data.select_dtypes("category").columns})
+    compiled = compile_preprocessor(fitted_preprocessor)
+
+    _assert_identical(compiled.transform(data), fitted_preprocessor.transform(data))
+
+
+def test_compiled_transform_of_records_is_bit_identical(fitted_preprocessor, scoring_data):
+    # Plain Python values, as records arrive from JSON; sklearn sees them as a float64/object DataFrame
+    records = [{key: value.item() if hasattr(value, "item") else value for key, value in record.items()}
+               for record in scoring_data.iloc[:5].astype(object).to_dict("records")]
+    compiled = compile_preprocessor(fitted_preprocessor)
+    expected = fitted_preprocessor.transform(pd.DataFrame(records))
+
+    _assert_identical(compiled.transform(records), expected)
+    _assert_identical(compiled.transform(records[3]), expected[3:4])
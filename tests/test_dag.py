@@ -0,0 +1,69 @@
+import os
+import threading
+import pytest
+from src.pipeline.dag import Pipeline, Stage
+
+
+def _write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _make_pipeline(calls):
+    def produce():
+        calls.append(("produce", threading.current_thread().name))
+        _write("a.txt", "a")
+
+    def consume():
+        calls.append(("consume", threading.current_thread().name))
+        with open("a.txt") as f:
+            _write("b.txt", f.read() + "b")
+
+    return Pipeline([Stage("consume", consume, inputs=["a.txt"], outputs=["b.txt"]),
+                     Stage("produce", produce, outputs=["a.txt"])], cache_dir=".cache")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_orders_stages_and_skips_cached(max_workers):
+    calls = []
+    pipeline = _make_pipeline(calls)
+
+    stages = pipeline.run(max_workers=max_workers)
+
+    assert [name for name, _ in calls] == ["produce", "consume"]
+    assert [stage["status"] for stage in stages] == ["ran", "ran"]
+    assert pipeline.run(max_workers=max_workers)[1]["status"] == "skipped"
+    main_thread = threading.current_thread().name
+    assert all((thread == main_thread) == (max_workers == 1) for _, thread in calls)
+
+
+def test_editing_a_code_dependency_reruns_the_stage(tmp_path):
+    helper = tmp_path / "helper.py"
+    helper.write_text("VERSION = 1\n")
+    calls = []
+    stage = Stage("build", lambda: calls.append(1) or _write("out.txt", "x"), outputs=["out.txt"],
+                  code=[str(helper)])
+    pipeline = Pipeline([stage], cache_dir=".cache")
+
+    assert pipeline.run()[0]["status"] == "ran"
+    assert pipeline.run()[0]["status"] == "skipped"
+    helper.write_text("VERSION = 2  # edited\n")
+    assert pipeline.run()[0]["status"] == "ran"
+    assert len(calls) == 2
+
+
+def test_stages_that_read_or_write_typed_data_hash_the_schema():
+    from src.pipeline.stages import build_stages, _src
+
+    stages = {stage.name: stage for stage in build_stages()}
+    for name in ("ingest", "split", "transform"):
+        assert _src("data_ingestion", "schema.py") in stages[name].code, name
+
+
+def test_stages_that_write_or_read_models_hash_the_artifact_format():
+    from src.pipeline.stages import ARTIFACT_IO_CODE, build_stages
+
+    stages = {stage.name: stage for stage in build_stages()}
+    for name in ("transform", "evaluate", "tune", "feature_importance", "compare", "register"):
+        assert set(ARTIFACT_IO_CODE) <= set(stages[name].code), name
+    assert all(os.path.exists(path) for stage in stages.values() for path in stage.code)
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from src.model.fused_linear import check_parity, export_fused_model, load_fused_model
+from src.model.predict import make_predictions
+
+
+def test_fused_ridge_matches_make_predictions(tmp_path, linear_artifacts, scoring_data):
+    model_path, preprocessor_path = linear_artifacts
+    fused_path = str(tmp_path / "fused.json")
+    export_fused_model(model_path, preprocessor_path, fused_path)
+
+    max_abs_diff = check_parity(scoring_data, fused_path, model_path, preprocessor_path)
+
+    expected = make_predictions(scoring_data, model_path, preprocessor_path)
+    scorer = load_fused_model(fused_path)
+    # float32 features round the preprocessor's output, so parity is to float32 precision
+    np.testing.assert_allclose(scorer.predict(scoring_data), expected, rtol=10 * np.finfo(np.float32).eps)
+    np.testing.assert_allclose(scorer.predict(scoring_data.iloc[:5]), expected[:5], rtol=10 * np.finfo(np.float32).eps)
+    record = scoring_data.iloc[3].to_dict()
+    assert scorer.predict(record)[0] == pytest.approx(expected[3], rel=10 * np.finfo(np.float32).eps)
+    assert max_abs_diff < 1e-3
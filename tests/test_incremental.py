@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+from src.benchmarks.synthetic_data import generate_students
+from src.data_ingestion.incremental import incremental_clean
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    path = tmp_path / "students.csv"
+    generate_students(300, seed=0).iloc[:200].to_csv(path, index=False)
+    return path
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def _rows_csv(seed, n_rows):
+    return generate_students(n_rows, seed=seed, missing_rate=0, duplicate_rate=0).to_csv(index=False, header=False)
+
+
+@pytest.mark.parametrize("tail", ["", "\n", "\n\n", "  \n\t\n"], ids=["touched", "newline", "blank-lines", "spaces"])
+def test_blank_append_is_a_no_op(tmp_path, raw_csv, tail):
+    output = str(tmp_path / "cleaned.csv")
+    assert incremental_clean(str(raw_csv), output) == "full"
+    cleaned = pd.read_csv(output)
+
+    _append(raw_csv, tail)
+    assert incremental_clean(str(raw_csv), output) == "skipped"
+    pd.testing.assert_frame_equal(pd.read_csv(output), cleaned)
+
+    # Rows appended after the blank tail are still picked up incrementally
+    _append(raw_csv, _rows_csv(seed=1, n_rows=5))
+    assert incremental_clean(str(raw_csv), output) == "appended"
+    assert len(pd.read_csv(output)) == len(cleaned) + 5
@@ -0,0 +1,40 @@
+import logging
+import pytest
+from src.log_config.instrumentation import instrumented, span, tracer
+from src.utils import resource_usage
+
+
+@pytest.fixture(autouse=True)
+def clear_tracer():
+    tracer.clear()
+    yield
+    tracer.clear()
+
+
+def test_span_records_timing_memory_and_rows(caplog):
+    with caplog.at_level(logging.INFO, logger="MLProjectLogger"):
+        with span("stage", category="pipeline_stage") as attrs:
+            attrs["rows"] = 10
+
+    (event,) = tracer.events
+    assert event["name"] == "stage" and event["rows"] == 10 and event["wall_seconds"] >= 0
+    assert event["rss_mb"] is not None
+    assert "pipeline_stage 'stage' finished" in caplog.text
+
+
+def test_hot_path_span_skips_rss_reads_and_info_log(caplog, monkeypatch):
+    def no_rss():
+        raise AssertionError("RSS read on the hot path")
+
+    monkeypatch.setattr(resource_usage, "current_rss_mb", no_rss)
+
+    @instrumented(category="predict", rows_arg="records", hot_path=True)
+    def score(records):
+        return [0.0] * len(records)
+
+    with caplog.at_level(logging.INFO, logger="MLProjectLogger"):
+        assert score([{}, {}]) == [0.0, 0.0]
+
+    (event,) = tracer.events
+    assert event["name"].endswith("score") and event["rows"] == 2 and event["rss_mb"] is None
+    assert "finished" not in caplog.text
@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from src.model.model_evaluation import fit_and_evaluate_model, get_regression_models
+
+
+@pytest.mark.parametrize("model_name", list(get_regression_models()))
+def test_every_candidate_fits_sparse_features(model_name):
+    rng = np.random.default_rng(0)
+    X = sparse.random(200, 12, density=0.3, format="csr", random_state=0, dtype=np.float32)
+    y = np.asarray(X.sum(axis=1)).ravel() + rng.normal(scale=0.01, size=200)
+
+    _, _, (mae, rmse, r2) = fit_and_evaluate_model(model_name, get_regression_models(n_threads=1)[model_name],
+                                                   X[:150], y[:150], X[150:], y[150:])
+
+    assert np.isfinite([mae, rmse, r2]).all()
@@ -0,0 +1,23 @@
+import numpy as np
+from xgboost import XGBRegressor
+from src.model.model_registry import ModelRegistry
+from src.utils.artifact_store import save_artifact
+
+
+def test_register_native_model_records_params(tmp_path, linear_artifacts):
+    _, preprocessor_path = linear_artifacts
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    model = XGBRegressor(n_estimators=20, max_depth=3, learning_rate=0.3).fit(X, X.sum(axis=1))
+    model_path = str(tmp_path / "xgb.pkl")
+    save_artifact(model_path, model)
+    registry = ModelRegistry(str(tmp_path / "registry"))
+
+    version = registry.register("xgb", model_path, preprocessor_path, metrics={"r2": 0.9})
+
+    metadata = registry.metadata("xgb")
+    assert version == "v0001" and registry.current_version("xgb") == version
+    assert metadata["artifact"]["backend"] == "native"
+    assert {key: metadata["params"][key] for key in ("n_estimators", "max_depth", "learning_rate")} == \
+        {"n_estimators": 20, "max_depth": 3, "learning_rate": 0.3}
+    assert registry.register("xgb", model_path, preprocessor_path) == version
@@ -0,0 +1,16 @@
+import pytest
+from src.model.model_selection import _halving_schedule, halving_rungs
+
+
+@pytest.mark.parametrize("n_candidates, factor, expected", [
+    (1, 3, 1), (2, 3, 2), (3, 3, 2), (4, 3, 3), (9, 3, 3), (27, 3, 4), (28, 3, 5),
+    (125, 5, 4), (126, 5, 5), (1000, 10, 4),
+])
+def test_halving_rungs_at_exact_powers_of_factor(n_candidates, factor, expected):
+    assert halving_rungs(n_candidates, factor) == expected
+
+
+def test_halving_schedule_grows_by_factor_and_ends_at_full_set():
+    assert _halving_schedule(900, 9, 3, 50) == [100, 300, 900]
+    assert _halving_schedule(900, 9, 3, 200) == [200, 300, 900]
+    assert _halving_schedule(900, 1, 3, 50) == [900]
@@ -0,0 +1,30 @@
+import time
+import numpy as np
+import pytest
+from src.utils import resource_usage
+from src.utils.resource_usage import PeakRSSMonitor, current_rss_mb
+
+pytestmark = pytest.mark.skipif(resource_usage.resource is None, reason="RSS is not reported on this platform")
+
+
+def _touch(megabytes):
+    array = np.ones(megabytes * 1024 * 1024 // 8)
+    time.sleep(0.05)  # Long enough for the sampling fallback to see it
+    return array
+
+
+@pytest.mark.parametrize("kernel_reset", [True, False], ids=["clear_refs", "sampling"])
+def test_peak_excludes_allocations_before_the_block(monkeypatch, kernel_reset):
+    if kernel_reset and not resource_usage.reset_peak_rss():
+        pytest.skip("/proc/self/clear_refs is not available")
+    if not kernel_reset:
+        monkeypatch.setattr(resource_usage, "reset_peak_rss", lambda: False)
+    setup = _touch(300)
+    del setup
+    baseline = current_rss_mb()
+
+    with PeakRSSMonitor() as monitor:
+        array = _touch(100)
+        del array
+
+    assert 80 < monitor.peak_mb - baseline < 250
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import Ridge
+from src.exceptions.exceptions import CustomException
+from src.hyperparameter_tuning.search import run_search
+
+PARAM_SPACE = {"alpha": [0.01, 0.1, 1.0, 10.0, 100.0]}
+
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 4))
+    return X, X @ np.array([1.0, -2.0, 0.5, 0.0]) + rng.normal(scale=0.1, size=600)
+
+
+@pytest.mark.parametrize("strategy", ["grid", "random", "halving"])
+def test_search_finds_a_fitted_best_estimator(regression_data, strategy):
+    X, y = regression_data
+    result = run_search(Ridge(), PARAM_SPACE, X, y, strategy=strategy, n_iter=3, cv=3, n_jobs=1)
+
+    assert result.best_params["alpha"] in PARAM_SPACE["alpha"]
+    assert result.best_score > 0.9
+    assert hasattr(result.best_estimator, "coef_")
+
+
+@pytest.mark.parametrize("strategy", ["grid", "halving"])
+def test_exhausted_time_budget_raises_no_trial_completed(regression_data, strategy):
+    X, y = regression_data
+    with pytest.raises(CustomException, match="No trial completed"):
+        run_search(Ridge(), PARAM_SPACE, X, y, strategy=strategy, cv=3, n_jobs=1, time_budget=1e-9)
+
+
+def test_halving_rung_count_at_exact_power_of_factor(regression_data):
+    X, y = regression_data
+    alphas = [float(alpha) for alpha in range(1, 126)]
+    result = run_search(Ridge(), {"alpha": alphas}, X, y, strategy="halving", cv=2, factor=5, n_jobs=1)
+
+    # 125 candidates -> 25 -> 5 -> 1 is four rungs; float log(125, 5) rounds up to five
+    assert sorted({trial["rung"] for trial in result.trials}) == [0, 1, 2, 3]
+    assert [trial["n_samples"] for trial in result.trials if trial["rung"] == 3] == [len(y)]